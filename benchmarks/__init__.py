@@ -0,0 +1 @@
+"""Performance benchmarks for the HTTP and gRPC hot paths"""
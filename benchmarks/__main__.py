@@ -0,0 +1,141 @@
+"""
+Benchmark the auth, settings and gRPC hot paths.
+
+By default everything runs in process against in-memory stand-ins for
+Postgres and Redis. Pass --http-url and --grpc-target to benchmark a
+running instance instead (for example the docker-compose stack started
+with a high RATE_LIMIT_REQUESTS_PER_MINUTE).
+
+    python -m benchmarks --output benchmarks/results/current.json \\
+        --baseline benchmarks/results/main.json
+
+Exits with status 1 if any scenario fails calls or regresses against the
+baseline by more than --tolerance.
+"""
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+from uuid import UUID
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--only", choices=["http", "grpc"], help="Run one suite")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument(
+        "--login-requests",
+        type=int,
+        default=50,
+        help="Requests for /auth/login, which is dominated by bcrypt",
+    )
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--http-url", help="Benchmark a running HTTP server")
+    parser.add_argument("--grpc-target", help="Benchmark a running gRPC server")
+    parser.add_argument(
+        "--output", type=Path, default=Path("benchmarks/results/latest.json")
+    )
+    parser.add_argument("--baseline", type=Path, help="Results to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative p99 increase or throughput drop",
+    )
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace) -> int:
+    # Imported late so the environment above applies to settings
+    import grpc
+
+    from benchmarks import harness, standins
+    from benchmarks.grpc_scenarios import grpc_scenarios, start_inprocess_server
+    from benchmarks.http_scenarios import (
+        build_inprocess_client,
+        build_live_client,
+        create_users,
+        http_scenarios,
+    )
+    from src.config.security import password_hasher
+    from src.grpc.proto.server import user_pb2_grpc
+
+    live = bool(args.http_url)
+    store = standins.InMemoryStore()
+    client = (
+        build_live_client(args.http_url) if live else build_inprocess_client(store)
+    )
+    results = []
+    server = channel = None
+
+    try:
+        users = await create_users(client, args.concurrency)
+        for user in users:
+            standins.seed_user_settings(store, UUID(user["id"]))
+
+        suites = []
+        if args.only in (None, "http"):
+            suites.append(http_scenarios(client, users))
+
+        if args.only in (None, "grpc"):
+            if args.grpc_target:
+                target = args.grpc_target
+            else:
+                server, target = await start_inprocess_server(store)
+            channel = grpc.aio.insecure_channel(target)
+            stub = user_pb2_grpc.UserPreferenceServiceStub(channel)
+            suites.append(grpc_scenarios(stub, [user["id"] for user in users]))
+
+        for scenarios in suites:
+            for name, scenario in scenarios.items():
+                requests = (
+                    args.login_requests if name == "http.auth.login" else args.requests
+                )
+                result = await harness.run_scenario(
+                    name, scenario, requests, args.concurrency, args.warmup
+                )
+                results.append(result)
+                print(
+                    f"{name:40} {result.throughput:>10.1f}/s "
+                    f"p50 {result.p50_ms:>8.2f}ms p99 {result.p99_ms:>8.2f}ms "
+                    f"errors {result.errors}"
+                )
+    finally:
+        await client.aclose()
+        if channel is not None:
+            await channel.close()
+        if server is not None:
+            await server.stop(None)
+        password_hasher.shutdown()
+
+    harness.save_results(
+        args.output,
+        results,
+        {
+            "mode": "live" if live else "in-process",
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+        },
+    )
+    print(f"Results written to {args.output}")
+
+    baseline = harness.load_results(args.baseline) if args.baseline else {}
+    regressions = harness.find_regressions(baseline, results, args.tolerance)
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def main() -> None:
+    args = parse_args()
+    if not args.http_url:
+        # The in-process app must not rate limit its own benchmark traffic
+        os.environ.setdefault("RATE_LIMIT_REQUESTS_PER_MINUTE", "100000000")
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
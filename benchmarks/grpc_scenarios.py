@@ -0,0 +1,118 @@
+from typing import Any, Dict, List, Tuple
+
+import grpc
+
+from benchmarks.harness import Scenario
+from benchmarks.standins import InMemoryStore
+from src.grpc.proto.server import user_pb2, user_pb2_grpc
+
+BATCH_SIZE = 100
+
+
+async def start_inprocess_server(store: InMemoryStore) -> Tuple[grpc.aio.Server, str]:
+    """Serve UserPreferenceService in process on a free port, backed by stand-ins"""
+    from benchmarks import standins
+    from src.config.metrics import MetricsInterceptor
+    from src.grpc import user_pref_server
+
+    user_pref_server.sessionmanager = standins.InMemorySessionManager()
+    user_pref_server.PreferenceRepository = (
+        lambda session: standins.InMemoryPreferenceRepository(store, session)
+    )
+
+    server = grpc.aio.server(interceptors=[MetricsInterceptor()])
+    user_pb2_grpc.add_UserPreferenceServiceServicer_to_server(
+        user_pref_server.UserPreferenceServiceServicer(), server
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    return server, f"127.0.0.1:{port}"
+
+
+def grpc_scenarios(
+    stub: user_pb2_grpc.UserPreferenceServiceStub, user_ids: List[str]
+) -> Dict[str, Scenario]:
+    """One scenario per UserPreferenceService method"""
+
+    def user(worker: int) -> str:
+        return user_ids[worker % len(user_ids)]
+
+    def batch(worker: int) -> List[str]:
+        # Known ids padded with repeats to a realistic fan-out size
+        return [user_ids[(worker + i) % len(user_ids)] for i in range(BATCH_SIZE)]
+
+    def unary(method: str, build) -> Scenario:
+        call = getattr(stub, method)
+
+        async def scenario(worker: int) -> Any:
+            return await call(build(worker))
+
+        return scenario
+
+    async def export_audience(worker: int):
+        request = user_pb2.ExportAudienceRequest(
+            notification_filter=user_pb2.NotificationFilter(email_enabled=True)
+        )
+        async for _ in stub.ExportAudience(request):
+            pass
+
+    get_request = lambda w: user_pb2.GetPreferenceRequest(user_id=user(w))
+
+    return {
+        "grpc.GetPreference": unary("GetPreference", get_request),
+        "grpc.UpdatePreference": unary(
+            "UpdatePreference",
+            lambda w: user_pb2.UpdatePreferenceRequest(
+                user_id=user(w),
+                preference=user_pb2.Preference(theme="dark" if w % 2 else "light"),
+            ),
+        ),
+        "grpc.GetNotificationSetting": unary("GetNotificationSetting", get_request),
+        "grpc.UpdateNotificationSetting": unary(
+            "UpdateNotificationSetting",
+            lambda w: user_pb2.UpdateNotificationRequest(
+                user_id=user(w),
+                notification=user_pb2.NotificationSetting(email_enabled=bool(w % 2)),
+            ),
+        ),
+        "grpc.GetPrivacySetting": unary("GetPrivacySetting", get_request),
+        "grpc.UpdatePrivacySetting": unary(
+            "UpdatePrivacySetting",
+            lambda w: user_pb2.UpdatePrivacyRequest(
+                user_id=user(w),
+                privacy=user_pb2.PrivacySetting(show_email=bool(w % 2)),
+            ),
+        ),
+        "grpc.GetAllSettings": unary(
+            "GetAllSettings",
+            lambda w: user_pb2.GetAllSettingsRequest(user_id=user(w)),
+        ),
+        "grpc.BatchGetPreference": unary(
+            "BatchGetPreference", lambda w: user_pb2.BatchGetRequest(user_ids=batch(w))
+        ),
+        "grpc.BatchGetNotificationSetting": unary(
+            "BatchGetNotificationSetting",
+            lambda w: user_pb2.BatchGetRequest(user_ids=batch(w)),
+        ),
+        "grpc.BatchGetPrivacySetting": unary(
+            "BatchGetPrivacySetting",
+            lambda w: user_pb2.BatchGetRequest(user_ids=batch(w)),
+        ),
+        "grpc.ExportAudience": export_audience,
+        "grpc.CreateConsent": unary(
+            "CreateConsent",
+            lambda w: user_pb2.CreateConsentRequest(
+                user_id=user(w), consent_type="marketing", granted=True, version="1.0"
+            ),
+        ),
+        "grpc.GetConsentHistory": unary(
+            "GetConsentHistory",
+            lambda w: user_pb2.GetConsentHistoryRequest(user_id=user(w)),
+        ),
+        "grpc.GetLatestConsent": unary(
+            "GetLatestConsent",
+            lambda w: user_pb2.GetLatestConsentRequest(
+                user_id=user(w), consent_type="marketing"
+            ),
+        ),
+    }
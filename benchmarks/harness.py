@@ -0,0 +1,147 @@
+import asyncio
+import json
+import math
+import platform
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# A scenario makes one call; it receives the index of the worker running it
+Scenario = Callable[[int], Awaitable[Any]]
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    requests: int
+    errors: int
+    duration: float
+    throughput: float
+    mean_ms: float
+    p50_ms: float
+    p99_ms: float
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted samples"""
+    if not samples:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(samples)), 1)
+    return samples[rank - 1]
+
+
+async def run_scenario(
+    name: str,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    warmup: int = 0,
+) -> BenchmarkResult:
+    """
+    Run a scenario requests times from concurrency workers.
+
+    Warm-up calls run first and are not measured. Failed calls are counted
+    as errors and excluded from the latency percentiles.
+    """
+    for i in range(warmup):
+        await scenario(i % concurrency)
+
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker(index: int) -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                await scenario(index)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    duration = time.perf_counter() - start
+
+    latencies.sort()
+    return BenchmarkResult(
+        name=name,
+        requests=requests,
+        errors=errors,
+        duration=round(duration, 4),
+        throughput=round(len(latencies) / duration, 2) if duration else 0.0,
+        mean_ms=round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+        p50_ms=round(percentile(latencies, 50) * 1000, 3),
+        p99_ms=round(percentile(latencies, 99) * 1000, 3),
+    )
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(
+    path: Path, results: List[BenchmarkResult], metadata: Dict[str, Any]
+) -> None:
+    """Write results with enough context to compare runs across commits"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        **metadata,
+        "results": [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+def load_results(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Load a saved run keyed by scenario name"""
+    report = json.loads(path.read_text())
+    return {result["name"]: result for result in report["results"]}
+
+
+def find_regressions(
+    baseline: Dict[str, Dict[str, Any]],
+    results: List[BenchmarkResult],
+    tolerance: float,
+) -> List[str]:
+    """
+    Compare a run against a baseline.
+
+    A scenario regresses when it has errors, when its p99 latency grows by
+    more than tolerance, or when its throughput drops by more than tolerance.
+    Scenarios missing from the baseline are only checked for errors.
+    """
+    regressions = []
+    for result in results:
+        if result.errors:
+            regressions.append(f"{result.name}: {result.errors} failed calls")
+
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        if result.p99_ms > base["p99_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{result.name}: p99 {result.p99_ms}ms vs {base['p99_ms']}ms"
+            )
+        if result.throughput < base["throughput"] * (1 - tolerance):
+            regressions.append(
+                f"{result.name}: throughput {result.throughput}/s "
+                f"vs {base['throughput']}/s"
+            )
+    return regressions
@@ -0,0 +1,150 @@
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from benchmarks.harness import Scenario
+from benchmarks.standins import InMemoryStore
+
+BENCH_PASSWORD = "Bench-Passw0rd!"
+
+
+def build_inprocess_client(store: InMemoryStore) -> httpx.AsyncClient:
+    """Client calling the FastAPI app in process, backed by stand-ins"""
+    from functools import partial
+
+    from benchmarks import standins
+    from src.config import deps
+    from src.config.cache import redis_manager
+    from src.main import app
+    from src.routes.v1.auth import get_auth_service
+    from src.routes.v1.user_preference_settings import get_preference_service
+    from src.services.auth_service import AuthService
+    from src.services.preference_service import PreferenceService
+
+    standins.install_redis_standin()
+    app.dependency_overrides[get_auth_service] = lambda: AuthService(
+        standins.InMemoryAuthRepository(store), redis_manager
+    )
+    app.dependency_overrides[get_preference_service] = lambda: PreferenceService(
+        standins.InMemoryPreferenceRepository(store), redis_manager
+    )
+    deps.load_user_cache_data = partial(standins.load_user_cache_data, store)
+
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://benchmark"
+    )
+
+
+def build_live_client(base_url: str) -> httpx.AsyncClient:
+    """Client calling a running instance, e.g. the docker-compose stack"""
+    return httpx.AsyncClient(base_url=base_url, timeout=30)
+
+
+async def create_users(client: httpx.AsyncClient, count: int) -> List[Dict[str, Any]]:
+    """Register (if needed) and log in one benchmark user per worker"""
+    users = []
+    for i in range(count):
+        email = f"bench-user-{i}@example.com"
+        response = await client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": email,
+                "password": BENCH_PASSWORD,
+                "first_name": "Bench",
+                "last_name": f"User{i}",
+            },
+        )
+        if response.status_code not in (201, 409):
+            response.raise_for_status()
+
+        response = await client.post(
+            "/api/v1/auth/login", json={"email": email, "password": BENCH_PASSWORD}
+        )
+        response.raise_for_status()
+        data = response.json()["data"]
+        users.append(
+            {
+                "id": data["user"]["id"],
+                "email": email,
+                "access_token": data["tokens"]["access_token"],
+                "refresh_token": data["tokens"]["refresh_token"],
+            }
+        )
+    return users
+
+
+def http_scenarios(
+    client: httpx.AsyncClient, users: List[Dict[str, Any]]
+) -> Dict[str, Scenario]:
+    """One scenario per benchmarked HTTP endpoint"""
+
+    def auth(worker: int) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {users[worker]['access_token']}"}
+
+    async def checked(response: httpx.Response) -> Optional[Any]:
+        response.raise_for_status()
+        return response.json()
+
+    async def login(worker: int):
+        body = await checked(
+            await client.post(
+                "/api/v1/auth/login",
+                json={"email": users[worker]["email"], "password": BENCH_PASSWORD},
+            )
+        )
+        # Logging in replaces the stored refresh token
+        users[worker]["access_token"] = body["data"]["tokens"]["access_token"]
+        users[worker]["refresh_token"] = body["data"]["tokens"]["refresh_token"]
+
+    async def refresh(worker: int):
+        # Refresh tokens rotate, so each worker keeps its own user's token
+        body = await checked(
+            await client.post(
+                "/api/v1/auth/refresh",
+                json={"refresh_token": users[worker]["refresh_token"]},
+            )
+        )
+        users[worker]["refresh_token"] = body["data"]["refresh_token"]
+
+    async def get_all_settings(worker: int):
+        await checked(await client.get("/api/v1/settings", headers=auth(worker)))
+
+    def not_modified(path: str) -> Scenario:
+        async def scenario(worker: int):
+            # Revalidates with the ETag of the worker's first full response
+            etags = users[worker].setdefault("etags", {})
+            headers = auth(worker)
+            if path in etags:
+                headers["If-None-Match"] = etags[path]
+            response = await client.get(path, headers=headers)
+            if response.status_code != 304:
+                response.raise_for_status()
+            etags[path] = response.headers["ETag"]
+
+        return scenario
+
+    async def get_preferences(worker: int):
+        await checked(
+            await client.get("/api/v1/settings/preferences", headers=auth(worker))
+        )
+
+    async def put_preferences(worker: int):
+        await checked(
+            await client.put(
+                "/api/v1/settings/preferences",
+                json={"theme": "dark" if worker % 2 else "light"},
+                headers=auth(worker),
+            )
+        )
+
+    return {
+        "http.auth.login": login,
+        "http.auth.refresh": refresh,
+        "http.settings.get": get_all_settings,
+        "http.settings.get.not_modified": not_modified("/api/v1/settings"),
+        "http.settings.preferences.get": get_preferences,
+        "http.settings.preferences.not_modified": not_modified(
+            "/api/v1/settings/preferences"
+        ),
+        "http.settings.preferences.put": put_preferences,
+    }
@@ -0,0 +1,248 @@
+"""
+In-process stand-ins for Postgres and Redis.
+
+Repositories are replaced by in-memory versions and Redis by fakeredis, so
+benchmarks exercise routing, validation, JWT, bcrypt, caching and
+serialization without any external services.
+"""
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Type, TypeVar
+from uuid import UUID
+
+from fakeredis import aioredis as fakeredis
+
+from src.config.cache import redis_manager
+from src.config.security import hash_password_async, verify_password_async
+from src.models import (
+    UserConsent,
+    UserNotificationSetting,
+    UserPreference,
+    UserPrivacySetting,
+)
+from src.models.users import User
+from src.services.auth_service import build_user_cache_data
+from src.utils.exceptions import (
+    AlreadyExistsException,
+    InactiveUserException,
+    InvalidCredentialsException,
+)
+
+RowT = TypeVar("RowT")
+
+
+def _new_row(model: Type[RowT], **values: Any) -> RowT:
+    """Build a transient model instance with its column defaults applied"""
+    for column in model.__table__.columns:
+        if column.key in values or column.default is None:
+            continue
+        default = column.default
+        values[column.key] = default.arg(None) if default.is_callable else default.arg
+    return model(**values)
+
+
+class InMemoryStore:
+    """Rows shared by the in-memory repositories"""
+
+    def __init__(self) -> None:
+        self.users: Dict[UUID, User] = {}
+        self.settings: Dict[type, Dict[UUID, Any]] = {
+            UserPreference: {},
+            UserNotificationSetting: {},
+            UserPrivacySetting: {},
+        }
+        self.consents: Dict[UUID, List[UserConsent]] = {}
+
+
+class InMemoryAuthRepository:
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def create_user(
+        self,
+        email: str,
+        password: str,
+        first_name: str,
+        last_name: str,
+        phone: Optional[str] = None,
+        role: str = "user",
+    ) -> User:
+        if await self.get_user_by_email(email):
+            raise AlreadyExistsException(
+                message="Email already registered", resource="email"
+            )
+        user = _new_row(
+            User,
+            email=email,
+            password_hash=await hash_password_async(password),
+            first_name=first_name,
+            last_name=last_name,
+            phone=phone,
+            role=role,
+        )
+        self.store.users[user.id] = user
+        return user
+
+    async def get_user_by_email(self, email: str) -> Optional[User]:
+        return next((u for u in self.store.users.values() if u.email == email), None)
+
+    async def get_user_by_id(self, user_id: UUID) -> Optional[User]:
+        return self.store.users.get(user_id)
+
+    async def authenticate_user(self, email: str, password: str) -> User:
+        user = await self.get_user_by_email(email)
+        if not user or not await verify_password_async(password, user.password_hash):
+            raise InvalidCredentialsException()
+        if not user.is_active:
+            raise InactiveUserException()
+        user.last_login = datetime.utcnow()
+        return user
+
+
+class InMemoryPreferenceRepository:
+    def __init__(self, store: InMemoryStore, session: Any = None):
+        self.store = store
+
+    def _get(self, model: type, user_id: UUID) -> Optional[Any]:
+        return self.store.settings[model].get(user_id)
+
+    def _upsert(self, model: type, user_id: UUID, values: Dict[str, Any]) -> Any:
+        rows = self.store.settings[model]
+        row = rows.get(user_id)
+        if row is None:
+            row = rows[user_id] = _new_row(model, user_id=user_id)
+        for field, value in values.items():
+            setattr(row, field, value)
+        if values:
+            row.updated_at = datetime.utcnow()
+            row.version += 1
+        return row
+
+    def _get_many(self, model: type, user_ids: Sequence[UUID]) -> List[Any]:
+        rows = self.store.settings[model]
+        return [rows[user_id] for user_id in user_ids if user_id in rows]
+
+    async def get_all_settings(self, user_id: UUID):
+        return (
+            self._get(UserPreference, user_id),
+            self._get(UserNotificationSetting, user_id),
+            self._get(UserPrivacySetting, user_id),
+        )
+
+    async def get_user_preference(self, user_id: UUID):
+        return self._get(UserPreference, user_id)
+
+    async def get_user_preferences(self, user_ids: Sequence[UUID]):
+        return self._get_many(UserPreference, user_ids)
+
+    async def create_user_preference(self, user_id: UUID):
+        return self._upsert(UserPreference, user_id, {})
+
+    async def update_user_preference(self, user_id: UUID, data):
+        return self._upsert(
+            UserPreference, user_id, data.model_dump(exclude_unset=True)
+        )
+
+    async def get_notification_setting(self, user_id: UUID):
+        return self._get(UserNotificationSetting, user_id)
+
+    async def get_notification_settings(self, user_ids: Sequence[UUID]):
+        return self._get_many(UserNotificationSetting, user_ids)
+
+    async def create_notification_setting(self, user_id: UUID):
+        return self._upsert(UserNotificationSetting, user_id, {})
+
+    async def update_notification_setting(self, user_id: UUID, data):
+        return self._upsert(
+            UserNotificationSetting, user_id, data.model_dump(exclude_unset=True)
+        )
+
+    async def stream_audience(self, notification_filters, privacy_filters, chunk_size):
+        chunk = []
+        for user_id, notification in self.store.settings[
+            UserNotificationSetting
+        ].items():
+            privacy = self._get(UserPrivacySetting, user_id)
+            if any(
+                getattr(notification, f) != v for f, v in notification_filters.items()
+            ):
+                continue
+            if privacy_filters and (
+                privacy is None
+                or any(getattr(privacy, f) != v for f, v in privacy_filters.items())
+            ):
+                continue
+            chunk.append((notification, privacy))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    async def get_privacy_setting(self, user_id: UUID):
+        return self._get(UserPrivacySetting, user_id)
+
+    async def get_privacy_settings(self, user_ids: Sequence[UUID]):
+        return self._get_many(UserPrivacySetting, user_ids)
+
+    async def create_privacy_setting(self, user_id: UUID):
+        return self._upsert(UserPrivacySetting, user_id, {})
+
+    async def update_privacy_setting(self, user_id: UUID, data):
+        return self._upsert(
+            UserPrivacySetting, user_id, data.model_dump(exclude_unset=True)
+        )
+
+    async def create_consent(self, user_id, data, ip_address=None, user_agent=None):
+        consent = _new_row(
+            UserConsent,
+            user_id=user_id,
+            consent_type=data.consent_type,
+            granted=data.granted,
+            version=data.version,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            granted_at=datetime.utcnow(),
+            revoked_at=None if data.granted else datetime.utcnow(),
+        )
+        self.store.consents.setdefault(user_id, []).insert(0, consent)
+        return consent
+
+    async def get_consent_history(self, user_id: UUID):
+        return list(self.store.consents.get(user_id, []))
+
+    async def get_latest_consent(self, user_id: UUID, consent_type: str):
+        return next(
+            (
+                c
+                for c in self.store.consents.get(user_id, [])
+                if getattr(c.consent_type, "value", c.consent_type) == consent_type
+            ),
+            None,
+        )
+
+
+class InMemorySessionManager:
+    """Replaces sessionmanager where code opens sessions directly"""
+
+    @asynccontextmanager
+    async def session(self):
+        yield None
+
+
+def install_redis_standin() -> None:
+    """Point the shared cache manager at an in-process fake Redis"""
+    redis_manager._redis_client = fakeredis.FakeRedis(decode_responses=False)
+
+
+def seed_user_settings(store: InMemoryStore, user_id: UUID) -> None:
+    """Give a user a full set of settings rows"""
+    repo = InMemoryPreferenceRepository(store)
+    repo._upsert(UserPreference, user_id, {})
+    repo._upsert(UserNotificationSetting, user_id, {})
+    repo._upsert(UserPrivacySetting, user_id, {})
+
+
+async def load_user_cache_data(store: InMemoryStore, user_id: str):
+    user = store.users.get(UUID(user_id))
+    return build_user_cache_data(user) if user else None
@@ -16,6 +16,7 @@ from src.models import (
     UserNotificationSetting,
     UserPrivacySetting,
     UserConsent,
+    OutboxEvent,
 )
 from src.config.settings import settings
 
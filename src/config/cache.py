@@ -1,23 +1,234 @@
-import json
+import asyncio
+import math
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import uuid4
 from redis import asyncio as aioredis
 from redis.asyncio import Redis
-from typing import Any, Optional
+from redis.exceptions import LockError
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from src.config.metrics import register_cache
 from src.config.settings import settings
 from src.utils.logging import get_logger
+from src.utils.serialization import (
+    ForeignEntryError,
+    StaleEntryError,
+    dumps,
+    get_codec,
+    loads,
+)
 
 logger = get_logger(__name__)
 
+# Written into every cache entry; bump it whenever the shape of a cached
+# value changes, so entries written by other releases are treated as misses
+CACHE_SCHEMA_VERSION = 2
+
+T = TypeVar("T")
+
+# Swap KEYS[1] from ARGV[1] to ARGV[2] (with a TTL of ARGV[3]) atomically
+COMPARE_AND_SET_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+
+# Write KEYS[1] = ARGV[2] and its raw version KEYS[2] = ARGV[1], both with a
+# TTL of ARGV[3], unless KEYS[2] already holds that version or a newer one
+SET_IF_NEWER_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[2]))
+if current and current >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[3])
+return 1
+"""
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with a per-entry TTL.
+
+    Values are shared with callers as-is, so they must be treated as
+    read-only.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value, or None if it is missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        if self._maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + (ttl or self._ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached value with optional soft expiry metadata.
+
+    soft_expiry is a wall-clock timestamp after which the value is stale,
+    and delta is how long the value took to compute.
+    """
+
+    value: Any
+    soft_expiry: Optional[float] = None
+    delta: float = 0.0
+
+    _MARKER = "__swr__"
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> "CacheEntry":
+        if isinstance(raw, dict) and raw.get(cls._MARKER):
+            return cls(raw["value"], raw["soft_expiry"], raw["delta"])
+        return cls(raw)
+
+    def to_raw(self) -> Any:
+        if self.soft_expiry is None:
+            return self.value
+        return {
+            self._MARKER: 1,
+            "value": self.value,
+            "soft_expiry": self.soft_expiry,
+            "delta": self.delta,
+        }
+
+    def should_refresh(self, beta: float = 1.0) -> bool:
+        """
+        Decide whether to recompute the value now.
+
+        Stale values are always refreshed. Fresh values are refreshed early
+        with a probability that rises as the soft expiry approaches (XFetch),
+        so entries written together do not all expire together.
+        """
+        if self.soft_expiry is None:
+            return False
+        # 1 - random() lies in (0, 1], keeping log() finite
+        early = -self.delta * beta * math.log(1.0 - random.random())
+        return time.time() + early >= self.soft_expiry
+
+
+@dataclass
+class CacheWrite:
+    """One entry for RedisConnectionManager.set_many, with set()'s options"""
+
+    key: str
+    value: Any
+    expire: int = 300
+    local: bool = False
+    stale_ttl: Optional[int] = None
+    delta: float = 0.0
+    nx: bool = False
+    raw: bool = False
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls for the same key into a single loader call.
+
+    The first caller starts the loader; callers arriving while it runs
+    await the same task and share its result or exception. The loader runs
+    as its own task so a cancelled caller does not cancel the others.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(loader())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
 
 class RedisConnectionManager:
     """
     Redis connection manager for handling the Redis connection pool.
+
+    When a LocalCache is attached, calls made with local=True are served from
+    process memory first. Writes and deletes of those keys are broadcast on a
+    pub/sub channel so every other process drops its local copy.
     """
 
     _redis_client: Optional[Redis] = None
 
-    def __init__(self, host: str):
+    def __init__(
+        self,
+        host: str,
+        local_cache: Optional[LocalCache] = None,
+        invalidation_channel: str = settings.CACHE_INVALIDATION_CHANNEL,
+    ):
         self._host = host
         self._redis_client: Optional[Redis] = None
+        self._local = local_cache
+        self._codec = get_codec(settings.CACHE_CODEC, CACHE_SCHEMA_VERSION)
+        self._invalidation_channel = invalidation_channel
+        self._instance_id = uuid4().hex
+        self._listener_task: Optional[asyncio.Task] = None
+        self._single_flight = SingleFlight()
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        self._compare_and_set = None
+        self._set_if_newer = None
+        # Lookups that reached Redis, excluding the local tier
+        self.hits = 0
+        self.misses = 0
 
     async def connect(self) -> None:
         """
@@ -25,9 +236,10 @@ class RedisConnectionManager:
         This should be called at application startup.
         """
         logger.info("Connecting to Redis...")
-        self._redis_client = aioredis.from_url(
-            self._host, encoding="utf-8", decode_responses=True
-        )
+        # Values stay bytes end to end; they are decoded by loads()
+        self._redis_client = aioredis.from_url(self._host, decode_responses=False)
+        self._compare_and_set = None
+        self._set_if_newer = None
         try:
             # Ping Redis to test the connection
             await self._redis_client.ping()
@@ -37,11 +249,31 @@ class RedisConnectionManager:
             self._redis_client = None  # Ensure client is None if connection fails
             raise e
 
+        if self._local is not None:
+            self._listener_task = asyncio.create_task(
+                self._listen_for_invalidations()
+            )
+
     async def close(self) -> None:
         """
         Close the Redis connection pool gracefully.
         This should be called at application shutdown.
         """
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        self._refresh_tasks.clear()
+
+        if self._local is not None:
+            self._local.clear()
+
         if self._redis_client is None:
             logger.warning("Redis client is not initialized, nothing to close.")
             return
@@ -50,31 +282,461 @@ class RedisConnectionManager:
         await self._redis_client.close()
         self._redis_client = None
         logger.info("Connection to Redis closed.")
-    
-    async def get(self, key: str) -> Optional[Any]:
+
+    async def get(self, key: str, local: bool = False) -> Optional[Any]:
         """ Get value from Cache"""
+        entry = await self.get_entry(key, local=local)
+        return entry.value if entry is not None else None
+
+    async def get_entry(self, key: str, local: bool = False) -> Optional[CacheEntry]:
+        """Get value from Cache along with its soft expiry metadata"""
+        if local and self._local is not None:
+            raw = self._local.get(key)
+            if raw is not None:
+                return CacheEntry.from_raw(raw)
+
+        if self._redis_client is None:
+            logger.warning("Redis client is not initialized, nothing to get.")
+            return None
+        raw = await self._redis_client.get(key)
+        raw = await self._decode(key, raw)
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+
+        if local and self._local is not None:
+            self._local.set(key, raw)
+        return CacheEntry.from_raw(raw)
+
+    async def get_many(
+        self, keys: Iterable[str], local: bool = False, raw: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get several values from Cache.
+
+        Keys held in process memory are served locally and the rest are
+        fetched with a single MGET. Only hits are returned. With raw=True the
+        values of keys written with raw=True are returned as stored, as bytes.
+        """
+        if raw:
+            keys = list(keys)
+            if self._redis_client is None:
+                logger.warning("Redis client is not initialized, nothing to get.")
+                return {}
+            values = await self._redis_client.mget(keys)
+            return {
+                key: value for key, value in zip(keys, values) if value is not None
+            }
+
+        found: Dict[str, Any] = {}
+        remaining = []
+        for key in keys:
+            raw = self._local.get(key) if local and self._local is not None else None
+            if raw is not None:
+                found[key] = CacheEntry.from_raw(raw).value
+            else:
+                remaining.append(key)
+
+        if not remaining:
+            return found
         if self._redis_client is None:
             logger.warning("Redis client is not initialized, nothing to get.")
+            return found
+
+        for key, raw in zip(remaining, await self._redis_client.mget(remaining)):
+            raw = await self._decode(key, raw)
+            if raw is None:
+                self.misses += 1
+                continue
+            self.hits += 1
+
+            if local and self._local is not None:
+                self._local.set(key, raw)
+            found[key] = CacheEntry.from_raw(raw).value
+        return found
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        expire: int = 300,
+        nx: bool = False,
+        local: bool = False,
+        stale_ttl: Optional[int] = None,
+        delta: float = 0.0,
+        raw: bool = False,
+    ) -> None:
+        """
+        Set value in Cache.
+
+        With nx=True the value is only written if the key does not exist yet,
+        so a read-through fill never overwrites a fresher write-through value.
+        With local=True the value is also kept in process memory and other
+        processes are told to drop their copy.
+
+        With stale_ttl, expire becomes a jittered soft TTL: once it passes the
+        value is still served for up to stale_ttl seconds while it is
+        refreshed. delta is how long the value took to compute, which drives
+        probabilistic early refresh in get_or_load.
+
+        With raw=True a str, bytes or int value is stored as-is, outside the
+        cache codec, so it survives codec and schema changes; it is never
+        kept locally.
+        """
+        if self._redis_client is None:
+            logger.warning("Redis client is not initialized, nothing to set.")
+            return
+
+        if raw:
+            await self._redis_client.set(key, value, ex=expire, nx=nx)
+            return
+
+        raw, expire = self._prepare(value, expire, stale_ttl, delta)
+        written = await self._redis_client.set(
+            key, self._codec.encode(raw), ex=expire, nx=nx
+        )
+
+        if local and self._local is not None:
+            if written:
+                self._local.set(key, raw)
+            # A successful NX fill means no process could have held the key
+            if not nx:
+                await self._publish_invalidation([key])
+
+    async def set_many(self, writes: Iterable[CacheWrite]) -> None:
+        """
+        Set several values in Cache with one pipelined round-trip.
+
+        Each write carries its own TTL and options, as for set(). Invalidations
+        for local keys are published in the same pipeline.
+        """
+        writes = list(writes)
+        if not writes:
             return
-        value = await self._redis_client.get(key)
-        if value:
-            return json.loads(value)
-        return None
-    
-    async def set(self, key: str, value: Any, expire: int = 300) -> None:
-        """ Set value in Cache"""
         if self._redis_client is None:
             logger.warning("Redis client is not initialized, nothing to set.")
             return
-        await self._redis_client.set(key, json.dumps(value), ex=expire)
-    
-    async def delete(self, key: str) -> None:
+
+        raws = []
+        pipe = self._redis_client.pipeline(transaction=False)
+        for write in writes:
+            if write.raw:
+                pipe.set(write.key, write.value, ex=write.expire, nx=write.nx)
+                raws.append(None)
+                continue
+            raw, expire = self._prepare(
+                write.value, write.expire, write.stale_ttl, write.delta
+            )
+            pipe.set(write.key, self._codec.encode(raw), ex=expire, nx=write.nx)
+            raws.append(raw)
+        # As in set(), successful NX fills need no invalidation
+        invalidated = [
+            write.key
+            for write in writes
+            if write.local
+            and not (write.nx or write.raw)
+            and self._local is not None
+        ]
+        if invalidated:
+            pipe.publish(
+                self._invalidation_channel, self._invalidation_message(invalidated)
+            )
+        results = await pipe.execute()
+
+        for write, raw, written in zip(writes, raws, results):
+            if write.local and not write.raw and written and self._local is not None:
+                self._local.set(write.key, raw)
+
+    async def compare_and_set(
+        self, key: str, expected: Any, value: Any, expire: int = 300
+    ) -> bool:
+        """
+        Replace a raw value only if it still equals expected, in one round-trip.
+
+        For keys written with raw=True: both values are compared and stored
+        as-is. Returns False, leaving the key untouched, when it is missing or
+        holds something else.
+        """
+        if self._redis_client is None:
+            logger.warning("Redis client is not initialized, nothing to set.")
+            return False
+        if self._compare_and_set is None:
+            self._compare_and_set = self._redis_client.register_script(
+                COMPARE_AND_SET_SCRIPT
+            )
+        swapped = await self._compare_and_set(
+            keys=[key],
+            args=[expected, value, expire],
+        )
+        return bool(swapped)
+
+    async def set_if_newer(
+        self,
+        key: str,
+        value: Any,
+        version_key: str,
+        version: int,
+        expire: int = 300,
+        local: bool = False,
+    ) -> bool:
+        """
+        Write a value and its raw version only if the version is newer.
+
+        Both keys are checked and written atomically, so when writers race
+        the one holding the newest version wins whatever order they reach
+        Redis in. Returns False, leaving both keys untouched, when version_key
+        already holds this version or a newer one.
+        """
+        if self._redis_client is None:
+            logger.warning("Redis client is not initialized, nothing to set.")
+            return False
+        if self._set_if_newer is None:
+            self._set_if_newer = self._redis_client.register_script(
+                SET_IF_NEWER_SCRIPT
+            )
+        written = await self._set_if_newer(
+            keys=[key, version_key],
+            args=[version, self._codec.encode(value), expire],
+        )
+
+        if local and self._local is not None:
+            if written:
+                self._local.set(key, value)
+                await self._publish_invalidation([key])
+            else:
+                # A newer value is in Redis; do not keep serving an older one
+                self._local.delete(key)
+        return bool(written)
+
+    @staticmethod
+    def _prepare(
+        value: Any, expire: int, stale_ttl: Optional[int], delta: float
+    ) -> Tuple[Any, int]:
+        """Wrap a value in its soft TTL metadata and work out the hard TTL"""
+        if stale_ttl is None:
+            return value, expire
+        soft_ttl = expire * random.uniform(
+            1 - settings.CACHE_TTL_JITTER, 1 + settings.CACHE_TTL_JITTER
+        )
+        raw = CacheEntry(value, time.time() + soft_ttl, delta).to_raw()
+        return raw, math.ceil(soft_ttl) + stale_ttl
+
+    async def _decode(self, key: str, data: Optional[bytes]) -> Optional[Any]:
+        """Decode a stored entry; None for a miss, stale or corrupt entry"""
+        if not data:
+            return None
+        try:
+            return self._codec.decode(data)
+        except StaleEntryError:
+            # Written by an older release; drop it so NX fills can replace it
+            await self._redis_client.delete(key)
+        except ForeignEntryError:
+            # Still readable by a newer release or another codec in the fleet
+            pass
+        except ValueError:
+            logger.warning(f"Ignoring undecodable cache entry for {key}")
+        return None
+
+    async def delete(self, key: str, local: bool = False) -> None:
         """ Delete value from Cache"""
+        if local and self._local is not None:
+            self._local.delete(key)
+
         if self._redis_client is None:
             logger.warning("Redis client is not initialized, nothing to delete.")
             return
         await self._redis_client.delete(key)
 
+        if local and self._local is not None:
+            await self._publish_invalidation([key])
+
+    async def delete_many(self, keys: Iterable[str], local: bool = False) -> None:
+        """
+        Delete several values from Cache with one DEL.
+
+        With local=True the invalidation is published in the same pipeline.
+        """
+        keys = list(keys)
+        if not keys:
+            return
+        if local and self._local is not None:
+            for key in keys:
+                self._local.delete(key)
+
+        if self._redis_client is None:
+            logger.warning("Redis client is not initialized, nothing to delete.")
+            return
+        pipe = self._redis_client.pipeline(transaction=False)
+        pipe.delete(*keys)
+        if local and self._local is not None:
+            pipe.publish(self._invalidation_channel, self._invalidation_message(keys))
+        await pipe.execute()
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[Any]]],
+        expire: int = 300,
+        local: bool = False,
+        distributed: bool = False,
+        stale_ttl: Optional[int] = None,
+    ) -> Optional[Any]:
+        """
+        Get value from Cache, calling loader on a miss.
+
+        Concurrent misses for the same key in this process share one loader
+        call. With distributed=True a short Redis lock also elects a single
+        loader across processes; the others wait for it to fill the cache.
+        A None result from the loader is returned but not cached.
+
+        With stale_ttl, entries past their soft TTL (or picked for early
+        refresh) are returned immediately while a background task reloads
+        them. The loader must therefore not depend on request-scoped state.
+        """
+        entry = await self.get_entry(key, local=local)
+        if entry is not None:
+            if stale_ttl is not None and entry.should_refresh(
+                settings.CACHE_XFETCH_BETA
+            ):
+                self._schedule_refresh(
+                    key, loader, expire, local, distributed, stale_ttl
+                )
+            return entry.value
+
+        return await self._single_flight.do(
+            key,
+            lambda: self._load(key, loader, expire, local, distributed, stale_ttl),
+        )
+
+    async def _load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[Any]]],
+        expire: int,
+        local: bool,
+        distributed: bool,
+        stale_ttl: Optional[int] = None,
+    ) -> Optional[Any]:
+        lock = None
+        if distributed and self._redis_client is not None:
+            lock = self._redis_client.lock(
+                f"lock:{key}", timeout=settings.CACHE_LOCK_TIMEOUT
+            )
+            if await lock.acquire(blocking=False):
+                # Another process may have filled the key since our miss
+                value = await self.get(key, local=local)
+                if value is not None:
+                    await self._release(lock)
+                    return value
+            else:
+                value = await self._wait_for_fill(key, local, lock)
+                lock = None
+                if value is not None:
+                    return value
+                # The lock holder gave up, failed or loaded nothing to cache;
+                # load it ourselves
+
+        try:
+            started = time.perf_counter()
+            value = await loader()
+            if value is not None:
+                await self.set(
+                    key,
+                    value,
+                    expire=expire,
+                    nx=True,
+                    local=local,
+                    stale_ttl=stale_ttl,
+                    delta=time.perf_counter() - started,
+                )
+            return value
+        finally:
+            if lock is not None:
+                await self._release(lock)
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[Any]]],
+        expire: int,
+        local: bool,
+        distributed: bool,
+        stale_ttl: int,
+    ) -> None:
+        """Reload a stale entry in the background, once per key per process"""
+        if key in self._refresh_tasks:
+            return
+        task = asyncio.create_task(
+            self._refresh(key, loader, expire, local, distributed, stale_ttl)
+        )
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+
+    async def _refresh(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[Any]]],
+        expire: int,
+        local: bool,
+        distributed: bool,
+        stale_ttl: int,
+    ) -> None:
+        lock = None
+        if distributed and self._redis_client is not None:
+            lock = self._redis_client.lock(
+                f"lock:{key}", timeout=settings.CACHE_LOCK_TIMEOUT
+            )
+            if not await lock.acquire(blocking=False):
+                # Another process is already refreshing this key
+                return
+
+        try:
+            started = time.perf_counter()
+            value = await loader()
+            if value is None:
+                await self.delete(key, local=local)
+            else:
+                await self.set(
+                    key,
+                    value,
+                    expire=expire,
+                    local=local,
+                    stale_ttl=stale_ttl,
+                    delta=time.perf_counter() - started,
+                )
+        except Exception as e:
+            logger.warning(f"Background refresh of {key} failed: {e}")
+        finally:
+            if lock is not None:
+                await self._release(lock)
+
+    async def _wait_for_fill(self, key: str, local: bool, lock) -> Optional[Any]:
+        """
+        Poll for a value being loaded by the process holding the lock.
+
+        Stops as soon as the lock is released without a value being cached,
+        e.g. when the loader returned None, instead of waiting out the lock
+        timeout.
+        """
+        deadline = time.monotonic() + settings.CACHE_LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(settings.CACHE_LOCK_POLL_INTERVAL)
+            value = await self.get(key, local=local)
+            if value is not None:
+                return value
+            if not await lock.locked():
+                return None
+        return None
+
+    @staticmethod
+    async def _release(lock) -> None:
+        try:
+            await lock.release()
+        except LockError:
+            # The lock expired and may already belong to another process
+            pass
+
     async def exists (self, key: str) -> bool:
         """ Check if key exists in Cache"""
         if self._redis_client is None:
@@ -90,8 +752,56 @@ class RedisConnectionManager:
             raise Exception("Redis client is not initialized.")
         return self._redis_client
 
+    def _invalidation_message(self, keys: Iterable[str]) -> bytes:
+        return dumps({"origin": self._instance_id, "keys": list(keys)})
+
+    async def _publish_invalidation(self, keys: Iterable[str]) -> None:
+        """Tell every other process to drop the given keys from local memory"""
+        await self._redis_client.publish(
+            self._invalidation_channel, self._invalidation_message(keys)
+        )
+
+    def _handle_invalidation(self, data: str) -> None:
+        try:
+            message = loads(data)
+        except ValueError:
+            logger.warning("Ignoring malformed cache invalidation message")
+            return
+
+        if message.get("origin") == self._instance_id:
+            return
+        for key in message.get("keys", []):
+            self._local.delete(key)
+
+    async def _listen_for_invalidations(self) -> None:
+        """
+        Evict local entries written or deleted by other processes.
+        Runs for the lifetime of the connection and resubscribes on errors.
+        """
+        while True:
+            pubsub = self._redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self._invalidation_channel)
+                # Invalidations may have been missed while unsubscribed
+                self._local.clear()
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._handle_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener failed: {e}")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
 
-redis_manager = RedisConnectionManager(settings.get_redis_url)
+redis_manager = RedisConnectionManager(
+    settings.get_redis_url,
+    LocalCache(settings.CACHE_LOCAL_MAXSIZE, settings.CACHE_LOCAL_TTL),
+)
+register_cache("local", redis_manager._local)
+register_cache("redis", redis_manager)
 
 
 async def get_redis_client() -> Redis:
@@ -1,4 +1,7 @@
-from typing import AsyncGenerator, Any, AsyncIterator
+import asyncio
+import itertools
+from typing import AsyncGenerator, Any, AsyncIterator, Dict, Optional, Sequence
+from uuid import UUID
 from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -8,6 +11,8 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import DeclarativeBase
 
+from .cache import LocalCache, redis_manager
+from .metrics import InstrumentedAsyncQueuePool, instrument_pool
 from .settings import settings
 from src.utils.logging import get_logger
 
@@ -25,17 +30,137 @@ class Base(DeclarativeBase):
     __mapper_args__ = {"eager_defaults": True}
 
 
+def engine_options(grpc: bool = False) -> Dict[str, Any]:
+    """
+    Engine and pool options from Settings.
+
+    With grpc=True the GRPC_DB_* overrides are applied, so the gRPC server
+    can size its pool independently of the HTTP app.
+    """
+
+    def pick(name: str) -> Any:
+        override = getattr(settings, f"GRPC_{name}") if grpc else None
+        return override if override is not None else getattr(settings, name)
+
+    return {
+        "echo": settings.DB_ECHO,
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": pick("DB_POOL_SIZE"),
+        "max_overflow": pick("DB_MAX_OVERFLOW"),
+        "pool_timeout": pick("DB_POOL_TIMEOUT"),
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
 class DatabaseSessionManager:
     """
     Database session manager for handling database connections.
     """
 
-    def __init__(self, host: str, engine_kwargs: dict[str, Any] = {}):
-        self._engine = create_async_engine(host, **engine_kwargs)
+    def __init__(
+        self,
+        host: str,
+        engine_kwargs: dict[str, Any] = {},
+        replica_hosts: Sequence[str] = (),
+    ):
+        self._host = host
+        self._replica_hosts = list(replica_hosts)
+        # Users who wrote recently; Redis shares this across processes
+        self._pins = LocalCache(10000, settings.DB_REPLICA_STICKY_SECONDS)
+        self._init_engine(engine_kwargs)
+
+    def _init_engine(self, engine_kwargs: dict[str, Any]) -> None:
+        self._engine = create_async_engine(self._host, **engine_kwargs)
+        instrument_pool(self._engine.pool, "primary")
         self._sessionmaker = async_sessionmaker(
             bind=self._engine, autocommit=False, expire_on_commit=False
         )
 
+        self._replica_engines = []
+        for index, replica_host in enumerate(self._replica_hosts):
+            engine = create_async_engine(replica_host, **engine_kwargs)
+            instrument_pool(engine.pool, f"replica-{index}")
+            self._replica_engines.append(engine)
+        self._replica_sessionmakers = itertools.cycle(
+            [
+                async_sessionmaker(
+                    bind=engine, autocommit=False, expire_on_commit=False
+                )
+                for engine in self._replica_engines
+            ]
+        )
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self._replica_engines)
+
+    async def _dispose_engines(self) -> None:
+        for engine in self._replica_engines:
+            await engine.dispose()
+        self._replica_engines = []
+        if self._engine is not None:
+            await self._engine.dispose()
+
+    async def reconfigure(self, engine_kwargs: dict[str, Any]) -> None:
+        """
+        Replace the engines with ones built from new options.
+
+        Meant for process startup, before any sessions are open.
+        """
+        await self._dispose_engines()
+        self._init_engine(engine_kwargs)
+
+    async def warm_up(self, connections: Optional[int] = None) -> None:
+        """
+        Open pool connections ahead of traffic.
+
+        Opens connections (pool_size by default) concurrently and returns
+        them to the pool, so the first requests do not pay for connection
+        setup. Failures are logged rather than raised.
+        """
+        if self._engine is None:
+            raise Exception("Database engine is not initialized.")
+
+        count = connections if connections is not None else self._engine.pool.size()
+        pending = [self._engine.connect() for _ in range(count)]
+        results = await asyncio.gather(
+            *(connection.start() for connection in pending), return_exceptions=True
+        )
+        failures = [r for r in results if isinstance(r, BaseException)]
+        for connection, result in zip(pending, results):
+            if not isinstance(result, BaseException):
+                await connection.close()
+
+        if failures:
+            logger.warning(
+                f"Warmed {count - len(failures)}/{count} DB connections: {failures[0]}"
+            )
+        else:
+            logger.info(f"Warmed {count} DB connections")
+
+    @staticmethod
+    def _pool_stats(pool: Any) -> Dict[str, Any]:
+        if not hasattr(pool, "checkedout"):
+            return {"status": pool.status()}
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+        }
+
+    def pool_status(self) -> Dict[str, Any]:
+        """Current utilisation of the connection pools"""
+        if self._engine is None:
+            return {}
+        status = self._pool_stats(self._engine.pool)
+        if self._replica_engines:
+            status["replicas"] = [
+                self._pool_stats(engine.pool) for engine in self._replica_engines
+            ]
+        return status
+
     async def close(self) -> None:
         """
         Close the database engine.
@@ -44,7 +169,7 @@ class DatabaseSessionManager:
             raise Exception("Database engine is not initialized.")
 
         logger.info("Closing Connection to DB... ")
-        await self._engine.dispose()
+        await self._dispose_engines()
         self._engine = None
         self._sessionmaker = None
         logger.info("Connection to DB closed.")
@@ -80,8 +205,64 @@ class DatabaseSessionManager:
         finally:
             await session.close()
 
+    async def pin_to_primary(self, user_id: UUID) -> None:
+        """
+        Route a user's reads to the primary for DB_REPLICA_STICKY_SECONDS.
+
+        Called after a write so the user reads their own change even while
+        replicas are lagging.
+        """
+        if not self.has_replicas:
+            return
+        key = f"db:primary-pin:{user_id}"
+        self._pins.set(key, True)
+        try:
+            await redis_manager.set(
+                key, 1, expire=settings.DB_REPLICA_STICKY_SECONDS
+            )
+        except Exception as e:
+            logger.warning(f"Failed to share primary pin for {user_id}: {e}")
+
+    async def is_pinned_to_primary(self, user_id: UUID) -> bool:
+        key = f"db:primary-pin:{user_id}"
+        if self._pins.get(key):
+            return True
+        try:
+            return bool(await redis_manager.exists(key))
+        except Exception:
+            # Without the shared pin, the primary is the only safe choice
+            return True
 
-sessionmanager = DatabaseSessionManager(settings.sqlalchemy_database_uri, {"echo": settings.DEBUG})
+    @asynccontextmanager
+    async def read_session(
+        self, primary: AsyncSession, user_id: Optional[UUID] = None
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Context manager for a read-only query.
+
+        Yields a session on the next replica, or the given primary session
+        when there are no replicas or the user wrote recently. Rows loaded
+        from a replica are detached when the context exits, so read paths
+        that go on to modify what they loaded must query the primary.
+        """
+        if not self.has_replicas or (
+            user_id is not None and await self.is_pinned_to_primary(user_id)
+        ):
+            yield primary
+            return
+
+        session = next(self._replica_sessionmakers)()
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+sessionmanager = DatabaseSessionManager(
+    settings.sqlalchemy_database_uri,
+    engine_options(),
+    settings.replica_database_uris,
+)
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
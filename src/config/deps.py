@@ -3,16 +3,18 @@ from uuid import UUID
 from fastapi import Depends, Header, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from redis import Redis
 from src.utils.exceptions import (
     InvalidTokenException,
     InactiveUserException,
     MissingTokenException,
 )
-from src.config.security import decode_token
+from src.config.security import decode_token_cached
 from src.models.users import User
-from src.config.database import get_db_session
-from src.config.cache import get_redis_client
+from src.config.database import get_db_session, sessionmanager
+from src.config.cache import redis_manager
+from src.config.settings import settings
+from src.repositories.auth_repo import AuthRepository
+from src.services.auth_service import build_user_cache_data, user_cache_key
 
 security = HTTPBearer(auto_error=False)
 
@@ -45,6 +47,8 @@ async def verify_token(token: str = Depends(get_token_from_header)) -> Dict[str,
     """
     Verify and decode JWT token
 
+    Verified payloads are cached per process until the token expires.
+
     Args:
         token: JWT token string
 
@@ -52,7 +56,7 @@ async def verify_token(token: str = Depends(get_token_from_header)) -> Dict[str,
         Decoded token payload
     """
     try:
-        payload = decode_token(token)
+        payload = decode_token_cached(token)
 
         # Verify token type
         if payload.get("type") != "access":
@@ -97,70 +101,55 @@ async def get_current_user_from_db(
     return user
 
 
+async def load_user_cache_data(user_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the cached user record from the database.
+
+    Opens its own session so it can also run as a background cache refresh
+    after the request that triggered it has finished.
+    """
+    async with sessionmanager.session() as db:
+        user = await AuthRepository(db).get_user_by_id(UUID(user_id))
+    return build_user_cache_data(user) if user else None
+
+
 async def get_current_user(
     payload: Dict[str, Any] = Depends(verify_token),
-    redis_client: Redis = Depends(get_redis_client),
-    db: AsyncSession = Depends(get_db_session),
 ) -> Dict[str, Any]:
     """
-    Get current authenticated user with Redis caching
+    Get current authenticated user with two-tier caching
 
     This dependency:
     1. Verifies the JWT token
-    2. Checks Redis cache for user data
-    3. Falls back to database if not in cache
+    2. Checks the in-process cache, then Redis, for user data
+    3. Falls back to database if not in cache, one lookup per user at a time
     4. Validates user is active
 
+    Stale entries are served while they are refreshed in the background.
+
     Args:
         payload: Decoded JWT token payload
-        redis_client: Redis connection
-        db: Database session
 
     Returns:
         Dictionary containing user information
     """
     user_id = payload.get("user_id")
 
-    # Try to get user from Redis cache
-    cache_key = f"user:{user_id}"
-    cached_user = await redis_client.get(cache_key)
-
-    if cached_user:
-        import json
-
-        user_data = json.loads(cached_user)
-
-        # Validate cached user is still active
-        if not user_data.get("is_active"):
-            raise InactiveUserException()
-
-        return user_data
-
-    # Cache miss - get from database
-    user: User = db.query(User).filter(User.id == UUID(user_id)).first()
-
-    if not user:
+    # Try the local / Redis cache; concurrent misses share one DB lookup
+    user_data = await redis_manager.get_or_load(
+        user_cache_key(user_id),
+        lambda: load_user_cache_data(user_id),
+        expire=settings.USER_CACHE_TTL,
+        local=True,
+        distributed=True,
+        stale_ttl=settings.USER_CACHE_STALE_TTL,
+    )
+
+    if user_data is None:
         raise InvalidTokenException("User not found")
 
-    if not user.is_active:
+    # Validate user is still active
+    if not user_data.get("is_active"):
         raise InactiveUserException()
 
-    # Prepare user data
-    user_data = {
-        "user_id": str(user.id),
-        "email": user.email,
-        "phone": user.phone,
-        "first_name": user.first_name,
-        "last_name": user.last_name,
-        "is_active": user.is_active,
-        "is_verified": user.is_verified,
-        "role": getattr(user, "role", "user"),
-        "created_at": user.created_at.isoformat() if user.created_at else None,
-    }
-
-    # Cache user data in Redis (expire after 1 hour)
-    import json
-
-    await redis_client.setex(cache_key, 3600, json.dumps(user_data))  # 1 hour
-
     return user_data
@@ -0,0 +1,264 @@
+import time
+from typing import Dict, Optional, Protocol
+
+import grpc
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    generate_latest,
+    start_http_server,
+)
+from prometheus_client.core import CounterMetricFamily
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# HTTP
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests handled",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency",
+    ["method", "route"],
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "HTTP requests currently being handled"
+)
+
+# gRPC
+GRPC_REQUESTS = Counter(
+    "grpc_server_handled_total",
+    "gRPC calls handled",
+    ["method", "code"],
+)
+GRPC_REQUEST_DURATION = Histogram(
+    "grpc_server_handling_seconds",
+    "gRPC call latency, including the whole stream for streaming calls",
+    ["method"],
+)
+GRPC_REQUESTS_IN_FLIGHT = Gauge(
+    "grpc_server_in_flight", "gRPC calls currently being handled"
+)
+
+# Database pool
+DB_POOL_CHECKOUT_DURATION = Histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting for a pooled database connection",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_POOL_SIZE = Gauge("db_pool_size", "Configured pool size", ["pool"])
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Connections currently checked out", ["pool"]
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Connections open beyond the pool size", ["pool"]
+)
+
+# Cache
+class CacheStats(Protocol):
+    """Anything keeping its own hit and miss counts"""
+
+    hits: int
+    misses: int
+
+
+class CacheCollector:
+    """
+    Exports hit and miss counts that caches already keep, so lookups on the
+    hot path do not touch Prometheus at all.
+    """
+
+    def __init__(self) -> None:
+        self._caches: Dict[str, CacheStats] = {}
+
+    def register(self, name: str, cache: CacheStats) -> None:
+        self._caches[name] = cache
+
+    def collect(self):
+        requests = CounterMetricFamily(
+            "cache_requests",
+            "Cache lookups by cache and result",
+            labels=["cache", "result"],
+        )
+        for name, cache in self._caches.items():
+            requests.add_metric([name, "hit"], cache.hits)
+            requests.add_metric([name, "miss"], cache.misses)
+        yield requests
+
+
+cache_collector = CacheCollector()
+REGISTRY.register(cache_collector)
+
+
+def register_cache(name: str, cache: CacheStats) -> None:
+    """Export hit and miss counts for a cache"""
+    cache_collector.register(name, cache)
+
+
+# Messaging
+PUBLISH_DURATION = Histogram(
+    "rabbitmq_publish_seconds", "Time to publish a message", ["queue"]
+)
+PUBLISH_ERRORS = Counter(
+    "rabbitmq_publish_errors_total", "Messages that failed to publish", ["queue"]
+)
+
+
+# HTTP instrumentation
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request count, latency and in-flight requests.
+
+    Requests are labelled by route template rather than raw path to keep
+    label cardinality bounded.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = getattr(scope.get("route"), "path", "unmatched")
+            method = scope["method"]
+            HTTP_REQUEST_DURATION.labels(method, route).observe(
+                time.perf_counter() - start
+            )
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Expose metrics in the Prometheus text format"""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+# gRPC instrumentation
+def _status_name(context, error: Optional[BaseException]) -> str:
+    code = context.code()
+    if code is None:
+        return "UNKNOWN" if error is not None else "OK"
+    return getattr(code, "name", str(code))
+
+
+class MetricsInterceptor(grpc.aio.ServerInterceptor):
+    """Server interceptor recording call count, latency and in-flight calls"""
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+
+        method = handler_call_details.method.rsplit("/", 1)[-1]
+
+        if handler.unary_unary is not None:
+            behavior = handler.unary_unary
+
+            async def unary_unary(request, context):
+                GRPC_REQUESTS_IN_FLIGHT.inc()
+                start = time.perf_counter()
+                error = None
+                try:
+                    return await behavior(request, context)
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    GRPC_REQUESTS_IN_FLIGHT.dec()
+                    GRPC_REQUEST_DURATION.labels(method).observe(
+                        time.perf_counter() - start
+                    )
+                    GRPC_REQUESTS.labels(method, _status_name(context, error)).inc()
+
+            return grpc.unary_unary_rpc_method_handler(
+                unary_unary,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+
+        if handler.unary_stream is not None:
+            behavior = handler.unary_stream
+
+            async def unary_stream(request, context):
+                GRPC_REQUESTS_IN_FLIGHT.inc()
+                start = time.perf_counter()
+                error = None
+                try:
+                    async for response in behavior(request, context):
+                        yield response
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    GRPC_REQUESTS_IN_FLIGHT.dec()
+                    GRPC_REQUEST_DURATION.labels(method).observe(
+                        time.perf_counter() - start
+                    )
+                    GRPC_REQUESTS.labels(method, _status_name(context, error)).inc()
+
+            return grpc.unary_stream_rpc_method_handler(
+                unary_stream,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+
+        return handler
+
+
+def start_metrics_server(port: int) -> None:
+    """Serve /metrics on a separate port, for processes without an HTTP app"""
+    start_http_server(port)
+    logger.info(f"Metrics server listening on port {port}")
+
+
+# Database pool instrumentation
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waits for a connection"""
+
+    metrics_name = "default"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_DURATION.labels(self.metrics_name).observe(
+                time.perf_counter() - start
+            )
+
+
+def instrument_pool(pool: Pool, name: str) -> None:
+    """Export utilisation gauges for a connection pool"""
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        pool.metrics_name = name
+    if hasattr(pool, "checkedout"):
+        DB_POOL_SIZE.labels(name).set_function(pool.size)
+        DB_POOL_CHECKED_OUT.labels(name).set_function(pool.checkedout)
+        DB_POOL_OVERFLOW.labels(name).set_function(lambda: max(pool.overflow(), 0))
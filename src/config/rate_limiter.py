@@ -1,43 +1,305 @@
-from fastapi import Request, HTTPException, status
-from src.config.cache import RedisConnectionManager
-from src.config.cache import get_redis_client
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from src.config.cache import RedisConnectionManager, redis_manager
+from src.config.security import decode_token_cached
 from src.config.settings import settings
+from src.utils.exceptions import InvalidTokenException, RateLimitExceededException
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-class RateLimiter :
-    def __init__ (self, redis_client: RedisConnectionManager) -> None:
-        self._redis = redis_client
-        self.max_requests = settings.RATE_LIMIT_REQUESTS_PER_MINUTE
-        self.window = 60
-
-    async def check_rate_limit (self, client_id: str) -> bool:
-        """ Check if the client has exceeded the rate limit."""
-        if not self._redis._redis_client:
-            return True
-        key = f"rate_limit:{client_id}"
-        current = await self._redis.get(key)
-
-        if current is None:
-            await self._redis.set(key, self.window, 1)
-            return True
-        
-        if int(current) >= self.max_requests:
-            return False
-        
-        await self._redis.incr(key)
-        return True
-    
-
-async def rate_limit_dependency(request: Request):
-    """FastAPI dependency for rate limiting"""
-    cache_client = await get_redis_client()
-    rate_limiter = RateLimiter(cache_client)
-    client_id = request.client.host if request.client else "unknown"
-    
-    if not await rate_limiter.check_rate_limit(client_id):
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Rate limit exceeded. Please try again later."
-        )
\ No newline at end of file
+# Generic cell rate algorithm (GCRA). The key holds the theoretical arrival
+# time (TAT) of the next request; a request is allowed if adding its cost
+# keeps TAT within one period of now. Redis TIME is used so every app
+# process shares one clock, and the whole check is a single EVALSHA.
+#
+# KEYS[1] = rate limit key
+# ARGV[1] = limit (requests per period), ARGV[2] = period in seconds,
+# ARGV[3] = cost of this request
+# Returns {allowed, remaining, retry_after, reset_after}; fractional
+# seconds are returned as strings since Lua numbers are truncated.
+GCRA_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local interval = period / limit
+
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local tat = tonumber(redis.call("GET", KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+
+local new_tat = tat + interval * cost
+local allow_at = new_tat - period
+
+if allow_at > now then
+    return {0, 0, tostring(allow_at - now), tostring(tat - now)}
+end
+
+redis.call("SET", KEYS[1], string.format("%.6f", new_tat), "PX", math.ceil((new_tat - now) * 1000))
+local remaining = math.floor((now - allow_at) / interval)
+return {1, remaining, "0", tostring(new_tat - now)}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """Outcome of a single rate limit check"""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float
+    retry_after: float = 0.0
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Standard RateLimit response headers for this result"""
+        headers = {
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(self.remaining),
+            "RateLimit-Reset": str(math.ceil(self.reset_after)),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(math.ceil(self.retry_after))
+        return headers
+
+
+class RateLimiter:
+    """
+    Redis backed GCRA rate limiter.
+
+    Each check runs one atomic script, so concurrent requests cannot race
+    past the limit and every check costs exactly one round-trip.
+    """
+
+    def __init__(
+        self,
+        cache: RedisConnectionManager,
+        limit: int = settings.RATE_LIMIT_REQUESTS_PER_MINUTE,
+        period: int = 60,
+        prefix: str = "rate_limit",
+    ) -> None:
+        self._cache = cache
+        self._script = None
+        self.limit = limit
+        self.period = period
+        self.prefix = prefix
+
+    async def check(self, key: str, cost: int = 1) -> RateLimitResult:
+        """Consume cost from the limit for key and report the outcome"""
+        client = self._cache._redis_client
+        if client is None:
+            # Fail open when Redis is unavailable
+            return RateLimitResult(True, self.limit, self.limit, 0.0)
+
+        if self._script is None:
+            # Script objects run via EVALSHA and reload on NOSCRIPT
+            self._script = client.register_script(GCRA_SCRIPT)
+
+        allowed, remaining, retry_after, reset_after = await self._script(
+            keys=[f"{self.prefix}:{key}"],
+            args=[self.limit, self.period, cost],
+            client=client,
+        )
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=self.limit,
+            remaining=int(remaining),
+            reset_after=float(reset_after),
+            retry_after=float(retry_after),
+        )
+
+
+@dataclass
+class _LocalBucket:
+    """Per-key admission state for one fixed window in this process"""
+
+    window: int
+    synced: int = 0  # cluster-wide count as of the last flush
+    in_flight: int = 0  # counts sent in a flush that has not returned yet
+    pending: int = 0  # counts admitted here since the last flush
+
+    @property
+    def used(self) -> int:
+        return self.synced + self.in_flight + self.pending
+
+
+class HybridRateLimiter:
+    """
+    Rate limiter that admits requests from in-process buckets.
+
+    Each key gets a bucket of limit tokens per fixed window of period
+    seconds. Tokens consumed here are added to a shared Redis counter with
+    pipelined INCRBY every sync_interval seconds, and the returned totals
+    tell each worker what the rest of the cluster has used.
+
+    Requests are only sent to Redis when a worker has admitted
+    max_unsynced requests for a key since its last sync. That caps
+    over-admission per key at workers x max_unsynced for each window.
+    """
+
+    def __init__(
+        self,
+        cache: RedisConnectionManager,
+        limit: int = settings.RATE_LIMIT_REQUESTS_PER_MINUTE,
+        period: int = 60,
+        prefix: str = "rate_limit",
+        sync_interval: float = settings.RATE_LIMIT_SYNC_INTERVAL,
+        max_unsynced: int = settings.RATE_LIMIT_MAX_UNSYNCED,
+    ) -> None:
+        self._cache = cache
+        self.limit = limit
+        self.period = period
+        self.prefix = prefix
+        self.sync_interval = sync_interval
+        self.max_unsynced = max_unsynced
+        self._buckets: Dict[str, _LocalBucket] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+
+    def _bucket(self, key: str, window: int) -> _LocalBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket.window != window:
+            bucket = self._buckets[key] = _LocalBucket(window)
+        return bucket
+
+    async def check(self, key: str, cost: int = 1) -> RateLimitResult:
+        """Consume cost from the local bucket for key and report the outcome"""
+        now = time.time()
+        window = int(now // self.period)
+        reset_after = (window + 1) * self.period - now
+        bucket = self._bucket(key, window)
+
+        if bucket.pending + cost > self.max_unsynced:
+            # Too much unsynced admission for this key, reconcile first
+            async with self._flush_lock:
+                if bucket.pending + cost > self.max_unsynced:
+                    await self._flush()
+
+        if bucket.used + cost > self.limit:
+            return RateLimitResult(
+                False, self.limit, 0, reset_after, retry_after=reset_after
+            )
+
+        bucket.pending += cost
+        self._ensure_flusher()
+        return RateLimitResult(
+            True, self.limit, self.limit - bucket.used, reset_after
+        )
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.ensure_future(self._run_flusher())
+
+    async def _run_flusher(self) -> None:
+        """Flush periodically while there are unsynced counts"""
+        while any(bucket.pending for bucket in self._buckets.values()):
+            await asyncio.sleep(self.sync_interval)
+            async with self._flush_lock:
+                await self._flush()
+
+    async def _flush(self) -> None:
+        """Add pending counts to Redis and refresh the cluster-wide totals"""
+        current = int(time.time() // self.period)
+        # Drop buckets from past windows that have nothing left to send
+        for key, bucket in list(self._buckets.items()):
+            if bucket.window < current and not bucket.pending:
+                del self._buckets[key]
+
+        batch: Dict[str, Tuple[_LocalBucket, int]] = {}
+        for key, bucket in self._buckets.items():
+            if bucket.pending:
+                batch[key] = (bucket, bucket.pending)
+                bucket.in_flight += bucket.pending
+                bucket.pending = 0
+        if not batch:
+            return
+
+        client = self._cache._redis_client
+        try:
+            if client is None:
+                raise ConnectionError("Redis client is not initialized")
+            pipe = client.pipeline(transaction=False)
+            for key, (bucket, count) in batch.items():
+                redis_key = f"{self.prefix}:{key}:{bucket.window}"
+                pipe.incrby(redis_key, count)
+                pipe.expire(redis_key, self.period * 2)
+            results = await pipe.execute()
+        except Exception as e:
+            # Keep counting locally; the counts are retried on the next flush
+            logger.warning(f"Rate limit sync failed: {e}")
+            for bucket, count in batch.values():
+                bucket.in_flight -= count
+                bucket.pending += count
+            return
+
+        for (bucket, count), total in zip(batch.values(), results[::2]):
+            bucket.in_flight -= count
+            bucket.synced = max(bucket.synced, int(total))
+
+
+# Key functions
+def ip_key(request: Request) -> str:
+    """Rate limit by client IP address"""
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+def user_key(request: Request) -> str:
+    """Rate limit by authenticated user, falling back to the client IP"""
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            user_id = decode_token_cached(token).get("user_id")
+        except InvalidTokenException:
+            user_id = None
+        if user_id:
+            return f"user:{user_id}"
+    return ip_key(request)
+
+
+def route_key(request: Request) -> str:
+    """Rate limit each route separately, per client IP"""
+    route = request.scope.get("route")
+    path = getattr(route, "path", request.url.path)
+    return f"route:{request.method}:{path}:{ip_key(request)}"
+
+
+class RateLimit:
+    """
+    FastAPI dependency enforcing a rate limit on the routes it guards.
+
+    Adds RateLimit-* headers to every response and raises a 429 with
+    Retry-After once the limit is exhausted.
+    """
+
+    def __init__(
+        self,
+        limit: int = settings.RATE_LIMIT_REQUESTS_PER_MINUTE,
+        period: int = 60,
+        key_func: Callable[[Request], str] = ip_key,
+        cache: Optional[RedisConnectionManager] = None,
+        mode: str = settings.RATE_LIMIT_MODE,
+    ) -> None:
+        self.key_func = key_func
+        limiter_class = HybridRateLimiter if mode == "hybrid" else RateLimiter
+        self.limiter = limiter_class(cache or redis_manager, limit, period)
+
+    async def __call__(self, request: Request, response: Response) -> None:
+        key = self.key_func(request)
+        result = await self.limiter.check(key)
+        if not result.allowed:
+            logger.warning(f"Rate limit exceeded for {key}")
+            raise RateLimitExceededException(headers=result.headers)
+        response.headers.update(result.headers)
+
+
+rate_limit_dependency = RateLimit()
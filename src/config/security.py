@@ -1,10 +1,25 @@
+import asyncio
+import hashlib
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, TypeVar
 import jwt
 from passlib.context import CryptContext
 from uuid import UUID
+from src.config.cache import LocalCache
+from src.config.metrics import register_cache
 from src.config.settings import settings
-from src.utils.exceptions import InvalidTokenException, TokenExpiredException
+from src.utils.exceptions import (
+    InvalidTokenException,
+    ServiceUnavailableException,
+    TokenExpiredException,
+)
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -146,6 +161,110 @@ class SecurityManager:
         }
 
 
+class PasswordHasher:
+    """
+    Runs bcrypt hashing and verification off the event loop.
+
+    Work is sent to a thread or process pool sized by PASSWORD_HASH_WORKERS.
+    At most PASSWORD_HASH_MAX_PENDING calls may be queued or running; beyond
+    that callers get a ServiceUnavailableException instead of piling up
+    behind a saturated pool.
+    """
+
+    def __init__(self, executor_type: str, max_workers: int, max_pending: int):
+        self._executor_type = executor_type
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="password-hasher",
+                )
+        return self._executor
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if self._pending >= self._max_pending:
+            logger.warning("Password hashing pool saturated, rejecting request")
+            raise ServiceUnavailableException(
+                "Too many authentication requests, please retry shortly"
+            )
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(SecurityManager.hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(
+            SecurityManager.verify_password, plain_password, hashed_password
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    settings.PASSWORD_HASH_EXECUTOR,
+    settings.PASSWORD_HASH_WORKERS,
+    settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
+class TokenVerificationCache:
+    """
+    Per-process cache of verified token payloads.
+
+    Entries are keyed by a SHA-256 digest of the token, so raw tokens are
+    never held in memory, and expire at the token's own `exp` claim.
+    Payloads are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, maxsize: int):
+        self._cache = LocalCache(maxsize, ttl=0)
+
+    @property
+    def hits(self) -> int:
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cache.misses
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        """Decode a token, verifying it only if it is not cached yet"""
+        key = hashlib.sha256(token.encode()).hexdigest()
+        payload = self._cache.get(key)
+        if payload is not None:
+            return payload
+
+        payload = SecurityManager.decode_token(token)
+        ttl = payload.get("exp", 0) - time.time()
+        if ttl > 0:
+            self._cache.set(key, payload, ttl=ttl)
+        return payload
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+token_cache = TokenVerificationCache(settings.TOKEN_CACHE_MAXSIZE)
+register_cache("token", token_cache)
+
+
 # Convenience functions
 def hash_password(password: str) -> str:
     """Hash a password"""
@@ -157,6 +276,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return SecurityManager.verify_password(plain_password, hashed_password)
 
 
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the password hashing pool"""
+    return await password_hasher.hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the password hashing pool"""
+    return await password_hasher.verify(plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create an access token"""
     return SecurityManager.create_access_token(data, expires_delta)
@@ -170,3 +299,8 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None)
 def decode_token(token: str) -> Dict[str, Any]:
     """Decode a JWT token"""
     return SecurityManager.decode_token(token)
+
+
+def decode_token_cached(token: str) -> Dict[str, Any]:
+    """Decode a JWT token through the per-process verification cache"""
+    return token_cache.decode(token)
@@ -1,6 +1,12 @@
 from logging import getLogger
 from src.config.database import sessionmanager
 from src.config.cache import redis_manager
+from src.config.security import password_hasher
+from src.config.settings import settings
+from src.messaging.outbox_relay import outbox_relay
+from src.messaging.producer import rabbitmq_producer
+from src.services.email_service import emailer
+from src.services.s3_service import s3_service
 from src.utils.logging import setup_logging
 
 logger = getLogger(__name__)
@@ -9,12 +15,22 @@ async def start_up() -> None:
     """Run on application startup"""
     logger.info("application_starting")
     setup_logging()
-    sessionmanager.connect()
+    await sessionmanager.warm_up()
+    logger.info(f"db_pool_status {sessionmanager.pool_status()}")
     await redis_manager.connect()
+    emailer.precompile_templates()
+    await s3_service.start()
+    if settings.OUTBOX_RELAY_ENABLED:
+        outbox_relay.start()
 
 async def shut_down() -> None:
     """Run on application shutdown"""
     logger.info("application_shutting_down")
+    await outbox_relay.stop()
+    await rabbitmq_producer.close()
+    await emailer.close()
+    await s3_service.close()
     if sessionmanager._engine is not None:
         await sessionmanager.close()
-    await redis_manager.close()
\ No newline at end of file
+    await redis_manager.close()
+    password_hasher.shutdown()
\ No newline at end of file
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n src/grpc/proto/server/user.proto\x12\x04user\"\'\n\x14GetPreferenceRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"b\n\nPreference\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x10\n\x08language\x18\x02 \x01(\t\x12\x10\n\x08\x63urrency\x18\x03 \x01(\t\x12\x10\n\x08timezone\x18\x04 \x01(\t\x12\r\n\x05theme\x18\x05 \x01(\t\"P\n\x17UpdatePreferenceRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12$\n\npreference\x18\x02 \x01(\x0b\x32\x10.user.Preference\":\n\x12PreferenceResponse\x12$\n\npreference\x18\x01 \x01(\x0b\x32\x10.user.Preference\"h\n\x13NotificationSetting\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x15\n\remail_enabled\x18\x02 \x01(\x08\x12\x13\n\x0bsms_enabled\x18\x03 \x01(\x08\x12\x14\n\x0cpush_enabled\x18\x04 \x01(\x08\"]\n\x19UpdateNotificationRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12/\n\x0cnotification\x18\x02 \x01(\x0b\x32\x19.user.NotificationSetting\"G\n\x14NotificationResponse\x12/\n\x0cnotification\x18\x01 \x01(\x0b\x32\x19.user.NotificationSetting\"b\n\x0ePrivacySetting\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x17\n\x0fprofile_visible\x18\x02 \x01(\x08\x12\x12\n\nshow_email\x18\x03 \x01(\x08\x12\x12\n\nshow_phone\x18\x04 \x01(\x08\"N\n\x14UpdatePrivacyRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12%\n\x07privacy\x18\x02 \x01(\x0b\x32\x14.user.PrivacySetting\"8\n\x0fPrivacyResponse\x12%\n\x07privacy\x18\x01 \x01(\x0b\x32\x14.user.PrivacySetting\"\xae\x01\n\x07\x43onsent\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\x14\n\x0c\x63onsent_type\x18\x03 \x01(\t\x12\x0f\n\x07granted\x18\x04 \x01(\x08\x12\x0f\n\x07version\x18\x05 \x01(\t\x12\x12\n\nip_address\x18\x06 \x01(\t\x12\x12\n\nuser_agent\x18\x07 \x01(\t\x12\x12\n\ngranted_at\x18\x08 \x01(\t\x12\x12\n\nrevoked_at\x18\t \x01(\t\"\x87\x01\n\x14\x43reateConsentRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x14\n\x0c\x63onsent_type\x18\x02 \x01(\t\x12\x0f\n\x07granted\x18\x03 \x01(\x08\x12\x0f\n\x07version\x18\x04 \x01(\t\x12\x12\n\nip_address\x18\x05 \x01(\t\x12\x12\n\nuser_agent\x18\x06 \x01(\t\"7\n\x15\x43reateConsentResponse\x12\x1e\n\x07\x63onsent\x18\x01 \x01(\x0b\x32\r.user.Consent\"+\n\x18GetConsentHistoryRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"<\n\x19GetConsentHistoryResponse\x12\x1f\n\x08\x63onsents\x18\x01 \x03(\x0b\x32\r.user.Consent\"@\n\x17GetLatestConsentRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x14\n\x0c\x63onsent_type\x18\x02 \x01(\t\":\n\x18GetLatestConsentResponse\x12\x1e\n\x07\x63onsent\x18\x01 \x01(\x0b\x32\r.user.Consent2\xdd\x05\n\x15UserPreferenceService\x12\x45\n\rGetPreference\x12\x1a.user.GetPreferenceRequest\x1a\x18.user.PreferenceResponse\x12K\n\x10UpdatePreference\x12\x1d.user.UpdatePreferenceRequest\x1a\x18.user.PreferenceResponse\x12P\n\x16GetNotificationSetting\x12\x1a.user.GetPreferenceRequest\x1a\x1a.user.NotificationResponse\x12X\n\x19UpdateNotificationSetting\x12\x1f.user.UpdateNotificationRequest\x1a\x1a.user.NotificationResponse\x12\x46\n\x11GetPrivacySetting\x12\x1a.user.GetPreferenceRequest\x1a\x15.user.PrivacyResponse\x12I\n\x14UpdatePrivacySetting\x12\x1a.user.UpdatePrivacyRequest\x1a\x15.user.PrivacyResponse\x12H\n\rCreateConsent\x12\x1a.user.CreateConsentRequest\x1a\x1b.user.CreateConsentResponse\x12T\n\x11GetConsentHistory\x12\x1e.user.GetConsentHistoryRequest\x1a\x1f.user.GetConsentHistoryResponse\x12Q\n\x10GetLatestConsent\x12\x1d.user.GetLatestConsentRequest\x1a\x1e.user.GetLatestConsentResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n src/grpc/proto/server/user.proto\x12\x04user\"\'\n\x14GetPreferenceRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"b\n\nPreference\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x10\n\x08language\x18\x02 \x01(\t\x12\x10\n\x08\x63urrency\x18\x03 \x01(\t\x12\x10\n\x08timezone\x18\x04 \x01(\t\x12\r\n\x05theme\x18\x05 \x01(\t\"P\n\x17UpdatePreferenceRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12$\n\npreference\x18\x02 \x01(\x0b\x32\x10.user.Preference\":\n\x12PreferenceResponse\x12$\n\npreference\x18\x01 \x01(\x0b\x32\x10.user.Preference\"\xaa\x01\n\x13NotificationSetting\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x1a\n\remail_enabled\x18\x02 \x01(\x08H\x00\x88\x01\x01\x12\x18\n\x0bsms_enabled\x18\x03 \x01(\x08H\x01\x88\x01\x01\x12\x19\n\x0cpush_enabled\x18\x04 \x01(\x08H\x02\x88\x01\x01\x42\x10\n\x0e_email_enabledB\x0e\n\x0c_sms_enabledB\x0f\n\r_push_enabled\"]\n\x19UpdateNotificationRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12/\n\x0cnotification\x18\x02 \x01(\x0b\x32\x19.user.NotificationSetting\"G\n\x14NotificationResponse\x12/\n\x0cnotification\x18\x01 \x01(\x0b\x32\x19.user.NotificationSetting\"\xa3\x01\n\x0ePrivacySetting\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x1c\n\x0fprofile_visible\x18\x02 \x01(\x08H\x00\x88\x01\x01\x12\x17\n\nshow_email\x18\x03 \x01(\x08H\x01\x88\x01\x01\x12\x17\n\nshow_phone\x18\x04 \x01(\x08H\x02\x88\x01\x01\x42\x12\n\x10_profile_visibleB\r\n\x0b_show_emailB\r\n\x0b_show_phone\"N\n\x14UpdatePrivacyRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12%\n\x07privacy\x18\x02 \x01(\x0b\x32\x14.user.PrivacySetting\"8\n\x0fPrivacyResponse\x12%\n\x07privacy\x18\x01 \x01(\x0b\x32\x14.user.PrivacySetting\"#\n\x0f\x42\x61tchGetRequest\x12\x10\n\x08user_ids\x18\x01 \x03(\t\"Z\n\x17\x42\x61tchPreferenceResponse\x12%\n\x0bpreferences\x18\x01 \x03(\x0b\x32\x10.user.Preference\x12\x18\n\x10missing_user_ids\x18\x02 \x03(\t\"g\n\x19\x42\x61tchNotificationResponse\x12\x30\n\rnotifications\x18\x01 \x03(\x0b\x32\x19.user.NotificationSetting\x12\x18\n\x10missing_user_ids\x18\x02 \x03(\t\"`\n\x14\x42\x61tchPrivacyResponse\x12.\n\x10privacy_settings\x18\x01 \x03(\x0b\x32\x14.user.PrivacySetting\x12\x18\n\x10missing_user_ids\x18\x02 \x03(\t\"?\n\x15GetAllSettingsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x15\n\rif_none_match\x18\x02 \x01(\t\"\xb7\x01\n\x13\x41llSettingsResponse\x12$\n\npreference\x18\x01 \x01(\x0b\x32\x10.user.Preference\x12/\n\x0cnotification\x18\x02 \x01(\x0b\x32\x19.user.NotificationSetting\x12%\n\x07privacy\x18\x03 \x01(\x0b\x32\x14.user.PrivacySetting\x12\x0c\n\x04\x65tag\x18\x04 \x01(\t\x12\x14\n\x0cnot_modified\x18\x05 \x01(\x08\"\xe0\x05\n\x12NotificationFilter\x12\x1a\n\remail_enabled\x18\x01 \x01(\x08H\x00\x88\x01\x01\x12%\n\x18\x65mail_transaction_alerts\x18\x02 \x01(\x08H\x01\x88\x01\x01\x12\"\n\x15\x65mail_security_alerts\x18\x03 \x01(\x08H\x02\x88\x01\x01\x12\x1c\n\x0f\x65mail_marketing\x18\x04 \x01(\x08H\x03\x88\x01\x01\x12\"\n\x15\x65mail_product_updates\x18\x05 \x01(\x08H\x04\x88\x01\x01\x12\x18\n\x0bsms_enabled\x18\x06 \x01(\x08H\x05\x88\x01\x01\x12#\n\x16sms_transaction_alerts\x18\x07 \x01(\x08H\x06\x88\x01\x01\x12 \n\x13sms_security_alerts\x18\x08 \x01(\x08H\x07\x88\x01\x01\x12\x1a\n\rsms_marketing\x18\t \x01(\x08H\x08\x88\x01\x01\x12\x19\n\x0cpush_enabled\x18\n \x01(\x08H\t\x88\x01\x01\x12$\n\x17push_transaction_alerts\x18\x0b \x01(\x08H\n\x88\x01\x01\x12!\n\x14push_security_alerts\x18\x0c \x01(\x08H\x0b\x88\x01\x01\x12\x1b\n\x0epush_marketing\x18\r \x01(\x08H\x0c\x88\x01\x01\x42\x10\n\x0e_email_enabledB\x1b\n\x19_email_transaction_alertsB\x18\n\x16_email_security_alertsB\x12\n\x10_email_marketingB\x18\n\x16_email_product_updatesB\x0e\n\x0c_sms_enabledB\x19\n\x17_sms_transaction_alertsB\x16\n\x14_sms_security_alertsB\x10\n\x0e_sms_marketingB\x0f\n\r_push_enabledB\x1a\n\x18_push_transaction_alertsB\x17\n\x15_push_security_alertsB\x11\n\x0f_push_marketing\"\x8b\x03\n\rPrivacyFilter\x12\x1c\n\x0fprofile_visible\x18\x01 \x01(\x08H\x00\x88\x01\x01\x12\x17\n\nshow_email\x18\x02 \x01(\x08H\x01\x88\x01\x01\x12\x17\n\nshow_phone\x18\x03 \x01(\x08H\x02\x88\x01\x01\x12%\n\x18show_transaction_history\x18\x04 \x01(\x08H\x03\x88\x01\x01\x12\"\n\x15\x61llow_data_collection\x18\x05 \x01(\x08H\x04\x88\x01\x01\x12\x1c\n\x0f\x61llow_analytics\x18\x06 \x01(\x08H\x05\x88\x01\x01\x12&\n\x19\x61llow_third_party_sharing\x18\x07 \x01(\x08H\x06\x88\x01\x01\x42\x12\n\x10_profile_visibleB\r\n\x0b_show_emailB\r\n\x0b_show_phoneB\x1b\n\x19_show_transaction_historyB\x18\n\x16_allow_data_collectionB\x12\n\x10_allow_analyticsB\x1c\n\x1a_allow_third_party_sharing\"\x8f\x01\n\x15\x45xportAudienceRequest\x12\x35\n\x13notification_filter\x18\x01 \x01(\x0b\x32\x18.user.NotificationFilter\x12+\n\x0eprivacy_filter\x18\x02 \x01(\x0b\x32\x13.user.PrivacyFilter\x12\x12\n\nchunk_size\x18\x03 \x01(\r\"y\n\x0e\x41udienceMember\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12/\n\x0cnotification\x18\x02 \x01(\x0b\x32\x19.user.NotificationSetting\x12%\n\x07privacy\x18\x03 \x01(\x0b\x32\x14.user.PrivacySetting\"<\n\x13\x45xportAudienceChunk\x12%\n\x07members\x18\x01 \x03(\x0b\x32\x14.user.AudienceMember\"\xae\x01\n\x07\x43onsent\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\x14\n\x0c\x63onsent_type\x18\x03 \x01(\t\x12\x0f\n\x07granted\x18\x04 \x01(\x08\x12\x0f\n\x07version\x18\x05 \x01(\t\x12\x12\n\nip_address\x18\x06 \x01(\t\x12\x12\n\nuser_agent\x18\x07 \x01(\t\x12\x12\n\ngranted_at\x18\x08 \x01(\t\x12\x12\n\nrevoked_at\x18\t \x01(\t\"\x87\x01\n\x14\x43reateConsentRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x14\n\x0c\x63onsent_type\x18\x02 \x01(\t\x12\x0f\n\x07granted\x18\x03 \x01(\x08\x12\x0f\n\x07version\x18\x04 \x01(\t\x12\x12\n\nip_address\x18\x05 \x01(\t\x12\x12\n\nuser_agent\x18\x06 \x01(\t\"7\n\x15\x43reateConsentResponse\x12\x1e\n\x07\x63onsent\x18\x01 \x01(\x0b\x32\r.user.Consent\"+\n\x18GetConsentHistoryRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"<\n\x19GetConsentHistoryResponse\x12\x1f\n\x08\x63onsents\x18\x01 \x03(\x0b\x32\r.user.Consent\"@\n\x17GetLatestConsentRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x14\n\x0c\x63onsent_type\x18\x02 \x01(\t\":\n\x18GetLatestConsentResponse\x12\x1e\n\x07\x63onsent\x18\x01 \x01(\x0b\x32\r.user.Consent2\xe3\x08\n\x15UserPreferenceService\x12\x45\n\rGetPreference\x12\x1a.user.GetPreferenceRequest\x1a\x18.user.PreferenceResponse\x12K\n\x10UpdatePreference\x12\x1d.user.UpdatePreferenceRequest\x1a\x18.user.PreferenceResponse\x12P\n\x16GetNotificationSetting\x12\x1a.user.GetPreferenceRequest\x1a\x1a.user.NotificationResponse\x12X\n\x19UpdateNotificationSetting\x12\x1f.user.UpdateNotificationRequest\x1a\x1a.user.NotificationResponse\x12\x46\n\x11GetPrivacySetting\x12\x1a.user.GetPreferenceRequest\x1a\x15.user.PrivacyResponse\x12I\n\x14UpdatePrivacySetting\x12\x1a.user.UpdatePrivacyRequest\x1a\x15.user.PrivacyResponse\x12H\n\x0eGetAllSettings\x12\x1b.user.GetAllSettingsRequest\x1a\x19.user.AllSettingsResponse\x12J\n\x12\x42\x61tchGetPreference\x12\x15.user.BatchGetRequest\x1a\x1d.user.BatchPreferenceResponse\x12U\n\x1b\x42\x61tchGetNotificationSetting\x12\x15.user.BatchGetRequest\x1a\x1f.user.BatchNotificationResponse\x12K\n\x16\x42\x61tchGetPrivacySetting\x12\x15.user.BatchGetRequest\x1a\x1a.user.BatchPrivacyResponse\x12J\n\x0e\x45xportAudience\x12\x1b.user.ExportAudienceRequest\x1a\x19.user.ExportAudienceChunk0\x01\x12H\n\rCreateConsent\x12\x1a.user.CreateConsentRequest\x1a\x1b.user.CreateConsentResponse\x12T\n\x11GetConsentHistory\x12\x1e.user.GetConsentHistoryRequest\x1a\x1f.user.GetConsentHistoryResponse\x12Q\n\x10GetLatestConsent\x12\x1d.user.GetLatestConsentRequest\x1a\x1e.user.GetLatestConsentResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -39,32 +39,54 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_UPDATEPREFERENCEREQUEST']._serialized_end=263
   _globals['_PREFERENCERESPONSE']._serialized_start=265
   _globals['_PREFERENCERESPONSE']._serialized_end=323
-  _globals['_NOTIFICATIONSETTING']._serialized_start=325
-  _globals['_NOTIFICATIONSETTING']._serialized_end=429
-  _globals['_UPDATENOTIFICATIONREQUEST']._serialized_start=431
-  _globals['_UPDATENOTIFICATIONREQUEST']._serialized_end=524
-  _globals['_NOTIFICATIONRESPONSE']._serialized_start=526
-  _globals['_NOTIFICATIONRESPONSE']._serialized_end=597
-  _globals['_PRIVACYSETTING']._serialized_start=599
-  _globals['_PRIVACYSETTING']._serialized_end=697
-  _globals['_UPDATEPRIVACYREQUEST']._serialized_start=699
-  _globals['_UPDATEPRIVACYREQUEST']._serialized_end=777
-  _globals['_PRIVACYRESPONSE']._serialized_start=779
-  _globals['_PRIVACYRESPONSE']._serialized_end=835
-  _globals['_CONSENT']._serialized_start=838
-  _globals['_CONSENT']._serialized_end=1012
-  _globals['_CREATECONSENTREQUEST']._serialized_start=1015
-  _globals['_CREATECONSENTREQUEST']._serialized_end=1150
-  _globals['_CREATECONSENTRESPONSE']._serialized_start=1152
-  _globals['_CREATECONSENTRESPONSE']._serialized_end=1207
-  _globals['_GETCONSENTHISTORYREQUEST']._serialized_start=1209
-  _globals['_GETCONSENTHISTORYREQUEST']._serialized_end=1252
-  _globals['_GETCONSENTHISTORYRESPONSE']._serialized_start=1254
-  _globals['_GETCONSENTHISTORYRESPONSE']._serialized_end=1314
-  _globals['_GETLATESTCONSENTREQUEST']._serialized_start=1316
-  _globals['_GETLATESTCONSENTREQUEST']._serialized_end=1380
-  _globals['_GETLATESTCONSENTRESPONSE']._serialized_start=1382
-  _globals['_GETLATESTCONSENTRESPONSE']._serialized_end=1440
-  _globals['_USERPREFERENCESERVICE']._serialized_start=1443
-  _globals['_USERPREFERENCESERVICE']._serialized_end=2176
+  _globals['_NOTIFICATIONSETTING']._serialized_start=326
+  _globals['_NOTIFICATIONSETTING']._serialized_end=496
+  _globals['_UPDATENOTIFICATIONREQUEST']._serialized_start=498
+  _globals['_UPDATENOTIFICATIONREQUEST']._serialized_end=591
+  _globals['_NOTIFICATIONRESPONSE']._serialized_start=593
+  _globals['_NOTIFICATIONRESPONSE']._serialized_end=664
+  _globals['_PRIVACYSETTING']._serialized_start=667
+  _globals['_PRIVACYSETTING']._serialized_end=830
+  _globals['_UPDATEPRIVACYREQUEST']._serialized_start=832
+  _globals['_UPDATEPRIVACYREQUEST']._serialized_end=910
+  _globals['_PRIVACYRESPONSE']._serialized_start=912
+  _globals['_PRIVACYRESPONSE']._serialized_end=968
+  _globals['_BATCHGETREQUEST']._serialized_start=970
+  _globals['_BATCHGETREQUEST']._serialized_end=1005
+  _globals['_BATCHPREFERENCERESPONSE']._serialized_start=1007
+  _globals['_BATCHPREFERENCERESPONSE']._serialized_end=1097
+  _globals['_BATCHNOTIFICATIONRESPONSE']._serialized_start=1099
+  _globals['_BATCHNOTIFICATIONRESPONSE']._serialized_end=1202
+  _globals['_BATCHPRIVACYRESPONSE']._serialized_start=1204
+  _globals['_BATCHPRIVACYRESPONSE']._serialized_end=1300
+  _globals['_GETALLSETTINGSREQUEST']._serialized_start=1302
+  _globals['_GETALLSETTINGSREQUEST']._serialized_end=1365
+  _globals['_ALLSETTINGSRESPONSE']._serialized_start=1368
+  _globals['_ALLSETTINGSRESPONSE']._serialized_end=1551
+  _globals['_NOTIFICATIONFILTER']._serialized_start=1554
+  _globals['_NOTIFICATIONFILTER']._serialized_end=2290
+  _globals['_PRIVACYFILTER']._serialized_start=2293
+  _globals['_PRIVACYFILTER']._serialized_end=2688
+  _globals['_EXPORTAUDIENCEREQUEST']._serialized_start=2691
+  _globals['_EXPORTAUDIENCEREQUEST']._serialized_end=2834
+  _globals['_AUDIENCEMEMBER']._serialized_start=2836
+  _globals['_AUDIENCEMEMBER']._serialized_end=2957
+  _globals['_EXPORTAUDIENCECHUNK']._serialized_start=2959
+  _globals['_EXPORTAUDIENCECHUNK']._serialized_end=3019
+  _globals['_CONSENT']._serialized_start=3022
+  _globals['_CONSENT']._serialized_end=3196
+  _globals['_CREATECONSENTREQUEST']._serialized_start=3199
+  _globals['_CREATECONSENTREQUEST']._serialized_end=3334
+  _globals['_CREATECONSENTRESPONSE']._serialized_start=3336
+  _globals['_CREATECONSENTRESPONSE']._serialized_end=3391
+  _globals['_GETCONSENTHISTORYREQUEST']._serialized_start=3393
+  _globals['_GETCONSENTHISTORYREQUEST']._serialized_end=3436
+  _globals['_GETCONSENTHISTORYRESPONSE']._serialized_start=3438
+  _globals['_GETCONSENTHISTORYRESPONSE']._serialized_end=3498
+  _globals['_GETLATESTCONSENTREQUEST']._serialized_start=3500
+  _globals['_GETLATESTCONSENTREQUEST']._serialized_end=3564
+  _globals['_GETLATESTCONSENTRESPONSE']._serialized_start=3566
+  _globals['_GETLATESTCONSENTRESPONSE']._serialized_end=3624
+  _globals['_USERPREFERENCESERVICE']._serialized_start=3627
+  _globals['_USERPREFERENCESERVICE']._serialized_end=4750
 # @@protoc_insertion_point(module_scope)
@@ -92,6 +92,132 @@ class PrivacyResponse(_message.Message):
     privacy: PrivacySetting
     def __init__(self, privacy: _Optional[_Union[PrivacySetting, _Mapping]] = ...) -> None: ...
 
+class BatchGetRequest(_message.Message):
+    __slots__ = ("user_ids",)
+    USER_IDS_FIELD_NUMBER: _ClassVar[int]
+    user_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, user_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class BatchPreferenceResponse(_message.Message):
+    __slots__ = ("preferences", "missing_user_ids")
+    PREFERENCES_FIELD_NUMBER: _ClassVar[int]
+    MISSING_USER_IDS_FIELD_NUMBER: _ClassVar[int]
+    preferences: _containers.RepeatedCompositeFieldContainer[Preference]
+    missing_user_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, preferences: _Optional[_Iterable[_Union[Preference, _Mapping]]] = ..., missing_user_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class BatchNotificationResponse(_message.Message):
+    __slots__ = ("notifications", "missing_user_ids")
+    NOTIFICATIONS_FIELD_NUMBER: _ClassVar[int]
+    MISSING_USER_IDS_FIELD_NUMBER: _ClassVar[int]
+    notifications: _containers.RepeatedCompositeFieldContainer[NotificationSetting]
+    missing_user_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, notifications: _Optional[_Iterable[_Union[NotificationSetting, _Mapping]]] = ..., missing_user_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class BatchPrivacyResponse(_message.Message):
+    __slots__ = ("privacy_settings", "missing_user_ids")
+    PRIVACY_SETTINGS_FIELD_NUMBER: _ClassVar[int]
+    MISSING_USER_IDS_FIELD_NUMBER: _ClassVar[int]
+    privacy_settings: _containers.RepeatedCompositeFieldContainer[PrivacySetting]
+    missing_user_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, privacy_settings: _Optional[_Iterable[_Union[PrivacySetting, _Mapping]]] = ..., missing_user_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class GetAllSettingsRequest(_message.Message):
+    __slots__ = ("user_id", "if_none_match")
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    IF_NONE_MATCH_FIELD_NUMBER: _ClassVar[int]
+    user_id: str
+    if_none_match: str
+    def __init__(self, user_id: _Optional[str] = ..., if_none_match: _Optional[str] = ...) -> None: ...
+
+class AllSettingsResponse(_message.Message):
+    __slots__ = ("preference", "notification", "privacy", "etag", "not_modified")
+    PREFERENCE_FIELD_NUMBER: _ClassVar[int]
+    NOTIFICATION_FIELD_NUMBER: _ClassVar[int]
+    PRIVACY_FIELD_NUMBER: _ClassVar[int]
+    ETAG_FIELD_NUMBER: _ClassVar[int]
+    NOT_MODIFIED_FIELD_NUMBER: _ClassVar[int]
+    preference: Preference
+    notification: NotificationSetting
+    privacy: PrivacySetting
+    etag: str
+    not_modified: bool
+    def __init__(self, preference: _Optional[_Union[Preference, _Mapping]] = ..., notification: _Optional[_Union[NotificationSetting, _Mapping]] = ..., privacy: _Optional[_Union[PrivacySetting, _Mapping]] = ..., etag: _Optional[str] = ..., not_modified: bool = ...) -> None: ...
+
+class NotificationFilter(_message.Message):
+    __slots__ = ("email_enabled", "email_transaction_alerts", "email_security_alerts", "email_marketing", "email_product_updates", "sms_enabled", "sms_transaction_alerts", "sms_security_alerts", "sms_marketing", "push_enabled", "push_transaction_alerts", "push_security_alerts", "push_marketing")
+    EMAIL_ENABLED_FIELD_NUMBER: _ClassVar[int]
+    EMAIL_TRANSACTION_ALERTS_FIELD_NUMBER: _ClassVar[int]
+    EMAIL_SECURITY_ALERTS_FIELD_NUMBER: _ClassVar[int]
+    EMAIL_MARKETING_FIELD_NUMBER: _ClassVar[int]
+    EMAIL_PRODUCT_UPDATES_FIELD_NUMBER: _ClassVar[int]
+    SMS_ENABLED_FIELD_NUMBER: _ClassVar[int]
+    SMS_TRANSACTION_ALERTS_FIELD_NUMBER: _ClassVar[int]
+    SMS_SECURITY_ALERTS_FIELD_NUMBER: _ClassVar[int]
+    SMS_MARKETING_FIELD_NUMBER: _ClassVar[int]
+    PUSH_ENABLED_FIELD_NUMBER: _ClassVar[int]
+    PUSH_TRANSACTION_ALERTS_FIELD_NUMBER: _ClassVar[int]
+    PUSH_SECURITY_ALERTS_FIELD_NUMBER: _ClassVar[int]
+    PUSH_MARKETING_FIELD_NUMBER: _ClassVar[int]
+    email_enabled: bool
+    email_transaction_alerts: bool
+    email_security_alerts: bool
+    email_marketing: bool
+    email_product_updates: bool
+    sms_enabled: bool
+    sms_transaction_alerts: bool
+    sms_security_alerts: bool
+    sms_marketing: bool
+    push_enabled: bool
+    push_transaction_alerts: bool
+    push_security_alerts: bool
+    push_marketing: bool
+    def __init__(self, email_enabled: bool = ..., email_transaction_alerts: bool = ..., email_security_alerts: bool = ..., email_marketing: bool = ..., email_product_updates: bool = ..., sms_enabled: bool = ..., sms_transaction_alerts: bool = ..., sms_security_alerts: bool = ..., sms_marketing: bool = ..., push_enabled: bool = ..., push_transaction_alerts: bool = ..., push_security_alerts: bool = ..., push_marketing: bool = ...) -> None: ...
+
+class PrivacyFilter(_message.Message):
+    __slots__ = ("profile_visible", "show_email", "show_phone", "show_transaction_history", "allow_data_collection", "allow_analytics", "allow_third_party_sharing")
+    PROFILE_VISIBLE_FIELD_NUMBER: _ClassVar[int]
+    SHOW_EMAIL_FIELD_NUMBER: _ClassVar[int]
+    SHOW_PHONE_FIELD_NUMBER: _ClassVar[int]
+    SHOW_TRANSACTION_HISTORY_FIELD_NUMBER: _ClassVar[int]
+    ALLOW_DATA_COLLECTION_FIELD_NUMBER: _ClassVar[int]
+    ALLOW_ANALYTICS_FIELD_NUMBER: _ClassVar[int]
+    ALLOW_THIRD_PARTY_SHARING_FIELD_NUMBER: _ClassVar[int]
+    profile_visible: bool
+    show_email: bool
+    show_phone: bool
+    show_transaction_history: bool
+    allow_data_collection: bool
+    allow_analytics: bool
+    allow_third_party_sharing: bool
+    def __init__(self, profile_visible: bool = ..., show_email: bool = ..., show_phone: bool = ..., show_transaction_history: bool = ..., allow_data_collection: bool = ..., allow_analytics: bool = ..., allow_third_party_sharing: bool = ...) -> None: ...
+
+class ExportAudienceRequest(_message.Message):
+    __slots__ = ("notification_filter", "privacy_filter", "chunk_size")
+    NOTIFICATION_FILTER_FIELD_NUMBER: _ClassVar[int]
+    PRIVACY_FILTER_FIELD_NUMBER: _ClassVar[int]
+    CHUNK_SIZE_FIELD_NUMBER: _ClassVar[int]
+    notification_filter: NotificationFilter
+    privacy_filter: PrivacyFilter
+    chunk_size: int
+    def __init__(self, notification_filter: _Optional[_Union[NotificationFilter, _Mapping]] = ..., privacy_filter: _Optional[_Union[PrivacyFilter, _Mapping]] = ..., chunk_size: _Optional[int] = ...) -> None: ...
+
+class AudienceMember(_message.Message):
+    __slots__ = ("user_id", "notification", "privacy")
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    NOTIFICATION_FIELD_NUMBER: _ClassVar[int]
+    PRIVACY_FIELD_NUMBER: _ClassVar[int]
+    user_id: str
+    notification: NotificationSetting
+    privacy: PrivacySetting
+    def __init__(self, user_id: _Optional[str] = ..., notification: _Optional[_Union[NotificationSetting, _Mapping]] = ..., privacy: _Optional[_Union[PrivacySetting, _Mapping]] = ...) -> None: ...
+
+class ExportAudienceChunk(_message.Message):
+    __slots__ = ("members",)
+    MEMBERS_FIELD_NUMBER: _ClassVar[int]
+    members: _containers.RepeatedCompositeFieldContainer[AudienceMember]
+    def __init__(self, members: _Optional[_Iterable[_Union[AudienceMember, _Mapping]]] = ...) -> None: ...
+
 class Consent(_message.Message):
     __slots__ = ("id", "user_id", "consent_type", "granted", "version", "ip_address", "user_agent", "granted_at", "revoked_at")
     ID_FIELD_NUMBER: _ClassVar[int]
@@ -65,6 +65,31 @@ class UserPreferenceServiceStub(object):
                 request_serializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.UpdatePrivacyRequest.SerializeToString,
                 response_deserializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.PrivacyResponse.FromString,
                 _registered_method=True)
+        self.GetAllSettings = channel.unary_unary(
+                '/user.UserPreferenceService/GetAllSettings',
+                request_serializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.GetAllSettingsRequest.SerializeToString,
+                response_deserializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.AllSettingsResponse.FromString,
+                _registered_method=True)
+        self.BatchGetPreference = channel.unary_unary(
+                '/user.UserPreferenceService/BatchGetPreference',
+                request_serializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchGetRequest.SerializeToString,
+                response_deserializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchPreferenceResponse.FromString,
+                _registered_method=True)
+        self.BatchGetNotificationSetting = channel.unary_unary(
+                '/user.UserPreferenceService/BatchGetNotificationSetting',
+                request_serializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchGetRequest.SerializeToString,
+                response_deserializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchNotificationResponse.FromString,
+                _registered_method=True)
+        self.BatchGetPrivacySetting = channel.unary_unary(
+                '/user.UserPreferenceService/BatchGetPrivacySetting',
+                request_serializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchGetRequest.SerializeToString,
+                response_deserializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchPrivacyResponse.FromString,
+                _registered_method=True)
+        self.ExportAudience = channel.unary_stream(
+                '/user.UserPreferenceService/ExportAudience',
+                request_serializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.ExportAudienceRequest.SerializeToString,
+                response_deserializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.ExportAudienceChunk.FromString,
+                _registered_method=True)
         self.CreateConsent = channel.unary_unary(
                 '/user.UserPreferenceService/CreateConsent',
                 request_serializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.CreateConsentRequest.SerializeToString,
@@ -122,6 +147,36 @@ class UserPreferenceServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetAllSettings(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchGetPreference(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchGetNotificationSetting(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchGetPrivacySetting(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ExportAudience(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CreateConsent(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -173,6 +228,31 @@ def add_UserPreferenceServiceServicer_to_server(servicer, server):
                     request_deserializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.UpdatePrivacyRequest.FromString,
                     response_serializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.PrivacyResponse.SerializeToString,
             ),
+            'GetAllSettings': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetAllSettings,
+                    request_deserializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.GetAllSettingsRequest.FromString,
+                    response_serializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.AllSettingsResponse.SerializeToString,
+            ),
+            'BatchGetPreference': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchGetPreference,
+                    request_deserializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchGetRequest.FromString,
+                    response_serializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchPreferenceResponse.SerializeToString,
+            ),
+            'BatchGetNotificationSetting': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchGetNotificationSetting,
+                    request_deserializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchGetRequest.FromString,
+                    response_serializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchNotificationResponse.SerializeToString,
+            ),
+            'BatchGetPrivacySetting': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchGetPrivacySetting,
+                    request_deserializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchGetRequest.FromString,
+                    response_serializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchPrivacyResponse.SerializeToString,
+            ),
+            'ExportAudience': grpc.unary_stream_rpc_method_handler(
+                    servicer.ExportAudience,
+                    request_deserializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.ExportAudienceRequest.FromString,
+                    response_serializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.ExportAudienceChunk.SerializeToString,
+            ),
             'CreateConsent': grpc.unary_unary_rpc_method_handler(
                     servicer.CreateConsent,
                     request_deserializer=src_dot_grpc_dot_proto_dot_server_dot_user__pb2.CreateConsentRequest.FromString,
@@ -362,6 +442,141 @@ class UserPreferenceService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetAllSettings(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/user.UserPreferenceService/GetAllSettings',
+            src_dot_grpc_dot_proto_dot_server_dot_user__pb2.GetAllSettingsRequest.SerializeToString,
+            src_dot_grpc_dot_proto_dot_server_dot_user__pb2.AllSettingsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BatchGetPreference(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/user.UserPreferenceService/BatchGetPreference',
+            src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchGetRequest.SerializeToString,
+            src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchPreferenceResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BatchGetNotificationSetting(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/user.UserPreferenceService/BatchGetNotificationSetting',
+            src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchGetRequest.SerializeToString,
+            src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchNotificationResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BatchGetPrivacySetting(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/user.UserPreferenceService/BatchGetPrivacySetting',
+            src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchGetRequest.SerializeToString,
+            src_dot_grpc_dot_proto_dot_server_dot_user__pb2.BatchPrivacyResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ExportAudience(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/user.UserPreferenceService/ExportAudience',
+            src_dot_grpc_dot_proto_dot_server_dot_user__pb2.ExportAudienceRequest.SerializeToString,
+            src_dot_grpc_dot_proto_dot_server_dot_user__pb2.ExportAudienceChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def CreateConsent(request,
             target,
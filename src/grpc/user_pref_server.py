@@ -6,8 +6,18 @@ from uuid import UUID
 import grpc
 
 from src.grpc.proto.server import user_pb2, user_pb2_grpc
-from src.config.database import sessionmanager
+from src.config.database import engine_options, sessionmanager
+from src.config.cache import redis_manager
+from src.config.metrics import MetricsInterceptor, start_metrics_server
+from src.config.settings import settings
+from src.messaging.outbox_relay import outbox_relay
+from src.messaging.producer import rabbitmq_producer
 from src.repositories.preference_repo import PreferenceRepository
+from src.services.preference_service import (
+    ALL_SETTINGS,
+    PreferenceService,
+    settings_etag,
+)
 from src.schemas.user_preference import (
     UserPreferenceUpdate,
     NotificationSettingUpdate,
@@ -18,6 +28,34 @@ from src.schemas.user_preference import (
 logger = logging.getLogger("user_pref_grpc")
 
 
+async def _parse_user_ids(request, context):
+    """Validate and parse the user ids of a batch request"""
+    if len(request.user_ids) > settings.GRPC_BATCH_MAX_SIZE:
+        await context.abort(
+            grpc.StatusCode.INVALID_ARGUMENT,
+            f"At most {settings.GRPC_BATCH_MAX_SIZE} user_ids per request",
+        )
+    try:
+        return [UUID(user_id) for user_id in request.user_ids]
+    except ValueError:
+        await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid user_id format")
+
+
+def _sent_fields(message) -> dict:
+    """
+    Settings fields the caller actually sent, for a partial update.
+
+    Optional fields count when set, even to false; plain string fields only
+    when non-empty. Fields left out must stay out of the update model, since
+    an explicit None would be written as NULL.
+    """
+    return {
+        field.name: value
+        for field, value in message.ListFields()
+        if field.name != "user_id"
+    }
+
+
 class UserPreferenceServiceServicer(user_pb2_grpc.UserPreferenceServiceServicer):
     async def GetPreference(self, request, context):
         """Get user preferences"""
@@ -54,19 +92,14 @@ class UserPreferenceServiceServicer(user_pb2_grpc.UserPreferenceServiceServicer)
                 grpc.StatusCode.INVALID_ARGUMENT, "Invalid user_id format"
             )
 
-        p = request.preference
-
         # Convert proto message to Pydantic model
-        update_data = UserPreferenceUpdate(
-            language=p.language if p.language else None,
-            currency=p.currency if p.currency else None,
-            timezone=p.timezone if p.timezone else None,
-            theme=p.theme if p.theme else None,
-        )
+        update_data = UserPreferenceUpdate(**_sent_fields(request.preference))
 
         async with sessionmanager.session() as session:
             repo = PreferenceRepository(session)
-            pref = await repo.update_user_preference(user_id, update_data)
+            pref = await PreferenceService(repo, redis_manager).update_preferences(
+                user_id, update_data
+            )
 
         return user_pb2.PreferenceResponse(
             preference=user_pb2.Preference(
@@ -112,18 +145,16 @@ class UserPreferenceServiceServicer(user_pb2_grpc.UserPreferenceServiceServicer)
                 grpc.StatusCode.INVALID_ARGUMENT, "Invalid user_id format"
             )
 
-        n = request.notification
-
         # Convert proto to Pydantic
         update_data = NotificationSettingUpdate(
-            email_enabled=n.email_enabled if n.HasField("email_enabled") else None,
-            sms_enabled=n.sms_enabled if n.HasField("sms_enabled") else None,
-            push_enabled=n.push_enabled if n.HasField("push_enabled") else None,
+            **_sent_fields(request.notification)
         )
 
         async with sessionmanager.session() as session:
             repo = PreferenceRepository(session)
-            setting = await repo.update_notification_setting(user_id, update_data)
+            setting = await PreferenceService(
+                repo, redis_manager
+            ).update_notification_settings(user_id, update_data)
 
         return user_pb2.NotificationResponse(
             notification=user_pb2.NotificationSetting(
@@ -168,20 +199,14 @@ class UserPreferenceServiceServicer(user_pb2_grpc.UserPreferenceServiceServicer)
                 grpc.StatusCode.INVALID_ARGUMENT, "Invalid user_id format"
             )
 
-        p = request.privacy
-
         # Convert proto to Pydantic
-        update_data = PrivacySettingUpdate(
-            profile_visible=(
-                p.profile_visible if p.HasField("profile_visible") else None
-            ),
-            show_email=p.show_email if p.HasField("show_email") else None,
-            show_phone=p.show_phone if p.HasField("show_phone") else None,
-        )
+        update_data = PrivacySettingUpdate(**_sent_fields(request.privacy))
 
         async with sessionmanager.session() as session:
             repo = PreferenceRepository(session)
-            setting = await repo.update_privacy_setting(user_id, update_data)
+            setting = await PreferenceService(
+                repo, redis_manager
+            ).update_privacy_settings(user_id, update_data)
 
         return user_pb2.PrivacyResponse(
             privacy=user_pb2.PrivacySetting(
@@ -192,6 +217,178 @@ class UserPreferenceServiceServicer(user_pb2_grpc.UserPreferenceServiceServicer)
             )
         )
 
+    async def GetAllSettings(self, request, context):
+        """Get preferences, notification and privacy settings together"""
+        try:
+            user_id = UUID(request.user_id)
+        except ValueError:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "Invalid user_id format"
+            )
+
+        async with sessionmanager.session() as session:
+            service = PreferenceService(PreferenceRepository(session), redis_manager)
+            if request.if_none_match:
+                # Answered from the version mirror, before any query
+                etag = await service.get_cached_etag(user_id, *ALL_SETTINGS)
+                if etag == request.if_none_match:
+                    return user_pb2.AllSettingsResponse(etag=etag, not_modified=True)
+            bundle = await service.get_all_settings(user_id)
+
+        etag = settings_etag(
+            user_id,
+            bundle.preferences.version,
+            bundle.notifications.version,
+            bundle.privacy.version,
+        )
+        if request.if_none_match == etag:
+            return user_pb2.AllSettingsResponse(etag=etag, not_modified=True)
+
+        pref, notification, privacy = (
+            bundle.preferences,
+            bundle.notifications,
+            bundle.privacy,
+        )
+        return user_pb2.AllSettingsResponse(
+            preference=user_pb2.Preference(
+                user_id=str(pref.user_id),
+                language=pref.language or "",
+                currency=pref.currency or "",
+                timezone=pref.timezone or "",
+                theme=pref.theme or "",
+            ),
+            notification=user_pb2.NotificationSetting(
+                user_id=str(notification.user_id),
+                email_enabled=notification.email_enabled,
+                sms_enabled=notification.sms_enabled,
+                push_enabled=notification.push_enabled,
+            ),
+            privacy=user_pb2.PrivacySetting(
+                user_id=str(privacy.user_id),
+                profile_visible=privacy.profile_visible,
+                show_email=privacy.show_email,
+                show_phone=privacy.show_phone,
+            ),
+            etag=etag,
+        )
+
+    async def BatchGetPreference(self, request, context):
+        """Get preferences for many users"""
+        user_ids = await _parse_user_ids(request, context)
+
+        async with sessionmanager.session() as session:
+            repo = PreferenceRepository(session)
+            prefs, missing = await PreferenceService(
+                repo, redis_manager
+            ).get_many_preferences(user_ids)
+
+        return user_pb2.BatchPreferenceResponse(
+            preferences=[
+                user_pb2.Preference(
+                    user_id=str(pref.user_id),
+                    language=pref.language or "",
+                    currency=pref.currency or "",
+                    timezone=pref.timezone or "",
+                    theme=pref.theme or "",
+                )
+                for pref in prefs
+            ],
+            missing_user_ids=[str(user_id) for user_id in missing],
+        )
+
+    async def BatchGetNotificationSetting(self, request, context):
+        """Get notification settings for many users"""
+        user_ids = await _parse_user_ids(request, context)
+
+        async with sessionmanager.session() as session:
+            repo = PreferenceRepository(session)
+            found, missing = await PreferenceService(
+                repo, redis_manager
+            ).get_many_notification_settings(user_ids)
+
+        return user_pb2.BatchNotificationResponse(
+            notifications=[
+                user_pb2.NotificationSetting(
+                    user_id=str(setting.user_id),
+                    email_enabled=setting.email_enabled,
+                    sms_enabled=setting.sms_enabled,
+                    push_enabled=setting.push_enabled,
+                )
+                for setting in found
+            ],
+            missing_user_ids=[str(user_id) for user_id in missing],
+        )
+
+    async def BatchGetPrivacySetting(self, request, context):
+        """Get privacy settings for many users"""
+        user_ids = await _parse_user_ids(request, context)
+
+        async with sessionmanager.session() as session:
+            repo = PreferenceRepository(session)
+            found, missing = await PreferenceService(
+                repo, redis_manager
+            ).get_many_privacy_settings(user_ids)
+
+        return user_pb2.BatchPrivacyResponse(
+            privacy_settings=[
+                user_pb2.PrivacySetting(
+                    user_id=str(setting.user_id),
+                    profile_visible=setting.profile_visible,
+                    show_email=setting.show_email,
+                    show_phone=setting.show_phone,
+                )
+                for setting in found
+            ],
+            missing_user_ids=[str(user_id) for user_id in missing],
+        )
+
+    async def ExportAudience(self, request, context):
+        """Stream users whose notification and privacy settings match a filter"""
+        chunk_size = min(
+            request.chunk_size or settings.GRPC_EXPORT_CHUNK_SIZE,
+            settings.GRPC_EXPORT_MAX_CHUNK_SIZE,
+        )
+        # Only flags explicitly set on the filter are applied
+        notification_filters = {
+            field.name: value
+            for field, value in request.notification_filter.ListFields()
+        }
+        privacy_filters = {
+            field.name: value for field, value in request.privacy_filter.ListFields()
+        }
+
+        async with sessionmanager.session() as session:
+            repo = PreferenceRepository(session)
+            # Each yield waits until gRPC can send the chunk, so a slow
+            # consumer pauses the cursor instead of buffering the table
+            async for rows in repo.stream_audience(
+                notification_filters, privacy_filters, chunk_size
+            ):
+                yield user_pb2.ExportAudienceChunk(
+                    members=[
+                        user_pb2.AudienceMember(
+                            user_id=str(notification.user_id),
+                            notification=user_pb2.NotificationSetting(
+                                user_id=str(notification.user_id),
+                                email_enabled=notification.email_enabled,
+                                sms_enabled=notification.sms_enabled,
+                                push_enabled=notification.push_enabled,
+                            ),
+                            privacy=(
+                                user_pb2.PrivacySetting(
+                                    user_id=str(privacy.user_id),
+                                    profile_visible=privacy.profile_visible,
+                                    show_email=privacy.show_email,
+                                    show_phone=privacy.show_phone,
+                                )
+                                if privacy is not None
+                                else None
+                            ),
+                        )
+                        for notification, privacy in rows
+                    ]
+                )
+
     async def CreateConsent(self, request, context):
         """Create a consent record"""
         try:
@@ -306,7 +503,13 @@ class UserPreferenceServiceServicer(user_pb2_grpc.UserPreferenceServiceServicer)
 
 
 async def serve(host: str = "0.0.0.0", port: int = 50051):
-    server = grpc.aio.server()
+    # The gRPC server sizes its own pool (GRPC_DB_* settings)
+    await sessionmanager.reconfigure(engine_options(grpc=True))
+    await sessionmanager.warm_up()
+    # Updates write through the settings cache shared with the HTTP app
+    await redis_manager.connect()
+    start_metrics_server(settings.GRPC_METRICS_PORT)
+    server = grpc.aio.server(interceptors=[MetricsInterceptor()])
     user_pb2_grpc.add_UserPreferenceServiceServicer_to_server(
         UserPreferenceServiceServicer(), server
     )
@@ -314,7 +517,15 @@ async def serve(host: str = "0.0.0.0", port: int = 50051):
     server.add_insecure_port(listen_addr)
     logger.info(f"gRPC server listening on {listen_addr}")
     await server.start()
-    await server.wait_for_termination()
+    if settings.OUTBOX_RELAY_ENABLED:
+        outbox_relay.start()
+    try:
+        await server.wait_for_termination()
+    finally:
+        await outbox_relay.stop()
+        await rabbitmq_producer.close()
+        await redis_manager.close()
+        await sessionmanager.close()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,12 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from src.config.settings import settings
 from src.config.database import sessionmanager
 from src.config.cache import redis_manager
+from src.config.metrics import MetricsMiddleware, metrics_endpoint
 from src.utils.logging import setup_logging
+from src.utils.serialization import JSONResponse
 from src.dependencies import start_up, shut_down
 from logging import getLogger
 from src.routes.root_route import api_router
@@ -23,7 +24,12 @@ async def lifespan(app: FastAPI):
     await shut_down()
 
 
-app = FastAPI(title=settings.SERVICE_NAME, debug=settings.DEBUG, lifespan=lifespan)
+app = FastAPI(
+    title=settings.SERVICE_NAME,
+    debug=settings.DEBUG,
+    lifespan=lifespan,
+    default_response_class=JSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -32,6 +38,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=settings.CORS_HEADERS,
 )
+app.add_middleware(MetricsMiddleware)
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -54,10 +61,13 @@ async def root():
     return {"message": "Welcome to User-service", "status": "active"}
 
 
+app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return {"status": "healthy", "db_pool": sessionmanager.pool_status()}
 
 
 app.include_router(api_router, prefix="/api/v1") 
\ No newline at end of file
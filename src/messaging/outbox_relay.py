@@ -0,0 +1,134 @@
+import asyncio
+from logging import getLogger
+from typing import Callable, Optional
+
+from ..config.database import sessionmanager
+from ..config.settings import settings
+from ..repositories.outbox_repo import OutboxRepository
+from ..utils.serialization import dumps
+from .producer import RabbitMQProducer, rabbitmq_producer
+
+logger = getLogger(__name__)
+
+
+class OutboxRelay:
+    """
+    Publishes outbox events to RabbitMQ in the background.
+
+    Each pass claims a batch with SKIP LOCKED, publishes it with publisher
+    confirms and deletes the confirmed rows in the same transaction. A crash
+    between the broker confirm and the commit leaves the rows in place, so
+    they are published again: delivery is at-least-once, and every message
+    carries the event id as message_id for consumers to deduplicate on.
+
+    When only some events in a batch fail, the rest are still deleted and
+    each failure is counted on its row; after max_attempts the event is
+    skipped, so one bad event cannot hold up the outbox. When the whole
+    batch fails the broker is most likely down, so nothing is counted.
+    """
+
+    def __init__(
+        self,
+        producer: RabbitMQProducer = rabbitmq_producer,
+        session_factory: Callable = sessionmanager.session,
+        batch_size: int = settings.OUTBOX_BATCH_SIZE,
+        poll_interval: float = settings.OUTBOX_POLL_INTERVAL,
+        max_attempts: int = settings.OUTBOX_MAX_ATTEMPTS,
+    ):
+        self.producer = producer
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self._task: Optional[asyncio.Task] = None
+
+    async def relay_once(self) -> int:
+        """Publish one batch and return how many events were sent"""
+        async with self.session_factory() as session:
+            repo = OutboxRepository(session)
+            events = await repo.claim_batch(self.batch_size, self.max_attempts)
+            if not events:
+                await session.rollback()
+                return 0
+
+            # Published concurrently so the producer can batch the confirms
+            results = await asyncio.gather(
+                *(
+                    self.producer.publish(
+                        event.queue,
+                        dumps(
+                            {
+                                "event_id": str(event.id),
+                                "event_type": event.event_type,
+                                "aggregate_id": str(event.aggregate_id),
+                                "occurred_at": event.created_at.isoformat(),
+                                "data": event.payload,
+                            }
+                        ),
+                        message_id=str(event.id),
+                    )
+                    for event in events
+                ),
+                return_exceptions=True,
+            )
+
+            errors = {
+                event.id: result
+                for event, result in zip(events, results)
+                if isinstance(result, BaseException)
+            }
+            if len(errors) == len(events):
+                await session.rollback()
+                raise next(iter(errors.values()))
+
+            published = [event.id for event in events if event.id not in errors]
+            await repo.delete_events(published)
+            if errors:
+                await repo.record_failures(
+                    {
+                        event_id: f"{type(error).__name__}: {error}"
+                        for event_id, error in errors.items()
+                    }
+                )
+                for event in events:
+                    if event.id not in errors:
+                        continue
+                    if event.attempts + 1 >= self.max_attempts:
+                        logger.error(
+                            f"Outbox event {event.id} failed {self.max_attempts} "
+                            f"times and will no longer be published: "
+                            f"{errors[event.id]}"
+                        )
+            await session.commit()
+            return len(published)
+
+    async def run(self) -> None:
+        """Drain the outbox until cancelled"""
+        while True:
+            try:
+                sent = await self.relay_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Outbox relay failed: {e}")
+                sent = 0
+            # A full batch means more are probably waiting
+            if sent < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+outbox_relay = OutboxRelay()
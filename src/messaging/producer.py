@@ -1,41 +1,176 @@
-import json
-from aio_pika import connect, Connection, Channel, Message
+import asyncio
+import time
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Any, List, Optional, Set
+from aio_pika import connect_robust, DeliveryMode, Message
+from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+from ..config.metrics import PUBLISH_DURATION, PUBLISH_ERRORS
 from ..config.settings import settings
+from ..utils.serialization import dumps
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class _PendingMessage:
+    queue_name: str
+    message: Message
+    confirmed: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
 
 
 class RabbitMQProducer:
+    """
+    Batching publisher with a pool of confirm-mode channels.
+
+    publish() puts the message on a bounded in-process buffer and returns
+    once the broker has confirmed it. One worker per channel takes up to
+    RABBITMQ_PUBLISH_BATCH_SIZE messages at a time and publishes them
+    concurrently, so confirms for a batch cost one round-trip instead of
+    one each. When the buffer is full, publish() waits for room.
+    """
+
     _instance = None
 
-    def __init__(self):
+    def __init__(
+        self,
+        pool_size: int = settings.RABBITMQ_CHANNEL_POOL_SIZE,
+        batch_size: int = settings.RABBITMQ_PUBLISH_BATCH_SIZE,
+        buffer_size: int = settings.RABBITMQ_PUBLISH_BUFFER_SIZE,
+    ):
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
         self.amqp_url = settings.get_amqp_url
-        self.connection: Connection = None
-        self.channel: Channel = None
+        self.pool_size = pool_size
+        self.batch_size = batch_size
+        self.buffer_size = buffer_size
+        self.connection: Optional[AbstractRobustConnection] = None
+        self._buffer: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._declared: Set[str] = set()
+        self._declare_lock = asyncio.Lock()
+        self._connect_lock = asyncio.Lock()
 
-    def __new__(cls):
+    def __new__(cls, *args, **kwargs):
         if not cls._instance:
             cls._instance = super().__new__(cls)
         return cls._instance
 
     async def connect(self):
-        if not self.connection:
-            self.connection = await connect(self.amqp_url)
-            self.channel = await self.connection.channel()
+        """Open the connection and start one publishing worker per channel"""
+        async with self._connect_lock:
+            if self.connection:
+                return
+            self.connection = await connect_robust(self.amqp_url)
+            self._buffer = asyncio.Queue(maxsize=self.buffer_size)
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self.pool_size)
+            ]
+
+    async def publish(
+        self,
+        queue_name: str,
+        message_content: Any,
+        message_id: Optional[str] = None,
+    ):
+        """
+        Queue a message and wait until the broker has confirmed it.
+        message_content is sent as is when bytes or str, otherwise as JSON.
+        """
+        if isinstance(message_content, str):
+            body = message_content.encode()
+        elif isinstance(message_content, (bytes, bytearray)):
+            body = bytes(message_content)
+        else:
+            body = dumps(message_content)
 
-    async def publish(self, queue_name: str, message_content: json):
         await self.connect()
-        queue = await self.channel.declare_queue(queue_name)
-        await self.channel.default_exchange.publish(
-            Message(message_content.encode()),
-            routing_key=queue.name,
+        pending = _PendingMessage(
+            queue_name,
+            Message(
+                body,
+                content_type="application/json",
+                message_id=message_id,
+                delivery_mode=DeliveryMode.PERSISTENT,
+            ),
+            asyncio.get_running_loop().create_future(),
         )
+        # Blocks while the buffer is full, pushing back on producers
+        await self._buffer.put(pending)
+        await pending.confirmed
+
+    async def _declare(self, channel: AbstractChannel, queue_name: str) -> None:
+        """Declare a queue once per connection instead of once per message"""
+        if queue_name in self._declared:
+            return
+        async with self._declare_lock:
+            if queue_name not in self._declared:
+                await channel.declare_queue(queue_name)
+                self._declared.add(queue_name)
+
+    async def _next_batch(self) -> List[_PendingMessage]:
+        batch = [await self._buffer.get()]
+        while len(batch) < self.batch_size and not self._buffer.empty():
+            batch.append(self._buffer.get_nowait())
+        return batch
+
+    async def _worker(self) -> None:
+        channel: Optional[AbstractChannel] = None
+        while True:
+            batch = await self._next_batch()
+            try:
+                if channel is None or channel.is_closed:
+                    channel = await self.connection.channel(publisher_confirms=True)
+                for queue_name in {pending.queue_name for pending in batch}:
+                    await self._declare(channel, queue_name)
+                results = await asyncio.gather(
+                    *(
+                        channel.default_exchange.publish(
+                            pending.message, routing_key=pending.queue_name
+                        )
+                        for pending in batch
+                    ),
+                    return_exceptions=True,
+                )
+            except asyncio.CancelledError:
+                for pending in batch:
+                    if not pending.confirmed.done():
+                        pending.confirmed.cancel()
+                raise
+            except Exception as e:
+                logger.warning(f"Failed to publish batch: {e}")
+                results = [e] * len(batch)
+                channel = None
+
+            for pending, result in zip(batch, results):
+                self._buffer.task_done()
+                PUBLISH_DURATION.labels(pending.queue_name).observe(
+                    time.perf_counter() - pending.enqueued_at
+                )
+                if isinstance(result, BaseException):
+                    PUBLISH_ERRORS.labels(pending.queue_name).inc()
+                    if not pending.confirmed.done():
+                        pending.confirmed.set_exception(result)
+                elif not pending.confirmed.done():
+                    pending.confirmed.set_result(None)
 
     async def close(self):
-        if self.channel:
-            await self.channel.close()
+        """Publish what is already buffered, then close the connection"""
+        if self._buffer is not None and self._workers:
+            await self._buffer.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._buffer = None
+        self._declared.clear()
         if self.connection:
             await self.connection.close()
+        self.connection = None
 
 
 def get_rabbitmq_producer() -> RabbitMQProducer:
     return RabbitMQProducer()
-rabbitmq_producer = get_rabbitmq_producer()
\ No newline at end of file
+rabbitmq_producer = get_rabbitmq_producer()
@@ -4,6 +4,7 @@ from src.models.user_preference import UserPreference
 from src.models.user_notification_settings import UserNotificationSetting
 from src.models.user_privacy_settings import UserPrivacySetting
 from src.models.user_consent import UserConsent
+from src.models.outbox import OutboxEvent
 
 
 __all__ = [
@@ -13,4 +14,5 @@ __all__ = [
     "UserNotificationSetting",
     "UserPrivacySetting",
     "UserConsent",
+    "OutboxEvent",
 ]
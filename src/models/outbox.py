@@ -0,0 +1,32 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Index, Integer, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from src.config.database import Base
+
+
+class OutboxEvent(Base):
+    """
+    Event waiting to be published to RabbitMQ.
+
+    Rows are written in the same transaction as the change they describe
+    and deleted by the outbox relay once the broker has confirmed them.
+    Events that keep failing are left in the table, skipped by the relay,
+    once attempts reaches OUTBOX_MAX_ATTEMPTS.
+    """
+
+    __tablename__ = "outbox_events"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    aggregate_id = Column(UUID(as_uuid=True), nullable=False)  # e.g. the user id
+    event_type = Column(String(100), nullable=False)  # e.g. "user.registered"
+    queue = Column(String(255), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    last_error = Column(Text, nullable=True)
+
+    __table_args__ = (
+        # The relay drains events oldest first
+        Index("ix_outbox_events_created_at", "created_at"),
+    )
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from src.config.database import Base
@@ -39,6 +39,8 @@ class UserNotificationSetting(Base):
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Incremented on every update; used as the ETag of conditional GETs
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     # Relationships
     user = relationship("User", back_populates="notification_settings")
@@ -5,7 +5,9 @@ from typing import Optional
 from uuid import UUID
 from datetime import datetime
 from src.models.users import User
-from src.config.security import hash_password, verify_password
+from src.config.database import sessionmanager
+from src.config.security import hash_password_async, verify_password_async
+from src.repositories.outbox_repo import OutboxRepository
 from src.utils.exceptions import (
     AlreadyExistsException,
     NotFoundException,
@@ -49,7 +51,7 @@ class AuthRepository:
             # Create user
             user = User(
                 email=email,
-                password_hash=hash_password(password),
+                password_hash=await hash_password_async(password),
                 first_name=first_name,
                 last_name=last_name,
                 phone=phone,
@@ -59,8 +61,22 @@ class AuthRepository:
             )
 
             self.db.add(user)
+            await self.db.flush()
+            OutboxRepository(self.db).add_event(
+                "user.registered",
+                user.id,
+                {
+                    "user_id": str(user.id),
+                    "email": user.email,
+                    "phone": user.phone,
+                    "first_name": user.first_name,
+                    "last_name": user.last_name,
+                    "role": user.role,
+                },
+            )
             await self.db.commit()
             await self.db.refresh(user)
+            await sessionmanager.pin_to_primary(user.id)
 
             return user
 
@@ -68,15 +84,32 @@ class AuthRepository:
             await self.db.rollback()
             raise DatabaseException(f"Database error: {str(e)}")
 
+    def _add_event(self, event_type: str, user_id: UUID) -> None:
+        """Stage a lifecycle event, committed together with the change"""
+        OutboxRepository(self.db).add_event(
+            event_type, user_id, {"user_id": str(user_id)}
+        )
+
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
         result = await self.db.execute(select(User).filter(User.email == email))
         return result.scalar_one_or_none()
 
     async def get_user_by_id(self, user_id: UUID) -> Optional[User]:
-        """Get user by ID"""
+        """Get user by ID, from a read replica when available"""
+        async with sessionmanager.read_session(self.db, user_id) as db:
+            result = await db.execute(select(User).filter(User.id == user_id))
+            return result.scalar_one_or_none()
+
+    async def _get_user_for_update(self, user_id: UUID) -> User:
+        """Load a user on the primary session so changes can be committed"""
         result = await self.db.execute(select(User).filter(User.id == user_id))
-        return result.scalar_one_or_none()
+        user = result.scalar_one_or_none()
+
+        if not user:
+            raise NotFoundException(message="User not found")
+
+        return user
 
     async def authenticate_user(self, email: str, password: str) -> User:
         """Authenticate user with email and password"""
@@ -85,7 +118,7 @@ class AuthRepository:
         if not user:
             raise InvalidCredentialsException()
 
-        if not verify_password(password, user.password_hash):
+        if not await verify_password_async(password, user.password_hash):
             raise InvalidCredentialsException()
 
         if not user.is_active:
@@ -101,52 +134,48 @@ class AuthRepository:
 
     async def update_password(self, user_id: UUID, new_password: str) -> User:
         """Update user password"""
-        user = await self.get_user_by_id(user_id)
+        user = await self._get_user_for_update(user_id)
 
-        if not user:
-            raise NotFoundException(message="User not found")
-
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await hash_password_async(new_password)
+        self._add_event("user.password_changed", user_id)
         await self.db.commit()
         await self.db.refresh(user)
+        await sessionmanager.pin_to_primary(user_id)
 
         return user
 
     async def verify_user_email(self, user_id: UUID) -> User:
         """Mark user email as verified"""
-        user = await self.get_user_by_id(user_id)
-
-        if not user:
-            raise NotFoundException(message="User not found")
+        user = await self._get_user_for_update(user_id)
 
         user.is_verified = True
+        self._add_event("user.verified", user_id)
         await self.db.commit()
         await self.db.refresh(user)
+        await sessionmanager.pin_to_primary(user_id)
 
         return user
 
     async def deactivate_user(self, user_id: UUID) -> User:
         """Deactivate user account"""
-        user = await self.get_user_by_id(user_id)
-
-        if not user:
-            raise NotFoundException(message="User not found")
+        user = await self._get_user_for_update(user_id)
 
         user.is_active = False
+        self._add_event("user.deactivated", user_id)
         await self.db.commit()
         await self.db.refresh(user)
+        await sessionmanager.pin_to_primary(user_id)
 
         return user
 
     async def activate_user(self, user_id: UUID) -> User:
         """Activate user account"""
-        user = await self.get_user_by_id(user_id)
-
-        if not user:
-            raise NotFoundException(message="User not found")
+        user = await self._get_user_for_update(user_id)
 
         user.is_active = True
+        self._add_event("user.activated", user_id)
         await self.db.commit()
         await self.db.refresh(user)
+        await sessionmanager.pin_to_primary(user_id)
 
         return user
@@ -0,0 +1,69 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, select, update
+from typing import Any, Dict, List, Mapping, Sequence
+from uuid import UUID
+
+from src.models.outbox import OutboxEvent
+
+
+class OutboxRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def add_event(
+        self,
+        event_type: str,
+        aggregate_id: UUID,
+        payload: Dict[str, Any],
+        queue: str = None,
+    ) -> OutboxEvent:
+        """
+        Stage an event in the caller's transaction.
+
+        Nothing is written until the caller commits, so the event is stored
+        if and only if the change it describes is. The queue defaults to the
+        event type.
+        """
+        event = OutboxEvent(
+            aggregate_id=aggregate_id,
+            event_type=event_type,
+            queue=queue or event_type,
+            payload=payload,
+        )
+        self.db.add(event)
+        return event
+
+    async def claim_batch(self, limit: int, max_attempts: int) -> List[OutboxEvent]:
+        """
+        Lock up to limit of the oldest events for this transaction.
+
+        Uses FOR UPDATE SKIP LOCKED, so concurrent relays claim disjoint
+        batches instead of waiting on each other. Events that already failed
+        max_attempts times are skipped.
+        """
+        result = await self.db.scalars(
+            select(OutboxEvent)
+            .where(OutboxEvent.attempts < max_attempts)
+            .order_by(OutboxEvent.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(result.all())
+
+    async def delete_events(self, event_ids: Sequence[UUID]) -> None:
+        """Remove published events; takes effect when the caller commits"""
+        await self.db.execute(
+            delete(OutboxEvent).where(OutboxEvent.id.in_(event_ids))
+        )
+
+    async def record_failures(self, errors: Mapping[UUID, str]) -> None:
+        """
+        Count a failed publish against each event and keep its error.
+        Takes effect when the caller commits.
+        """
+        for event_id, error in errors.items():
+            await self.db.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id == event_id)
+                .values(attempts=OutboxEvent.attempts + 1, last_error=error)
+            )
@@ -1,11 +1,23 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID, insert
 from sqlalchemy.exc import IntegrityError
-from typing import Optional, List
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Optional,
+    List,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from uuid import UUID
 from datetime import datetime
 
 from src.models import (
+    User,
     UserPreference,
     UserNotificationSetting,
     UserPrivacySetting,
@@ -17,122 +29,241 @@ from src.schemas.user_preference import (
     PrivacySettingUpdate,
     ConsentCreate,
 )
+from src.config.database import sessionmanager
+from src.config.settings import settings
+from src.repositories.outbox_repo import OutboxRepository
 from src.utils.exceptions import DatabaseException
 
+SettingT = TypeVar(
+    "SettingT", UserPreference, UserNotificationSetting, UserPrivacySetting
+)
+
+UPDATE_EVENTS = {
+    UserPreference: "user.preferences_updated",
+    UserNotificationSetting: "user.notification_settings_updated",
+    UserPrivacySetting: "user.privacy_settings_updated",
+}
+
 
 class PreferenceRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    # User Preferences
-    async def get_user_preference(self, user_id: UUID) -> Optional[UserPreference]:
-        result = await self.db.execute(
-            select(UserPreference).filter(UserPreference.user_id == user_id)
-        )
-        return result.scalar_one_or_none()
+    async def _upsert(
+        self,
+        model: Type[SettingT],
+        user_id: UUID,
+        values: Dict[str, Any],
+        error_message: str,
+    ) -> SettingT:
+        """
+        Insert or update a user's settings row in a single statement.
+
+        Uses INSERT ... ON CONFLICT (user_id) DO UPDATE ... RETURNING, so
+        concurrent first-time writes cannot collide. With no values, an
+        existing row is returned unchanged; otherwise its version is bumped
+        and an update event is written to the outbox in the same transaction.
+        """
+        stmt = insert(model).values(user_id=user_id, **values)
+        if values:
+            # Published by the outbox relay once this transaction commits
+            OutboxRepository(self.db).add_event(
+                UPDATE_EVENTS[model],
+                user_id,
+                {"user_id": str(user_id), "changes": values},
+            )
+            values = {**values, "updated_at": datetime.utcnow()}
+            stmt = stmt.values(updated_at=values["updated_at"])
+            update_set = {**values, "version": model.version + 1}
+        else:
+            # No-op update so RETURNING also yields the existing row
+            update_set = {"user_id": stmt.excluded.user_id}
+
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[model.user_id], set_=update_set
+        ).returning(model)
 
-    async def create_user_preference(self, user_id: UUID) -> UserPreference:
-        """Create default preferences for a new user"""
         try:
-            preference = UserPreference(user_id=user_id)
-            self.db.add(preference)
+            result = await self.db.scalars(
+                stmt, execution_options={"populate_existing": True}
+            )
+            setting = result.one()
             await self.db.commit()
-            await self.db.refresh(preference)
-            return preference
+            await sessionmanager.pin_to_primary(user_id)
+            return setting
         except IntegrityError:
             await self.db.rollback()
-            raise DatabaseException("Failed to create user preferences")
+            raise DatabaseException(error_message)
 
-    async def update_user_preference(
-        self, user_id: UUID, data: UserPreferenceUpdate
-    ) -> UserPreference:
-        preference = await self.get_user_preference(user_id)
+    async def _get_many(
+        self, model: Type[SettingT], user_ids: Sequence[UUID]
+    ) -> List[SettingT]:
+        """
+        Fetch settings rows for many users.
 
-        if not preference:
-            preference = await self.create_user_preference(user_id)
+        Ids are bound as a single array parameter (user_id = ANY(:user_ids)),
+        one query per chunk of GRPC_BATCH_CHUNK_SIZE ids, on a read replica
+        when available.
+        """
+        stmt = select(model).where(
+            model.user_id
+            == any_(bindparam("user_ids", type_=ARRAY(PG_UUID(as_uuid=True))))
+        )
+        chunk_size = settings.GRPC_BATCH_CHUNK_SIZE
+        rows: List[SettingT] = []
+        async with sessionmanager.read_session(self.db) as db:
+            for start in range(0, len(user_ids), chunk_size):
+                result = await db.scalars(
+                    stmt, {"user_ids": list(user_ids[start : start + chunk_size])}
+                )
+                rows.extend(result.all())
+        return rows
 
-        # Update only provided fields
-        for field, value in data.model_dump(exclude_unset=True).items():
-            setattr(preference, field, value)
+    async def _get(self, model: Type[SettingT], user_id: UUID) -> Optional[SettingT]:
+        """Fetch one user's settings row, on a read replica when available"""
+        async with sessionmanager.read_session(self.db, user_id) as db:
+            result = await db.execute(select(model).filter(model.user_id == user_id))
+            return result.scalar_one_or_none()
 
-        preference.updated_at = datetime.utcnow()
-        await self.db.commit()
-        await self.db.refresh(preference)
-        return preference
+    async def get_all_settings(
+        self, user_id: UUID
+    ) -> Tuple[
+        Optional[UserPreference],
+        Optional[UserNotificationSetting],
+        Optional[UserPrivacySetting],
+    ]:
+        """
+        Fetch all three settings rows of a user in one query.
+
+        The rows are outer joined to the user, so a kind the user has no
+        row for comes back as None.
+        """
+        stmt = (
+            select(UserPreference, UserNotificationSetting, UserPrivacySetting)
+            .select_from(User)
+            .outerjoin(UserPreference, UserPreference.user_id == User.id)
+            .outerjoin(
+                UserNotificationSetting, UserNotificationSetting.user_id == User.id
+            )
+            .outerjoin(UserPrivacySetting, UserPrivacySetting.user_id == User.id)
+            .where(User.id == user_id)
+        )
+        async with sessionmanager.read_session(self.db, user_id) as db:
+            row = (await db.execute(stmt)).one_or_none()
+        if row is None:
+            return None, None, None
+        return row[0], row[1], row[2]
+
+    # User Preferences
+    async def get_user_preference(self, user_id: UUID) -> Optional[UserPreference]:
+        return await self._get(UserPreference, user_id)
+
+    async def get_user_preferences(
+        self, user_ids: Sequence[UUID]
+    ) -> List[UserPreference]:
+        return await self._get_many(UserPreference, user_ids)
+
+    async def create_user_preference(self, user_id: UUID) -> UserPreference:
+        """Create default preferences for a new user"""
+        return await self._upsert(
+            UserPreference, user_id, {}, "Failed to create user preferences"
+        )
+
+    async def update_user_preference(
+        self, user_id: UUID, data: UserPreferenceUpdate
+    ) -> UserPreference:
+        # Update only provided fields, creating the row if needed
+        return await self._upsert(
+            UserPreference,
+            user_id,
+            data.model_dump(exclude_unset=True),
+            "Failed to update user preferences",
+        )
 
     # Notification Settings
     async def get_notification_setting(
         self, user_id: UUID
     ) -> Optional[UserNotificationSetting]:
-        result = await self.db.execute(
-            select(UserNotificationSetting).filter(
-                UserNotificationSetting.user_id == user_id
-            )
-        )
-        return result.scalar_one_or_none()
+        return await self._get(UserNotificationSetting, user_id)
+
+    async def get_notification_settings(
+        self, user_ids: Sequence[UUID]
+    ) -> List[UserNotificationSetting]:
+        return await self._get_many(UserNotificationSetting, user_ids)
 
     async def create_notification_setting(
         self, user_id: UUID
     ) -> UserNotificationSetting:
-        try:
-            setting = UserNotificationSetting(user_id=user_id)
-            self.db.add(setting)
-            await self.db.commit()
-            await self.db.refresh(setting)
-            return setting
-        except IntegrityError:
-            await self.db.rollback()
-            raise DatabaseException("Failed to create notification settings")
+        return await self._upsert(
+            UserNotificationSetting,
+            user_id,
+            {},
+            "Failed to create notification settings",
+        )
 
     async def update_notification_setting(
         self, user_id: UUID, data: NotificationSettingUpdate
     ) -> UserNotificationSetting:
-        setting = await self.get_notification_setting(user_id)
+        return await self._upsert(
+            UserNotificationSetting,
+            user_id,
+            data.model_dump(exclude_unset=True),
+            "Failed to update notification settings",
+        )
 
-        if not setting:
-            setting = await self.create_notification_setting(user_id)
+    async def stream_audience(
+        self,
+        notification_filters: Dict[str, bool],
+        privacy_filters: Dict[str, bool],
+        chunk_size: int,
+    ) -> AsyncIterator[
+        List[Tuple[UserNotificationSetting, Optional[UserPrivacySetting]]]
+    ]:
+        """
+        Stream notification settings matching the given flags, with the
+        user's privacy settings, in chunks of chunk_size rows.
 
-        for field, value in data.model_dump(exclude_unset=True).items():
-            setattr(setting, field, value)
+        Rows are read from a server-side cursor, so memory stays bounded by
+        the chunk size and the next chunk is only fetched once the caller
+        asks for it. The export runs on a read replica when available.
+        """
+        stmt = select(UserNotificationSetting, UserPrivacySetting).outerjoin(
+            UserPrivacySetting,
+            UserPrivacySetting.user_id == UserNotificationSetting.user_id,
+        )
+        for field, value in notification_filters.items():
+            stmt = stmt.where(getattr(UserNotificationSetting, field) == value)
+        for field, value in privacy_filters.items():
+            stmt = stmt.where(getattr(UserPrivacySetting, field) == value)
 
-        setting.updated_at = datetime.utcnow()
-        await self.db.commit()
-        await self.db.refresh(setting)
-        return setting
+        async with sessionmanager.read_session(self.db) as db:
+            result = await db.stream(stmt.execution_options(yield_per=chunk_size))
+            async for partition in result.partitions():
+                yield [(row[0], row[1]) for row in partition]
 
     # Privacy Settings
     async def get_privacy_setting(self, user_id: UUID) -> Optional[UserPrivacySetting]:
-        result = await self.db.execute(
-            select(UserPrivacySetting).filter(UserPrivacySetting.user_id == user_id)
-        )
-        return result.scalar_one_or_none()
+        return await self._get(UserPrivacySetting, user_id)
+
+    async def get_privacy_settings(
+        self, user_ids: Sequence[UUID]
+    ) -> List[UserPrivacySetting]:
+        return await self._get_many(UserPrivacySetting, user_ids)
 
     async def create_privacy_setting(self, user_id: UUID) -> UserPrivacySetting:
-        try:
-            setting = UserPrivacySetting(user_id=user_id)
-            self.db.add(setting)
-            await self.db.commit()
-            await self.db.refresh(setting)
-            return setting
-        except IntegrityError:
-            await self.db.rollback()
-            raise DatabaseException("Failed to create privacy settings")
+        return await self._upsert(
+            UserPrivacySetting, user_id, {}, "Failed to create privacy settings"
+        )
 
     async def update_privacy_setting(
         self, user_id: UUID, data: PrivacySettingUpdate
     ) -> UserPrivacySetting:
-        setting = await self.get_privacy_setting(user_id)
-
-        if not setting:
-            setting = await self.create_privacy_setting(user_id)
-
-        for field, value in data.model_dump(exclude_unset=True).items():
-            setattr(setting, field, value)
-
-        setting.updated_at = datetime.utcnow()
-        await self.db.commit()
-        await self.db.refresh(setting)
-        return setting
+        return await self._upsert(
+            UserPrivacySetting,
+            user_id,
+            data.model_dump(exclude_unset=True),
+            "Failed to update privacy settings",
+        )
 
     # Consent Management
     async def create_consent(
@@ -156,24 +287,28 @@ class PreferenceRepository:
         self.db.add(consent)
         await self.db.commit()
         await self.db.refresh(consent)
+        await sessionmanager.pin_to_primary(user_id)
         return consent
 
     async def get_consent_history(self, user_id: UUID) -> List[UserConsent]:
-        result = await self.db.execute(
-            select(UserConsent)
-            .filter(UserConsent.user_id == user_id)
-            .order_by(UserConsent.granted_at.desc())
-        )
-        return result.scalars().all()
+        async with sessionmanager.read_session(self.db, user_id) as db:
+            result = await db.execute(
+                select(UserConsent)
+                .filter(UserConsent.user_id == user_id)
+                .order_by(UserConsent.granted_at.desc())
+            )
+            return result.scalars().all()
 
     async def get_latest_consent(
         self, user_id: UUID, consent_type: str
     ) -> Optional[UserConsent]:
-        result = await self.db.execute(
-            select(UserConsent)
-            .filter(
-                UserConsent.user_id == user_id, UserConsent.consent_type == consent_type
+        async with sessionmanager.read_session(self.db, user_id) as db:
+            result = await db.execute(
+                select(UserConsent)
+                .filter(
+                    UserConsent.user_id == user_id,
+                    UserConsent.consent_type == consent_type,
+                )
+                .order_by(UserConsent.granted_at.desc())
             )
-            .order_by(UserConsent.granted_at.desc())
-        )
-        return result.scalar_one_or_none()
+            return result.scalar_one_or_none()
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
-import redis.asyncio as redis
 from src.config.database import get_db_session
-from src.config.cache import get_redis_client
+from src.config.cache import redis_manager
+from src.config.rate_limiter import RateLimit, route_key
 from src.repositories.auth_repo import AuthRepository
 from src.services.auth_service import AuthService
 from src.schemas.auth import (
@@ -14,16 +14,16 @@ from src.schemas.auth import (
 )
 from src.schemas.response import ResponseModel
 
-router = APIRouter()
+# Each auth endpoint is limited separately per client IP
+router = APIRouter(dependencies=[Depends(RateLimit(key_func=route_key))])
 
 
 def get_auth_service(
     db: AsyncSession = Depends(get_db_session),
-    redis_client: redis.Redis = Depends(get_redis_client),
 ) -> AuthService:
     """Dependency to get AuthService instance"""
     auth_repo = AuthRepository(db)
-    return AuthService(auth_repo, redis_client)
+    return AuthService(auth_repo, redis_manager)
 
 
 @router.post(
@@ -1,10 +1,19 @@
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, Header, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 from uuid import UUID
 from src.config.database import get_db_session
+from src.config.cache import redis_manager
 from src.config.deps import get_current_user
 from src.repositories.preference_repo import PreferenceRepository
-from src.services.preference_service import PreferenceService
+from src.services.preference_service import (
+    ALL_SETTINGS,
+    NOTIFICATIONS,
+    PREFERENCES,
+    PRIVACY,
+    PreferenceService,
+    settings_etag,
+)
 from src.schemas.user_preference import (
     UserPreferenceUpdate,
     UserPreferenceResponse,
@@ -15,6 +24,7 @@ from src.schemas.user_preference import (
     ConsentCreate,
     ConsentResponse,
     ConsentHistoryResponse,
+    UserSettingsResponse,
 )
 from src.schemas.response import ResponseModel
 
@@ -26,7 +36,94 @@ def get_preference_service(
     db: AsyncSession = Depends(get_db_session),
 ) -> PreferenceService:
     preference_repo = PreferenceRepository(db)
-    return PreferenceService(preference_repo)
+    return PreferenceService(preference_repo, redis_manager)
+
+
+# Clients may keep settings but must revalidate them with If-None-Match
+CACHE_CONTROL = "private, no-cache"
+# Settings depend on who is asking, so shared caches must key on the token
+VARY = "Authorization"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header lists etag, compared weakly"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in (
+        tag[2:] if tag.startswith("W/") else tag for tag in candidates
+    )
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": VARY},
+    )
+
+
+def _set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    response.headers["Vary"] = VARY
+
+
+async def _cached_not_modified(
+    service: PreferenceService,
+    user_id: UUID,
+    if_none_match: Optional[str],
+    *kinds: str,
+) -> Optional[Response]:
+    """
+    Answer a conditional GET from the version mirror alone.
+
+    Returns a 304 when If-None-Match lists the current ETag, without a
+    query or building the body; None when the settings must be loaded.
+    """
+    if not if_none_match:
+        return None
+    etag = await service.get_cached_etag(user_id, *kinds)
+    if etag is None or not _etag_matches(if_none_match, etag):
+        return None
+    return _not_modified(etag)
+
+
+# ============= ALL SETTINGS =============
+@router.get(
+    "",
+    response_model=ResponseModel[UserSettingsResponse],
+    summary="Get All Settings",
+    description="Retrieve the current user's preferences, notification and privacy settings in one call. Send the returned ETag back as If-None-Match to get 304 Not Modified while nothing has changed",
+    responses={304: {"description": "Settings unchanged since the given ETag"}},
+)
+async def get_all_settings(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    current_user: dict = Depends(get_current_user),
+    service: PreferenceService = Depends(get_preference_service),
+):
+    """Get all settings"""
+    user_id = UUID(current_user["user_id"])
+    not_modified = await _cached_not_modified(
+        service, user_id, if_none_match, *ALL_SETTINGS
+    )
+    if not_modified is not None:
+        return not_modified
+
+    bundle = await service.get_all_settings(user_id)
+    etag = settings_etag(
+        user_id,
+        bundle.preferences.version,
+        bundle.notifications.version,
+        bundle.privacy.version,
+    )
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
+    _set_etag(response, etag)
+    return ResponseModel(
+        success=True, message="Settings retrieved successfully", data=bundle
+    )
 
 
 @router.get(
@@ -34,14 +131,28 @@ def get_preference_service(
     response_model=ResponseModel[UserPreferenceResponse],
     summary="Get User Preferences",
     description="Retrieve the current user's general preferences including language, currency, timezone, and theme",
+    responses={304: {"description": "Settings unchanged since the given ETag"}},
 )
 async def get_preferences(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user: dict = Depends(get_current_user),
     service: PreferenceService = Depends(get_preference_service),
 ):
     """Get user preferences"""
     user_id = UUID(current_user["user_id"])
+    not_modified = await _cached_not_modified(
+        service, user_id, if_none_match, PREFERENCES
+    )
+    if not_modified is not None:
+        return not_modified
+
     preferences = await service.get_preferences(user_id)
+    etag = settings_etag(user_id, preferences.version)
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
+    _set_etag(response, etag)
 
     return ResponseModel(
         success=True, message="Preferences retrieved successfully", data=preferences
@@ -56,12 +167,14 @@ async def get_preferences(
 )
 async def update_preferences(
     data: UserPreferenceUpdate,
+    response: Response,
     current_user: dict = Depends(get_current_user),
     service: PreferenceService = Depends(get_preference_service),
 ):
     """Update user preferences"""
     user_id = UUID(current_user["user_id"])
     preferences = await service.update_preferences(user_id, data)
+    _set_etag(response, settings_etag(user_id, preferences.version))
 
     return ResponseModel(
         success=True, message="Preferences updated successfully", data=preferences
@@ -74,14 +187,28 @@ async def update_preferences(
     response_model=ResponseModel[NotificationSettingResponse],
     summary="Get Notification Settings",
     description="Retrieve the current user's notification preferences for email, SMS, and push notifications",
+    responses={304: {"description": "Settings unchanged since the given ETag"}},
 )
 async def get_notification_settings(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user: dict = Depends(get_current_user),
     service: PreferenceService = Depends(get_preference_service),
 ):
     """Get notification settings"""
     user_id = UUID(current_user["user_id"])
+    not_modified = await _cached_not_modified(
+        service, user_id, if_none_match, NOTIFICATIONS
+    )
+    if not_modified is not None:
+        return not_modified
+
     settings = await service.get_notification_settings(user_id)
+    etag = settings_etag(user_id, settings.version)
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
+    _set_etag(response, etag)
 
     return ResponseModel(
         success=True,
@@ -98,12 +225,14 @@ async def get_notification_settings(
 )
 async def update_notification_settings(
     data: NotificationSettingUpdate,
+    response: Response,
     current_user: dict = Depends(get_current_user),
     service: PreferenceService = Depends(get_preference_service),
 ):
     """Update notification settings"""
     user_id = UUID(current_user["user_id"])
     settings = await service.update_notification_settings(user_id, data)
+    _set_etag(response, settings_etag(user_id, settings.version))
 
     return ResponseModel(
         success=True,
@@ -118,14 +247,28 @@ async def update_notification_settings(
     response_model=ResponseModel[PrivacySettingResponse],
     summary="Get Privacy Settings",
     description="Retrieve the current user's privacy settings including profile visibility and data sharing preferences",
+    responses={304: {"description": "Settings unchanged since the given ETag"}},
 )
 async def get_privacy_settings(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user: dict = Depends(get_current_user),
     service: PreferenceService = Depends(get_preference_service),
 ):
     """Get privacy settings"""
     user_id = UUID(current_user["user_id"])
+    not_modified = await _cached_not_modified(
+        service, user_id, if_none_match, PRIVACY
+    )
+    if not_modified is not None:
+        return not_modified
+
     settings = await service.get_privacy_settings(user_id)
+    etag = settings_etag(user_id, settings.version)
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
+    _set_etag(response, etag)
 
     return ResponseModel(
         success=True, message="Privacy settings retrieved successfully", data=settings
@@ -140,12 +283,14 @@ async def get_privacy_settings(
 )
 async def update_privacy_settings(
     data: PrivacySettingUpdate,
+    response: Response,
     current_user: dict = Depends(get_current_user),
     service: PreferenceService = Depends(get_preference_service),
 ):
     """Update privacy settings"""
     user_id = UUID(current_user["user_id"])
     settings = await service.update_privacy_settings(user_id, data)
+    _set_etag(response, settings_etag(user_id, settings.version))
 
     return ResponseModel(
         success=True, message="Privacy settings updated successfully", data=settings
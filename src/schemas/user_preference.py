@@ -33,6 +33,7 @@ class UserPreferenceResponse(UserPreferenceBase):
     user_id: UUID
     created_at: datetime
     updated_at: datetime
+    version: int
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -68,6 +69,7 @@ class NotificationSettingResponse(NotificationSettingBase):
     user_id: UUID
     created_at: datetime
     updated_at: datetime
+    version: int
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -92,10 +94,18 @@ class PrivacySettingResponse(PrivacySettingBase):
     user_id: UUID
     created_at: datetime
     updated_at: datetime
+    version: int
 
     model_config = ConfigDict(from_attributes=True)
 
 
+# Settings Bundle Schema
+class UserSettingsResponse(BaseModel):
+    preferences: UserPreferenceResponse
+    notifications: NotificationSettingResponse
+    privacy: PrivacySettingResponse
+
+
 # Consent Schemas
 class ConsentCreate(BaseModel):
     consent_type: ConsentTypeEnum
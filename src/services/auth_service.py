@@ -1,8 +1,9 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from uuid import UUID
 from datetime import timedelta
-import redis.asyncio as redis
 
+from src.config.cache import CacheWrite, RedisConnectionManager
+from src.models.users import User
 from src.repositories.auth_repo import AuthRepository
 from src.config.security import SecurityManager, decode_token
 
@@ -22,10 +23,61 @@ from src.utils.exceptions import (
 )
 
 
+def user_cache_key(user_id: Any) -> str:
+    """Cache key holding the cached user record"""
+    return f"user:{user_id}"
+
+
+def refresh_token_cache_key(user_id: Any) -> str:
+    """Cache key holding the user's current refresh token"""
+    return f"refresh_token:{user_id}"
+
+
+def build_user_cache_data(user: User) -> Dict[str, Any]:
+    """Build the user record cached for get_current_user"""
+    return {
+        "user_id": str(user.id),
+        "email": user.email,
+        "phone": user.phone,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "is_active": user.is_active,
+        "is_verified": user.is_verified,
+        "role": getattr(user, "role", "user"),
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+    }
+
+
 class AuthService:
-    def __init__(self, auth_repo: AuthRepository, redis_client: redis.Redis = None):
+    def __init__(
+        self,
+        auth_repo: AuthRepository,
+        cache: Optional[RedisConnectionManager] = None,
+    ):
         self.auth_repo = auth_repo
-        self.redis_client = redis_client
+        self.cache = cache
+
+    async def _cache_session(self, user: User, refresh_token: str) -> None:
+        """Store the refresh token and the user's cached data in one round-trip"""
+        if not self.cache:
+            return
+        await self.cache.set_many(
+            [
+                CacheWrite(
+                    refresh_token_cache_key(user.id),
+                    refresh_token,
+                    expire=settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600,
+                    raw=True,
+                ),
+                CacheWrite(
+                    user_cache_key(user.id),
+                    build_user_cache_data(user),
+                    expire=settings.USER_CACHE_TTL,
+                    local=True,
+                    stale_ttl=settings.USER_CACHE_STALE_TTL,
+                ),
+            ]
+        )
 
     async def register_user(self, data: UserRegistrationRequest) -> AuthResponse:
         """
@@ -52,32 +104,8 @@ class AuthService:
             user_id=user.id, email=user.email, role=user.role
         )
 
-        # Store refresh token in Redis
-        if self.redis_client:
-            await self.redis_client.setex(
-                f"refresh_token:{user.id}",
-                settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600,
-                tokens["refresh_token"],
-            )
-
-        # Cache user data
-        if self.redis_client:
-            import json
-
-            user_data = {
-                "user_id": str(user.id),
-                "email": user.email,
-                "phone": user.phone,
-                "first_name": user.first_name,
-                "last_name": user.last_name,
-                "is_active": user.is_active,
-                "is_verified": user.is_verified,
-                "role": user.role,
-                "created_at": user.created_at.isoformat() if user.created_at else None,
-            }
-            await self.redis_client.setex(
-                f"user:{user.id}", 3600, json.dumps(user_data)  # 1 hour
-            )
+        # Store refresh token and cache user data in Redis
+        await self._cache_session(user, tokens["refresh_token"])
 
         return AuthResponse(
             user=UserResponse.model_validate(user),
@@ -110,32 +138,8 @@ class AuthService:
             additional_claims={"is_verified": user.is_verified},
         )
 
-        # Store refresh token in Redis
-        if self.redis_client:
-            await self.redis_client.setex(
-                f"refresh_token:{user.id}",
-                settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600,
-                tokens["refresh_token"],
-            )
-
-        # Cache user data
-        if self.redis_client:
-            import json
-
-            user_data = {
-                "user_id": str(user.id),
-                "email": user.email,
-                "phone": user.phone,
-                "first_name": user.first_name,
-                "last_name": user.last_name,
-                "is_active": user.is_active,
-                "is_verified": user.is_verified,
-                "role": user.role,
-                "created_at": user.created_at.isoformat() if user.created_at else None,
-            }
-            await self.redis_client.setex(
-                f"user:{user.id}", 3600, json.dumps(user_data)
-            )
+        # Store refresh token and cache user data in Redis
+        await self._cache_session(user, tokens["refresh_token"])
 
         return AuthResponse(
             user=UserResponse.model_validate(user),
@@ -167,12 +171,6 @@ class AuthService:
 
             user_id = payload.get("user_id")
 
-            # Verify refresh token exists in Redis
-            if self.redis_client:
-                stored_token = await self.redis_client.get(f"refresh_token:{user_id}")
-                if not stored_token or stored_token != refresh_token:
-                    raise InvalidTokenException("Invalid refresh token")
-
             # Get user
             user = await self.auth_repo.get_user_by_id(UUID(user_id))
             if not user:
@@ -191,13 +189,18 @@ class AuthService:
                 additional_claims={"is_verified": user.is_verified},
             )
 
-            # Update refresh token in Redis
-            if self.redis_client:
-                await self.redis_client.setex(
-                    f"refresh_token:{user.id}",
-                    settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600,
+            # Rotate the refresh token in Redis, which also verifies that the
+            # presented one is still the current one. The swap is atomic, so
+            # concurrent refreshes with the same token cannot both succeed.
+            if self.cache:
+                rotated = await self.cache.compare_and_set(
+                    refresh_token_cache_key(user.id),
+                    refresh_token,
                     tokens["refresh_token"],
+                    expire=settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600,
                 )
+                if not rotated:
+                    raise InvalidTokenException("Invalid refresh token")
 
             return TokenResponse(
                 access_token=tokens["access_token"],
@@ -221,11 +224,11 @@ class AuthService:
         Returns:
             True if successful
         """
-        if self.redis_client:
-            # Delete refresh token
-            await self.redis_client.delete(f"refresh_token:{user_id}")
-
-            # Delete cached user data
-            await self.redis_client.delete(f"user:{user_id}")
+        if self.cache:
+            # Delete the refresh token and cached user data together
+            await self.cache.delete_many(
+                [refresh_token_cache_key(user_id), user_cache_key(user_id)],
+                local=True,
+            )
 
         return True
@@ -1,7 +1,11 @@
 import asyncio
+import re
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from email.message import EmailMessage
 from pathlib import Path
-from typing import Optional, Mapping, Any
+from typing import AsyncIterator, Dict, List, Optional, Mapping, Any, Tuple
 
 import jinja2
 
@@ -17,6 +21,128 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Markup whose text content should not end up in the plaintext part
+_NON_TEXT_ELEMENTS = re.compile(
+    r"<(head|style|script)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+# Sources whose plaintext cannot be derived by stripping the source itself:
+# Jinja tags containing < or >, which striptags would mistake for markup,
+# and tags pulling in other (unstripped) templates
+_NOT_STRIPPABLE = re.compile(
+    r"({{|{%|{#)[^}]*[<>][^}]*(}}|%}|#})"
+    r"|{%-?\s*(extends|include|import|from)\b"
+)
+
+
+def html_to_text(html: str) -> str:
+    """Plaintext alternative of an HTML email"""
+    return jinja2.filters.do_striptags(_NON_TEXT_ELEMENTS.sub("", html)).strip()
+
+
+@dataclass
+class CompiledTemplate:
+    html: jinja2.Template
+    # Template for the plaintext part; None when it has to be derived from
+    # each rendered HTML body instead
+    text: Optional[jinja2.Template]
+
+
+class SMTPConnectionPool:
+    """
+    Small pool of connected, authenticated aiosmtplib clients.
+
+    Connections are opened on demand up to size and reused across messages,
+    so the TCP, STARTTLS and AUTH handshake is paid once per connection
+    rather than once per email. A connection that sat idle for longer than
+    health_check_interval is checked with NOOP before use and replaced if
+    the server dropped it.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str],
+        password: Optional[str],
+        start_tls: bool,
+        size: int = settings.SMTP_POOL_SIZE,
+        health_check_interval: float = settings.SMTP_HEALTH_CHECK_INTERVAL,
+        timeout: float = settings.SMTP_TIMEOUT,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.start_tls = start_tls
+        self.size = size
+        self.health_check_interval = health_check_interval
+        self.timeout = timeout
+        # (client, last used) pairs ready for reuse
+        self._idle: List[Tuple["aiosmtplib.SMTP", float]] = []
+        self._slots = asyncio.Semaphore(size)
+
+    async def _open(self) -> "aiosmtplib.SMTP":
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            start_tls=self.start_tls,
+            timeout=self.timeout,
+        )
+        await client.connect()
+        return client
+
+    async def _is_healthy(self, client: "aiosmtplib.SMTP", last_used: float) -> bool:
+        if not client.is_connected:
+            return False
+        if time.monotonic() - last_used < self.health_check_interval:
+            return True
+        try:
+            await client.noop()
+            return True
+        except aiosmtplib.SMTPException:
+            return False
+
+    @staticmethod
+    async def _discard(client: "aiosmtplib.SMTP") -> None:
+        if not client.is_connected:
+            return
+        try:
+            await client.quit()
+        except Exception:
+            client.close()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator["aiosmtplib.SMTP"]:
+        """Borrow a healthy connection, opening or replacing one if needed"""
+        async with self._slots:
+            client = None
+            while self._idle:
+                candidate, last_used = self._idle.pop()
+                if await self._is_healthy(candidate, last_used):
+                    client = candidate
+                    break
+                await self._discard(candidate)
+            if client is None:
+                client = await self._open()
+
+            try:
+                yield client
+            except aiosmtplib.SMTPResponseException:
+                # The server answered, so the connection is still usable
+                self._idle.append((client, time.monotonic()))
+                raise
+            except BaseException:
+                await self._discard(client)
+                raise
+            self._idle.append((client, time.monotonic()))
+
+    async def close(self) -> None:
+        while self._idle:
+            client, _ = self._idle.pop()
+            await self._discard(client)
+
 
 class EmailService:
     """Async email service with Jinja2 HTML templates."""
@@ -30,6 +156,8 @@ class EmailService:
         password: Optional[str] = settings.SMTP_PASSWORD,
         default_from: Optional[str] = None,
         use_tls: bool = True,
+        workers: int = settings.EMAIL_WORKERS,
+        queue_size: int = settings.EMAIL_QUEUE_SIZE,
     ):
         self.smtp_host = smtp_host
         self.smtp_port = smtp_port
@@ -37,6 +165,11 @@ class EmailService:
         self.password = password
         self.default_from = default_from or username
         self.use_tls = use_tls
+        self.workers = workers
+        self.queue_size = queue_size
+        self._pool: Optional[SMTPConnectionPool] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
 
         self.templates_dir = Path(templates_dir)
         self.jinja_env = jinja2.Environment(
@@ -44,19 +177,76 @@ class EmailService:
             autoescape=jinja2.select_autoescape(["html", "xml"]),
             trim_blocks=True,
             lstrip_blocks=True,
+            enable_async=True,
+            # Templates are compiled once and kept in self._compiled
+            auto_reload=False,
+            bytecode_cache=(
+                jinja2.FileSystemBytecodeCache(settings.EMAIL_TEMPLATE_CACHE_DIR)
+                if settings.EMAIL_TEMPLATE_CACHE_DIR
+                else None
+            ),
         )
         
         self.jinja_env.filters['currency'] = lambda x: f"${x:,.2f}"
+        self._compiled: Dict[str, CompiledTemplate] = {}
+
+    def precompile_templates(self) -> None:
+        """Compile every HTML template up front, e.g. at startup"""
+        for template_name in self.jinja_env.list_templates(extensions=["html"]):
+            self.get_template(template_name)
+        logger.info(f"Compiled {len(self._compiled)} email templates")
 
-    def render_template(
+    def get_template(self, template_name: str) -> CompiledTemplate:
+        """
+        Compiled HTML and plaintext templates for template_name.
+
+        The plaintext template is derived once from the HTML source by
+        stripping its markup, so sends only render the variable parts
+        instead of stripping every rendered body.
+        """
+        compiled = self._compiled.get(template_name)
+        if compiled is not None:
+            return compiled
+
+        html = self.jinja_env.get_template(template_name)
+        source, _, _ = self.jinja_env.loader.get_source(
+            self.jinja_env, template_name
+        )
+        text = None
+        if not _NOT_STRIPPABLE.search(source):
+            try:
+                text = self.jinja_env.from_string(
+                    "{% autoescape false %}"
+                    + html_to_text(source)
+                    + "{% endautoescape %}"
+                )
+            except jinja2.TemplateError:
+                text = None
+
+        compiled = self._compiled[template_name] = CompiledTemplate(html, text)
+        return compiled
+
+    async def render_template(
         self, 
         template_name: str, 
         context: Optional[Mapping[str, Any]] = None
     ) -> str:
         """Render HTML email template."""
+        html, _ = await self._render(template_name, context)
+        return html
+
+    async def _render(
+        self, template_name: str, context: Optional[Mapping[str, Any]] = None
+    ) -> Tuple[str, str]:
+        """Render the HTML and plaintext parts of an email"""
         try:
-            template = self.jinja_env.get_template(template_name)
-            return template.render(context or {})
+            compiled = self.get_template(template_name)
+            html = await compiled.html.render_async(context or {})
+            if compiled.text is not None:
+                text = (await compiled.text.render_async(context or {})).strip()
+            else:
+                text = html_to_text(html)
+            return html, text
         except jinja2.TemplateNotFound:
             logger.error(f"Template not found: {template_name}")
             raise
@@ -70,6 +260,7 @@ class EmailService:
         subject: str,
         html_content: str,
         from_email: Optional[str] = None,
+        plain_text: Optional[str] = None,
     ) -> EmailMessage:
         """Create email message with HTML and plain text alternatives."""
         msg = EmailMessage()
@@ -77,13 +268,25 @@ class EmailService:
         msg["To"] = to
         msg["Subject"] = subject
 
-        plain_text = jinja2.filters.do_striptags(html_content).strip()
+        if plain_text is None:
+            plain_text = html_to_text(html_content)
         
         msg.set_content(plain_text or "Please view this email in HTML format.")
         msg.add_alternative(html_content, subtype="html")
         
         return msg
 
+    def _can_send(self, to: str) -> bool:
+        if not all([self.smtp_host, self.smtp_port, self.username, self.password]):
+            logger.error("SMTP configuration incomplete")
+            return False
+
+        if not to:
+            logger.error("Recipient email address is required")
+            return False
+
+        return True
+
     async def send_email(
         self,
         to: str,
@@ -105,18 +308,15 @@ class EmailService:
         Returns:
             True if sent successfully, False otherwise
         """
-        if not all([self.smtp_host, self.smtp_port, self.username, self.password]):
-            logger.error("SMTP configuration incomplete")
-            return False
-
-        if not to:
-            logger.error("Recipient email address is required")
+        if not self._can_send(to):
             return False
 
         try:
-            html_content = self.render_template(template_name, context)
+            html_content, plain_text = await self._render(template_name, context)
             
-            msg = self._create_message(to, subject, html_content, from_email)
+            msg = self._create_message(
+                to, subject, html_content, from_email, plain_text
+            )
             
             if _HAS_AIO:
                 await self._send_async(msg)
@@ -130,23 +330,87 @@ class EmailService:
             logger.exception(f"Failed to send email to {to}: {e}")
             return False
 
+    async def enqueue_email(
+        self,
+        to: str,
+        subject: str,
+        template_name: str,
+        context: Optional[Mapping[str, Any]] = None,
+        from_email: Optional[str] = None,
+    ) -> bool:
+        """
+        Queue an email for the background workers and return immediately.
+
+        Only waits when EMAIL_QUEUE_SIZE emails are already queued. Delivery
+        failures are logged by the worker.
+
+        Returns:
+            True if queued, False if the email cannot be sent at all
+        """
+        if not self._can_send(to):
+            return False
+
+        self.start()
+        await self._queue.put((to, subject, template_name, context, from_email))
+        return True
+
+    def start(self) -> None:
+        """Start the send queue workers; called lazily by enqueue_email"""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._worker_tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+
+    async def _worker(self) -> None:
+        while True:
+            args = await self._queue.get()
+            try:
+                await self.send_email(*args)
+            finally:
+                self._queue.task_done()
+
+    async def close(self) -> None:
+        """Send everything already queued, then close pooled connections"""
+        if self._queue is not None:
+            await self._queue.join()
+            for task in self._worker_tasks:
+                task.cancel()
+            await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+            self._worker_tasks = []
+            self._queue = None
+        if self._pool is not None:
+            await self._pool.close()
+
     async def _send_async(self, msg: EmailMessage) -> None:
-        """Send email using aiosmtplib (async)."""
-        await aiosmtplib.send(
-            msg,
-            hostname=self.smtp_host,
-            port=self.smtp_port,
-            username=self.username,
-            password=self.password,
-            start_tls=self.use_tls,
-        )
+        """Send email over a pooled aiosmtplib connection."""
+        if self._pool is None:
+            self._pool = SMTPConnectionPool(
+                self.smtp_host,
+                self.smtp_port,
+                self.username,
+                self.password,
+                self.use_tls,
+            )
+
+        try:
+            async with self._pool.acquire() as client:
+                await client.send_message(msg)
+        except (aiosmtplib.SMTPServerDisconnected, ConnectionError):
+            # The server may close pooled connections at any time; retry
+            # once on a fresh one
+            async with self._pool.acquire() as client:
+                await client.send_message(msg)
 
     async def _send_sync(self, msg: EmailMessage) -> None:
         """Send email using smtplib in executor (fallback)."""
         loop = asyncio.get_running_loop()
         
         def _send():
-            with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30) as smtp:
+            with smtplib.SMTP(
+                self.smtp_host, self.smtp_port, timeout=settings.SMTP_TIMEOUT
+            ) as smtp:
                 if self.use_tls:
                     smtp.starttls()
                 if self.username and self.password:
@@ -1,7 +1,21 @@
+import hashlib
 from uuid import UUID
-from typing import Optional
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
+from pydantic import BaseModel
 
+from src.config.cache import CacheWrite, RedisConnectionManager
+from src.config.settings import settings
 from src.repositories.preference_repo import PreferenceRepository
 from src.schemas.user_preference import (
     UserPreferenceUpdate,
@@ -13,62 +27,341 @@ from src.schemas.user_preference import (
     ConsentCreate,
     ConsentResponse,
     ConsentHistoryResponse,
+    UserSettingsResponse,
 )
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Settings kinds, used as part of the cache key
+PREFERENCES = "preferences"
+NOTIFICATIONS = "notifications"
+PRIVACY = "privacy"
+# Kinds of the settings bundle, in ETag order
+ALL_SETTINGS = (PREFERENCES, NOTIFICATIONS, PRIVACY)
+
+
+def preference_cache_key(kind: str, user_id: UUID) -> str:
+    """Cache key holding the validated response model for a settings kind"""
+    return f"preference:{kind}:{user_id}"
+
+
+def preference_version_key(kind: str, user_id: UUID) -> str:
+    """Cache key mirroring the version of a settings kind, stored raw"""
+    return f"preference:version:{kind}:{user_id}"
+
+
+def settings_etag(user_id: UUID, *versions: int) -> str:
+    """
+    Entity tag of one or more settings kinds, given their versions.
+
+    Versions start at 1 for every user, so the tag also carries a short hash
+    of the user id; a tag from one account never matches another's.
+    """
+    owner = hashlib.blake2b(user_id.bytes, digest_size=6).hexdigest()
+    return f'"{owner}-' + ".".join(str(version) for version in versions) + '"'
+
 
 class PreferenceService:
-    def __init__(self, preference_repo: PreferenceRepository):
+    def __init__(
+        self,
+        preference_repo: PreferenceRepository,
+        cache: Optional[RedisConnectionManager] = None,
+    ):
         self.preference_repo = preference_repo
+        self.cache = cache
+
+    # Cache helpers
+    async def _get_or_load(
+        self,
+        kind: str,
+        user_id: UUID,
+        model: Type[ModelT],
+        load: Callable[[], Awaitable[Any]],
+    ) -> ModelT:
+        """
+        Read a settings kind through the cache.
+
+        Concurrent misses for the same user share a single repository call,
+        and the fill (of the value and of its version mirror) only populates
+        a missing key so it cannot clobber a newer write.
+        """
+
+        async def loader() -> dict:
+            value = model.model_validate(await load())
+            await self.cache.set(
+                preference_version_key(kind, user_id),
+                value.version,
+                expire=settings.PREFERENCE_CACHE_TTL,
+                nx=True,
+                raw=True,
+            )
+            return value.model_dump(mode="json")
+
+        if self.cache is None:
+            return model.model_validate(await load())
+
+        cached = await self.cache.get_or_load(
+            preference_cache_key(kind, user_id),
+            loader,
+            expire=settings.PREFERENCE_CACHE_TTL,
+            local=True,
+            distributed=True,
+        )
+        return model.model_validate(cached)
+
+    async def _get_many(
+        self,
+        kind: str,
+        user_ids: Sequence[UUID],
+        model: Type[ModelT],
+        fetch: Callable[[Sequence[UUID]], Awaitable[Sequence[Any]]],
+    ) -> Tuple[List[ModelT], List[UUID]]:
+        """
+        Read a settings kind for many users.
+
+        Cached entries are fetched with one MGET and only the remaining ids
+        reach the repository. Results are not cached, so a large fan-out does
+        not evict hot single-user entries. Returns the found settings in
+        request order and the ids with no stored settings.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        found = {}
+
+        if self.cache is not None:
+            cached = await self.cache.get_many(
+                [preference_cache_key(kind, user_id) for user_id in user_ids],
+                local=True,
+            )
+            for user_id in user_ids:
+                value = cached.get(preference_cache_key(kind, user_id))
+                if value is not None:
+                    found[user_id] = model.model_validate(value)
+
+        remaining = [user_id for user_id in user_ids if user_id not in found]
+        if remaining:
+            for row in await fetch(remaining):
+                found[row.user_id] = model.model_validate(row)
+
+        return (
+            [found[user_id] for user_id in user_ids if user_id in found],
+            [user_id for user_id in user_ids if user_id not in found],
+        )
+
+    async def _write_through(
+        self, kind: str, user_id: UUID, value: BaseModel
+    ) -> None:
+        """
+        Cache freshly written settings and their version.
+
+        The entry is only replaced while the cached version is older, so a
+        concurrent update that committed later but reached Redis first is not
+        overwritten.
+        """
+        if self.cache is None:
+            return
+        await self.cache.set_if_newer(
+            preference_cache_key(kind, user_id),
+            value.model_dump(mode="json"),
+            preference_version_key(kind, user_id),
+            value.version,
+            expire=settings.PREFERENCE_CACHE_TTL,
+            local=True,
+        )
+
+    async def get_cached_etag(self, user_id: UUID, *kinds: str) -> Optional[str]:
+        """
+        ETag of the given settings kinds, from the version mirror alone.
+
+        Costs one MGET. Returns None when any version is not mirrored, in
+        which case the caller has to load the settings.
+        """
+        if self.cache is None:
+            return None
+        keys = [preference_version_key(kind, user_id) for kind in kinds]
+        versions = await self.cache.get_many(keys, raw=True)
+        if len(versions) < len(keys):
+            return None
+        try:
+            return settings_etag(user_id, *(int(versions[key]) for key in keys))
+        except ValueError:
+            # Mirrored in an older format; rewritten by the next update
+            return None
 
     # User Preferences
     async def get_preferences(self, user_id: UUID) -> UserPreferenceResponse:
-        preference = await self.preference_repo.get_user_preference(user_id)
+        async def load():
+            preference = await self.preference_repo.get_user_preference(user_id)
+
+            if not preference:
+                # Create default preferences if none exist
+                preference = await self.preference_repo.create_user_preference(
+                    user_id
+                )
+            return preference
 
-        if not preference:
-            # Create default preferences if none exist
-            preference = await self.preference_repo.create_user_preference(user_id)
+        return await self._get_or_load(
+            PREFERENCES, user_id, UserPreferenceResponse, load
+        )
 
-        return UserPreferenceResponse.model_validate(preference)
+    async def get_many_preferences(
+        self, user_ids: Sequence[UUID]
+    ) -> Tuple[List[UserPreferenceResponse], List[UUID]]:
+        return await self._get_many(
+            PREFERENCES,
+            user_ids,
+            UserPreferenceResponse,
+            self.preference_repo.get_user_preferences,
+        )
 
     async def update_preferences(
-        self, 
-        user_id: UUID, 
+        self,
+        user_id: UUID,
         data: UserPreferenceUpdate
     ) -> UserPreferenceResponse:
         preference = await self.preference_repo.update_user_preference(user_id, data)
-        return UserPreferenceResponse.model_validate(preference)
+        response = UserPreferenceResponse.model_validate(preference)
+        await self._write_through(PREFERENCES, user_id, response)
+        return response
 
     # Notification Settings
     async def get_notification_settings(
         self, user_id: UUID
     ) -> NotificationSettingResponse:
-        setting = await self.preference_repo.get_notification_setting(user_id)
+        async def load():
+            setting = await self.preference_repo.get_notification_setting(user_id)
 
-        if not setting:
-            setting = await self.preference_repo.create_notification_setting(user_id)
+            if not setting:
+                setting = await self.preference_repo.create_notification_setting(
+                    user_id
+                )
+            return setting
 
-        return NotificationSettingResponse.model_validate(setting)
+        return await self._get_or_load(
+            NOTIFICATIONS, user_id, NotificationSettingResponse, load
+        )
+
+    async def get_many_notification_settings(
+        self, user_ids: Sequence[UUID]
+    ) -> Tuple[List[NotificationSettingResponse], List[UUID]]:
+        return await self._get_many(
+            NOTIFICATIONS,
+            user_ids,
+            NotificationSettingResponse,
+            self.preference_repo.get_notification_settings,
+        )
 
     async def update_notification_settings(
         self, user_id: UUID, data: NotificationSettingUpdate
     ) -> NotificationSettingResponse:
         setting = await self.preference_repo.update_notification_setting(user_id, data)
-        return NotificationSettingResponse.model_validate(setting)
+        response = NotificationSettingResponse.model_validate(setting)
+        await self._write_through(NOTIFICATIONS, user_id, response)
+        return response
 
     # Privacy Settings
     async def get_privacy_settings(self, user_id: UUID) -> PrivacySettingResponse:
-        setting = await self.preference_repo.get_privacy_setting(user_id)
+        async def load():
+            setting = await self.preference_repo.get_privacy_setting(user_id)
 
-        if not setting:
-            setting = await self.preference_repo.create_privacy_setting(user_id)
+            if not setting:
+                setting = await self.preference_repo.create_privacy_setting(user_id)
+            return setting
 
-        return PrivacySettingResponse.model_validate(setting)
+        return await self._get_or_load(PRIVACY, user_id, PrivacySettingResponse, load)
+
+    async def get_many_privacy_settings(
+        self, user_ids: Sequence[UUID]
+    ) -> Tuple[List[PrivacySettingResponse], List[UUID]]:
+        return await self._get_many(
+            PRIVACY,
+            user_ids,
+            PrivacySettingResponse,
+            self.preference_repo.get_privacy_settings,
+        )
 
     async def update_privacy_settings(
         self, user_id: UUID, data: PrivacySettingUpdate
     ) -> PrivacySettingResponse:
         setting = await self.preference_repo.update_privacy_setting(user_id, data)
-        return PrivacySettingResponse.model_validate(setting)
+        response = PrivacySettingResponse.model_validate(setting)
+        await self._write_through(PRIVACY, user_id, response)
+        return response
+
+    # Settings Bundle
+    async def get_all_settings(self, user_id: UUID) -> UserSettingsResponse:
+        """
+        Read every settings kind of a user together.
+
+        Cached kinds are fetched with one MGET of the same keys the single
+        kind reads use. Any misses are loaded with one joined query, missing
+        rows are created with defaults, and the loaded kinds and their
+        versions are filled back in one pipeline, only where the key is
+        still missing.
+        """
+        kinds = {
+            PREFERENCES: UserPreferenceResponse,
+            NOTIFICATIONS: NotificationSettingResponse,
+            PRIVACY: PrivacySettingResponse,
+        }
+        found = {}
+
+        if self.cache is not None:
+            cached = await self.cache.get_many(
+                [preference_cache_key(kind, user_id) for kind in kinds],
+                local=True,
+            )
+            for kind, model in kinds.items():
+                value = cached.get(preference_cache_key(kind, user_id))
+                if value is not None:
+                    found[kind] = model.model_validate(value)
+
+        missing = [kind for kind in kinds if kind not in found]
+        if missing:
+            preference, notification, privacy = (
+                await self.preference_repo.get_all_settings(user_id)
+            )
+            rows = {
+                PREFERENCES: preference,
+                NOTIFICATIONS: notification,
+                PRIVACY: privacy,
+            }
+            create = {
+                PREFERENCES: self.preference_repo.create_user_preference,
+                NOTIFICATIONS: self.preference_repo.create_notification_setting,
+                PRIVACY: self.preference_repo.create_privacy_setting,
+            }
+            for kind in missing:
+                row = rows[kind] or await create[kind](user_id)
+                found[kind] = kinds[kind].model_validate(row)
+
+            if self.cache is not None:
+                fills = []
+                for kind in missing:
+                    fills.append(
+                        CacheWrite(
+                            preference_cache_key(kind, user_id),
+                            found[kind].model_dump(mode="json"),
+                            expire=settings.PREFERENCE_CACHE_TTL,
+                            local=True,
+                            nx=True,
+                        )
+                    )
+                    fills.append(
+                        CacheWrite(
+                            preference_version_key(kind, user_id),
+                            found[kind].version,
+                            expire=settings.PREFERENCE_CACHE_TTL,
+                            nx=True,
+                            raw=True,
+                        )
+                    )
+                await self.cache.set_many(fills)
+
+        return UserSettingsResponse(
+            preferences=found[PREFERENCES],
+            notifications=found[NOTIFICATIONS],
+            privacy=found[PRIVACY],
+        )
 
     # Consent Management
     async def grant_or_revoke_consent(
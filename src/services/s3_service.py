@@ -1,8 +1,11 @@
-
+import asyncio
+import inspect
 import aioboto3
 import mimetypes
+from contextlib import AsyncExitStack
 from uuid import uuid4
-from typing import Optional, Union, Any
+from typing import Awaitable, Callable, Dict, List, Optional, Union, Any
+from aiobotocore.config import AioConfig
 from fastapi import UploadFile
 from botocore.exceptions import ClientError
 
@@ -11,13 +14,175 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# S3 rejects multipart parts smaller than 5 MiB, except the last one
+MIN_PART_SIZE = 5 * 1024 * 1024
+
 
 class S3Service:
-    def __init__(self):
+    """
+    S3 uploads over one long-lived client.
+
+    The client, its credentials and its connection pool are created once by
+    start() (or on first use) and shared by every upload. Files larger than
+    one part are streamed as multipart uploads. A part is only read once one
+    of S3_MULTIPART_CONCURRENCY slots is free, so memory per upload is
+    bounded by part size times concurrency rather than by the file size.
+    """
+
+    def __init__(
+        self,
+        part_size: int = settings.S3_MULTIPART_PART_SIZE,
+        concurrency: int = settings.S3_MULTIPART_CONCURRENCY,
+    ):
         self.bucket = settings.AWS_S3_BUCKET
         self.region = settings.AWS_REGION
         self.aws_key = settings.AWS_ACCESS_KEY_ID
         self.aws_secret = settings.AWS_SECRET_ACCESS_KEY
+        self.endpoint_url = settings.S3_ENDPOINT_URL
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self.concurrency = concurrency
+        self._client = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """Create the shared S3 client"""
+        async with self._lock:
+            if self._client is not None:
+                return
+            session = aioboto3.Session()
+            self._exit_stack = AsyncExitStack()
+            self._client = await self._exit_stack.enter_async_context(
+                session.client(
+                    "s3",
+                    region_name=self.region,
+                    endpoint_url=self.endpoint_url,
+                    aws_access_key_id=self.aws_key,
+                    aws_secret_access_key=self.aws_secret,
+                    config=AioConfig(
+                        max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS
+                    ),
+                )
+            )
+
+    async def close(self) -> None:
+        """Close the shared S3 client and its connections"""
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+        self._exit_stack = None
+        self._client = None
+
+    async def _get_client(self):
+        if self._client is None:
+            await self.start()
+        return self._client
+
+    def object_url(self, object_key: str) -> str:
+        if self.endpoint_url:
+            return f"{self.endpoint_url.rstrip('/')}/{self.bucket}/{object_key}"
+        return f"https://{self.bucket}.s3.amazonaws.com/{object_key}"
+
+    @staticmethod
+    def _reader(file: Any) -> Callable[[int], Awaitable[bytes]]:
+        """Async read(size) over bytes, UploadFile or any object with read()"""
+        if isinstance(file, (bytes, bytearray)):
+            view = memoryview(file)
+            offset = 0
+
+            async def read_bytes(size: int) -> bytes:
+                nonlocal offset
+                chunk = bytes(view[offset : offset + size])
+                offset += len(chunk)
+                return chunk
+
+            return read_bytes
+
+        read = getattr(file, "read", None)
+        if read is None:
+            raise TypeError("file must be UploadFile, bytes, or have a read() method")
+        if isinstance(file, UploadFile) or inspect.iscoroutinefunction(read):
+            return read
+
+        async def read_sync(size: int) -> bytes:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, read, size)
+
+        return read_sync
+
+    @staticmethod
+    async def _read_part(read: Callable[[int], Awaitable[bytes]], size: int) -> bytes:
+        """Read exactly size bytes unless the file ends first"""
+        chunks = []
+        remaining = size
+        while remaining > 0:
+            chunk = await read(remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+
+    async def _multipart_upload(
+        self,
+        client: Any,
+        object_key: str,
+        content_type: str,
+        read: Callable[[int], Awaitable[bytes]],
+        slots: asyncio.Semaphore,
+        first_part: bytes,
+    ) -> None:
+        """
+        Upload parts concurrently, reading each one only once a slot is free.
+        A part holds its slot from the read until its upload finishes;
+        first_part was read under a slot the caller already holds.
+        """
+        upload = await client.create_multipart_upload(
+            Bucket=self.bucket, Key=object_key, ContentType=content_type
+        )
+        upload_id = upload["UploadId"]
+        tasks: List[asyncio.Task] = []
+
+        async def upload_part(part_number: int, body: bytes) -> Dict[str, Any]:
+            try:
+                response = await client.upload_part(
+                    Bucket=self.bucket,
+                    Key=object_key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                )
+                return {"PartNumber": part_number, "ETag": response["ETag"]}
+            finally:
+                slots.release()
+
+        try:
+            part, part_number = first_part, 1
+            while part:
+                failed = next((t for t in tasks if t.done() and t.exception()), None)
+                if failed is not None:
+                    slots.release()
+                    raise failed.exception()
+                tasks.append(asyncio.create_task(upload_part(part_number, part)))
+                part_number += 1
+                await slots.acquire()
+                part = await self._read_part(read, self.part_size)
+            slots.release()
+
+            parts = await asyncio.gather(*tasks)
+            await client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=object_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await client.abort_multipart_upload(
+                Bucket=self.bucket, Key=object_key, UploadId=upload_id
+            )
+            raise
 
     async def upload_file(
         self,
@@ -25,53 +190,43 @@ class S3Service:
         key: Optional[str] = None,
     ) -> Optional[str]:
         """
-        Simple async upload using aioboto3.
-        - file: FastAPI UploadFile, bytes, or an object with async read().
+        Async upload over the shared client.
+        - file: FastAPI UploadFile, bytes, or an object with read().
         - key: optional S3 object key; generated if missing.
+        Files shorter than one part are sent with a single PUT; larger ones
+        are streamed as a multipart upload.
         Returns URL on success, None on failure.
         """
 
-        filename = None
-        content_type = None
-        data: bytes
-
-        if isinstance(file, UploadFile):
-            filename = file.filename
-            content_type = file.content_type or mimetypes.guess_type(filename or "")[0] or "application/octet-stream"
-            data = await file.read()
-
-        elif isinstance(file, (bytes, bytearray)):
-            data = bytes(file)
+        if isinstance(file, (bytes, bytearray)):
+            filename = None
             content_type = "application/octet-stream"
-
         else:
-            read = getattr(file, "read", None)
-            if read is None:
-                raise TypeError("file must be UploadFile, bytes, or have a read() method")
-            try:
-                data = await read()
-            except TypeError:
-                import asyncio
-                loop = asyncio.get_running_loop()
-                data = await loop.run_in_executor(None, read)
             filename = getattr(file, "filename", None) or getattr(file, "name", None)
             content_type = getattr(file, "content_type", None) or mimetypes.guess_type(filename or "")[0] or "application/octet-stream"
 
         object_key = key or (f"{uuid4().hex}-{filename}" if filename else uuid4().hex)
+        read = self._reader(file)
 
-        session = aioboto3.Session()
-        extra_args = {"ContentType": content_type}
         try:
-            async with session.client(
-                "s3",
-                region_name=self.region,
-                aws_access_key_id=self.aws_key,
-                aws_secret_access_key=self.aws_secret,
-            ) as client:
-                await client.put_object(Bucket=self.bucket, Key=object_key, Body=data, **extra_args)
-                url = f"https://{self.bucket}.s3.amazonaws.com/{object_key}"
+            client = await self._get_client()
+            # Bounds the parts held in memory as well as the parts in flight
+            slots = asyncio.Semaphore(self.concurrency)
+            await slots.acquire()
+            first_part = await self._read_part(read, self.part_size)
+            if len(first_part) < self.part_size:
+                await client.put_object(
+                    Bucket=self.bucket,
+                    Key=object_key,
+                    Body=first_part,
+                    ContentType=content_type,
+                )
+            else:
+                await self._multipart_upload(
+                    client, object_key, content_type, read, slots, first_part
+                )
             logger.info("Uploaded %s to %s", object_key, self.bucket)
-            return url
+            return self.object_url(object_key)
 
         except ClientError as err:
             logger.error("S3 upload failed for %s: %s", object_key, err)
@@ -79,3 +234,6 @@ class S3Service:
         except Exception as exc:
             logger.exception("Unexpected error uploading to S3 for %s: %s", object_key, exc)
             return None
+
+
+s3_service = S3Service()
@@ -0,0 +1,575 @@
+import asyncio
+import json
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+from fakeredis import aioredis as fakeredis
+
+from src.config.cache import (
+    CacheEntry,
+    CacheWrite,
+    LocalCache,
+    RedisConnectionManager,
+    SingleFlight,
+)
+from src.utils.serialization import (
+    ForeignEntryError,
+    JSONCodec,
+    StaleEntryError,
+    VersionedCodec,
+    get_codec,
+)
+
+
+@pytest.mark.unit
+class TestLocalCache:
+    """Test suite for the in-process LocalCache"""
+
+    def test_get_returns_stored_value(self):
+        """Test a stored value is returned and counted as a hit"""
+        cache = LocalCache(maxsize=10, ttl=30)
+        cache.set("user:1", {"is_active": True})
+
+        assert cache.get("user:1") == {"is_active": True}
+        assert cache.hits == 1
+        assert cache.misses == 0
+
+    def test_evicts_least_recently_used_entry(self):
+        """Test the least recently used entry is evicted when full"""
+        cache = LocalCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now the least recently used
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_expired_entry_is_a_miss(self):
+        """Test entries are dropped once their TTL has passed"""
+        cache = LocalCache(maxsize=10, ttl=30)
+
+        with patch("src.config.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("src.config.cache.time.monotonic", return_value=131.0):
+            assert cache.get("a") is None
+
+        assert len(cache) == 0
+        assert cache.misses == 1
+
+
+@pytest.mark.unit
+class TestCacheEntry:
+    """Test suite for soft expiry decisions on CacheEntry"""
+
+    def test_plain_value_never_refreshes(self):
+        """Test values written without a soft TTL are never refreshed"""
+        entry = CacheEntry.from_raw({"is_active": True})
+
+        assert entry.value == {"is_active": True}
+        assert entry.should_refresh() is False
+
+    def test_stale_value_always_refreshes(self):
+        """Test values past their soft expiry are always refreshed"""
+        entry = CacheEntry("value", soft_expiry=1000.0, delta=0.0)
+
+        with patch("src.config.cache.time.time", return_value=1001.0):
+            assert entry.should_refresh() is True
+
+    def test_fresh_value_with_zero_delta_is_not_refreshed(self):
+        """Test a fresh value that is free to compute is never refreshed early"""
+        entry = CacheEntry("value", soft_expiry=1000.0, delta=0.0)
+
+        with patch("src.config.cache.time.time", return_value=999.0):
+            assert entry.should_refresh() is False
+
+    def test_expensive_value_is_refreshed_early(self):
+        """Test XFetch refreshes expensive values ahead of their soft expiry"""
+        entry = CacheEntry("value", soft_expiry=1000.0, delta=2.0)
+
+        # -2.0 * log(1 - 0.9) is about 4.6s of early refresh
+        with patch("src.config.cache.time.time", return_value=996.0), patch(
+            "src.config.cache.random.random", return_value=0.9
+        ):
+            assert entry.should_refresh() is True
+
+    def test_round_trips_through_raw_envelope(self):
+        """Test the stored envelope decodes to the same entry"""
+        entry = CacheEntry({"is_active": True}, soft_expiry=1000.0, delta=0.5)
+
+        assert CacheEntry.from_raw(entry.to_raw()) == entry
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Test suite for SingleFlight request coalescing"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_loader(self):
+        """Test concurrent callers for one key share a single loader call"""
+        # Arrange
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"user_id": "1"}
+
+        # Act
+        waiters = [
+            asyncio.ensure_future(single_flight.do("user:1", loader))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        # Assert
+        assert calls == 1
+        assert all(result == {"user_id": "1"} for result in results)
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared_and_key_is_released(self):
+        """Test a failing loader fails every waiter and allows a retry"""
+        # Arrange
+        single_flight = SingleFlight()
+
+        async def failing_loader():
+            raise RuntimeError("DB Error")
+
+        async def loader():
+            return 1
+
+        # Act & Assert
+        with pytest.raises(RuntimeError):
+            await single_flight.do("user:1", failing_loader)
+        assert await single_flight.do("user:1", loader) == 1
+
+
+@pytest.mark.unit
+class TestRedisConnectionManagerLocalTier:
+    """Test suite for the local tier of RedisConnectionManager"""
+
+    @pytest.fixture
+    def local_cache(self):
+        return LocalCache(maxsize=10, ttl=30)
+
+    @pytest.fixture
+    def manager(self, local_cache):
+        manager = RedisConnectionManager("redis://test", local_cache)
+        manager._redis_client = AsyncMock()
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_local_hit_skips_redis(self, manager, local_cache):
+        """Test a local hit does not reach Redis"""
+        # Arrange
+        local_cache.set("user:1", {"is_active": True})
+
+        # Act
+        result = await manager.get("user:1", local=True)
+
+        # Assert
+        assert result == {"is_active": True}
+        manager._redis_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_populates_local_tier(self, manager, local_cache):
+        """Test values read from Redis are kept in process memory"""
+        # Arrange
+        manager._redis_client.get.return_value = manager._codec.encode(
+            {"is_active": True}
+        )
+
+        # Act
+        await manager.get("user:1", local=True)
+
+        # Assert
+        assert local_cache.get("user:1") == {"is_active": True}
+
+    @pytest.mark.asyncio
+    async def test_overwrite_publishes_invalidation(self, manager):
+        """Test overwriting a locally cached key notifies other processes"""
+        # Arrange
+        manager._redis_client.set.return_value = True
+
+        # Act
+        await manager.set("user:1", {"is_active": False}, local=True)
+
+        # Assert
+        manager._redis_client.publish.assert_called_once()
+        channel, message = manager._redis_client.publish.call_args.args
+        assert json.loads(message)["keys"] == ["user:1"]
+
+    @pytest.mark.asyncio
+    async def test_nx_fill_does_not_publish(self, manager):
+        """Test read-through fills do not broadcast invalidations"""
+        # Arrange
+        manager._redis_client.set.return_value = True
+
+        # Act
+        await manager.set("user:1", {"is_active": True}, nx=True, local=True)
+
+        # Assert
+        manager._redis_client.publish.assert_not_called()
+
+    def test_invalidation_from_other_process_evicts_key(self, manager, local_cache):
+        """Test invalidations published elsewhere drop the local copy"""
+        # Arrange
+        local_cache.set("user:1", {"is_active": True})
+        message = json.dumps({"origin": "other-worker", "keys": ["user:1"]})
+
+        # Act
+        manager._handle_invalidation(message)
+
+        # Assert
+        assert local_cache.get("user:1") is None
+
+    def test_own_invalidation_is_ignored(self, manager, local_cache):
+        """Test a process keeps entries it wrote itself"""
+        # Arrange
+        local_cache.set("user:1", {"is_active": True})
+        message = json.dumps({"origin": manager._instance_id, "keys": ["user:1"]})
+
+        # Act
+        manager._handle_invalidation(message)
+
+        # Assert
+        assert local_cache.get("user:1") == {"is_active": True}
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_fills_cache_on_miss(self, manager, local_cache):
+        """Test a miss calls the loader once and fills the cache with NX"""
+        # Arrange
+        manager._redis_client.get.return_value = None
+        manager._redis_client.set.return_value = True
+        loader = AsyncMock(return_value={"is_active": True})
+
+        # Act
+        result = await manager.get_or_load("user:1", loader, expire=60, local=True)
+
+        # Assert
+        assert result == {"is_active": True}
+        loader.assert_awaited_once()
+        assert manager._redis_client.set.call_args.kwargs["nx"] is True
+        assert local_cache.get("user:1") == {"is_active": True}
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_serves_stale_value_and_refreshes(self, manager):
+        """Test a stale entry is returned at once and reloaded in the background"""
+        # Arrange
+        stale = CacheEntry({"is_active": True}, soft_expiry=0.0).to_raw()
+        manager._redis_client.get.return_value = manager._codec.encode(stale)
+        manager._redis_client.set.return_value = True
+        loader = AsyncMock(return_value={"is_active": False})
+
+        # Act
+        result = await manager.get_or_load("user:1", loader, expire=60, stale_ttl=30)
+        await asyncio.gather(*manager._refresh_tasks.values())
+
+        # Assert
+        assert result == {"is_active": True}
+        loader.assert_awaited_once()
+        written = manager._codec.decode(manager._redis_client.set.call_args.args[1])
+        assert written["value"] == {"is_active": False}
+        assert written["soft_expiry"] > 0
+
+    @pytest.mark.asyncio
+    async def test_get_many_reads_misses_with_one_mget(self, manager, local_cache):
+        """Test local hits are served in process and the rest in one MGET"""
+        # Arrange
+        local_cache.set("user:1", {"is_active": True})
+        manager._redis_client.mget.return_value = [
+            manager._codec.encode({"is_active": False}),
+            None,
+        ]
+
+        # Act
+        result = await manager.get_many(["user:1", "user:2", "user:3"], local=True)
+
+        # Assert
+        assert result == {"user:1": {"is_active": True}, "user:2": {"is_active": False}}
+        manager._redis_client.mget.assert_called_once_with(["user:2", "user:3"])
+        assert local_cache.get("user:2") == {"is_active": False}
+
+
+@pytest.mark.unit
+class TestRedisConnectionManagerMultiKey:
+    """Test suite for the pipelined multi-key operations"""
+
+    @pytest.fixture
+    def local_cache(self):
+        return LocalCache(maxsize=10, ttl=30)
+
+    @pytest.fixture
+    def manager(self, local_cache):
+        manager = RedisConnectionManager("redis://test", local_cache)
+        manager._redis_client = fakeredis.FakeRedis(decode_responses=False)
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_set_many_applies_per_key_options(self, manager, local_cache):
+        """Test each write keeps its own TTL and local tier setting"""
+        # Act
+        await manager.set_many(
+            [
+                CacheWrite("refresh_token:1", "token", expire=3600),
+                CacheWrite(
+                    "user:1", {"is_active": True}, expire=60, local=True, stale_ttl=30
+                ),
+            ]
+        )
+
+        # Assert
+        assert await manager.get("refresh_token:1") == "token"
+        assert await manager.get("user:1") == {"is_active": True}
+        assert 3590 < await manager._redis_client.ttl("refresh_token:1") <= 3600
+        assert await manager._redis_client.ttl("user:1") > 60
+        assert local_cache.get("refresh_token:1") is None
+        assert CacheEntry.from_raw(local_cache.get("user:1")).soft_expiry is not None
+
+    @pytest.mark.asyncio
+    async def test_set_many_is_one_round_trip(self, manager):
+        """Test writes and the invalidation are sent as a single pipeline"""
+        # Arrange
+        pipe = manager._redis_client.pipeline(transaction=False)
+        pipe.execute = AsyncMock()
+
+        # Act
+        with patch.object(manager._redis_client, "pipeline", return_value=pipe):
+            await manager.set_many(
+                [
+                    CacheWrite("a", 1),
+                    CacheWrite("b", 2, local=True),
+                ]
+            )
+
+        # Assert
+        pipe.execute.assert_awaited_once()
+        commands = [args[0] for args, _ in pipe.command_stack]
+        assert commands == ["SET", "SET", "PUBLISH"]
+
+    @pytest.mark.asyncio
+    async def test_set_many_nx_keeps_existing_values(self, manager, local_cache):
+        """Test NX fills leave newer values alone and publish nothing"""
+        # Arrange
+        await manager.set("a", "newer")
+
+        # Act
+        with patch.object(manager, "_invalidation_message") as message:
+            await manager.set_many(
+                [
+                    CacheWrite("a", "filled", local=True, nx=True),
+                    CacheWrite("b", "filled", local=True, nx=True),
+                ]
+            )
+
+        # Assert
+        assert await manager.get_many(["a", "b"]) == {"a": "newer", "b": "filled"}
+        assert local_cache.get("a") is None
+        assert local_cache.get("b") == "filled"
+        message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_many_removes_every_tier(self, manager, local_cache):
+        """Test delete_many drops keys from Redis and process memory"""
+        # Arrange
+        await manager.set_many(
+            [CacheWrite("a", 1, local=True), CacheWrite("b", 2, local=True)]
+        )
+
+        # Act
+        await manager.delete_many(["a", "b"], local=True)
+
+        # Assert
+        assert await manager.get_many(["a", "b"], local=True) == {}
+        assert len(local_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_compare_and_set_swaps_only_the_expected_value(self, manager):
+        """Test a stale expected value leaves the key untouched"""
+        # Arrange
+        await manager.set("refresh_token:1", "old", expire=3600, raw=True)
+
+        # Act
+        swapped = await manager.compare_and_set("refresh_token:1", "old", "new")
+        replayed = await manager.compare_and_set("refresh_token:1", "old", "other")
+
+        # Assert
+        assert swapped is True
+        assert replayed is False
+        assert await manager._redis_client.get("refresh_token:1") == b"new"
+
+    @pytest.mark.asyncio
+    async def test_set_if_newer_keeps_the_newest_version(self, manager, local_cache):
+        """Test an older write reaching Redis last does not replace a newer one"""
+        # Act
+        first = await manager.set_if_newer(
+            "preference:1", {"theme": "dark"}, "version:1", 3, local=True
+        )
+        late = await manager.set_if_newer(
+            "preference:1", {"theme": "light"}, "version:1", 2, local=True
+        )
+
+        # Assert
+        assert first is True
+        assert late is False
+        assert await manager.get("preference:1") == {"theme": "dark"}
+        assert await manager.get_many(["version:1"], raw=True) == {"version:1": b"3"}
+        assert local_cache.get("preference:1") is None
+
+    @pytest.mark.asyncio
+    async def test_set_if_newer_replaces_nx_fills(self, manager):
+        """Test a newer write replaces a read-through fill of an older row"""
+        # Arrange
+        await manager.set_many(
+            [
+                CacheWrite("preference:1", {"theme": "dark"}, nx=True),
+                CacheWrite("version:1", 1, nx=True, raw=True),
+            ]
+        )
+
+        # Act
+        written = await manager.set_if_newer(
+            "preference:1", {"theme": "light"}, "version:1", 2
+        )
+
+        # Assert
+        assert written is True
+        assert await manager.get("preference:1") == {"theme": "light"}
+        assert await manager.get_many(["version:1"], raw=True) == {"version:1": b"2"}
+
+    @pytest.mark.asyncio
+    async def test_raw_values_survive_a_format_change(self, manager):
+        """Test raw values do not depend on the cache codec or schema version"""
+        # Arrange
+        await manager.set_many(
+            [CacheWrite("refresh_token:1", "old", expire=3600, raw=True)]
+        )
+        manager._codec = get_codec("json", manager._codec.version + 1)
+
+        # Act
+        swapped = await manager.compare_and_set("refresh_token:1", "old", "new")
+
+        # Assert
+        assert swapped is True
+        assert await manager._redis_client.get("refresh_token:1") == b"new"
+
+
+@pytest.mark.unit
+class TestRedisConnectionManagerDistributedLoad:
+    """Test suite for loads coordinated across processes by a Redis lock"""
+
+    @pytest.fixture
+    def manager(self):
+        manager = RedisConnectionManager("redis://test")
+        manager._redis_client = fakeredis.FakeRedis(decode_responses=False)
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_waiter_stops_when_lock_released_without_value(self, manager):
+        """Test waiters load themselves once the holder caches nothing"""
+        # Arrange
+        holder = manager._redis_client.lock("lock:user:1", timeout=5)
+        await holder.acquire()
+        loader = AsyncMock(return_value=None)
+
+        async def release_soon():
+            await asyncio.sleep(0.1)
+            await holder.release()
+
+        # Act
+        started = time.monotonic()
+        _, result = await asyncio.gather(
+            release_soon(),
+            manager.get_or_load("user:1", loader, distributed=True),
+        )
+
+        # Assert
+        assert result is None
+        loader.assert_awaited_once()
+        assert time.monotonic() - started < 1
+
+
+@pytest.mark.unit
+class TestVersionedCodec:
+    """Test suite for the versioned cache value format"""
+
+    @pytest.fixture
+    def manager(self):
+        manager = RedisConnectionManager("redis://test")
+        manager._redis_client = AsyncMock()
+        return manager
+
+    @pytest.mark.parametrize("name", ["json", "msgpack"])
+    def test_round_trip(self, name):
+        """Test values survive encoding with either codec"""
+        # Arrange
+        codec = get_codec(name, version=1)
+        value = {"user_id": str(uuid4()), "is_active": True, "role": "user"}
+
+        # Act & Assert
+        assert codec.codec.name == name
+        assert codec.decode(codec.encode(value)) == value
+
+    def test_older_versions_are_stale(self):
+        """Test entries from an older schema version or a legacy format are stale"""
+        # Arrange
+        old = get_codec("json", version=1)
+        new = get_codec("json", version=2)
+
+        # Act & Assert
+        with pytest.raises(StaleEntryError):
+            new.decode(old.encode({"is_active": True}))
+        with pytest.raises(StaleEntryError):
+            new.decode(b'{"is_active": true}')
+
+    def test_newer_versions_and_other_codecs_are_foreign(self):
+        """Test entries another release could still read are not stale"""
+        # Arrange
+        codec = get_codec("json", version=2)
+
+        # Act & Assert
+        with pytest.raises(ForeignEntryError):
+            codec.decode(get_codec("json", version=3).encode({"is_active": True}))
+        with pytest.raises(ForeignEntryError):
+            codec.decode(get_codec("msgpack", version=2).encode({"is_active": True}))
+
+    def test_unknown_codec_is_rejected(self):
+        """Test a misconfigured codec fails instead of falling back"""
+        with pytest.raises(ValueError):
+            get_codec("pickle", version=1)
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_a_miss_and_removed(self, manager):
+        """Test a stale entry is not served and is deleted for the refill"""
+        # Arrange
+        stale = VersionedCodec(JSONCodec(), manager._codec.version - 1)
+        manager._redis_client.get.return_value = stale.encode({"is_active": True})
+
+        # Act
+        result = await manager.get("user:1")
+
+        # Assert
+        assert result is None
+        manager._redis_client.delete.assert_called_once_with("user:1")
+
+    @pytest.mark.asyncio
+    async def test_foreign_entry_is_a_miss_and_kept(self, manager):
+        """Test an entry from a newer release is not served or deleted"""
+        # Arrange
+        newer = VersionedCodec(JSONCodec(), manager._codec.version + 1)
+        manager._redis_client.get.return_value = newer.encode({"is_active": True})
+
+        # Act
+        result = await manager.get("user:1")
+
+        # Assert
+        assert result is None
+        manager._redis_client.delete.assert_not_called()
@@ -0,0 +1,90 @@
+import pytest
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from src.config.database import DatabaseSessionManager, engine_options
+from src.config.settings import settings
+
+
+@pytest.mark.unit
+class TestEngineOptions:
+    """Test suite for pool configuration"""
+
+    def test_grpc_overrides_fall_back_to_http_settings(self, monkeypatch):
+        """Test unset gRPC overrides reuse the DB_* values"""
+        # Arrange
+        monkeypatch.setattr(settings, "DB_POOL_SIZE", 7)
+        monkeypatch.setattr(settings, "GRPC_DB_POOL_SIZE", None)
+        monkeypatch.setattr(settings, "GRPC_DB_MAX_OVERFLOW", 3)
+
+        # Act
+        http = engine_options()
+        grpc = engine_options(grpc=True)
+
+        # Assert
+        assert http["pool_size"] == grpc["pool_size"] == 7
+        assert http["max_overflow"] == settings.DB_MAX_OVERFLOW
+        assert grpc["max_overflow"] == 3
+        assert grpc["pool_pre_ping"] is settings.DB_POOL_PRE_PING
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestDatabaseSessionManager:
+    """Test suite for pool lifecycle helpers"""
+
+    async def test_reconfigure_applies_new_pool_size(self):
+        """Test the engine is rebuilt with the new options"""
+        # Arrange
+        manager = DatabaseSessionManager(
+            settings.sqlalchemy_database_uri, engine_options()
+        )
+
+        # Act
+        await manager.reconfigure({**engine_options(), "pool_size": 3})
+
+        # Assert
+        assert manager.pool_status() == {
+            "size": 3,
+            "checked_in": 0,
+            "checked_out": 0,
+            "overflow": 0,
+        }
+        await manager.close()
+
+    async def test_read_session_uses_primary_without_replicas(self):
+        """Test reads stay on the caller's session when no replica is set"""
+        # Arrange
+        manager = DatabaseSessionManager(settings.sqlalchemy_database_uri)
+        primary = MagicMock()
+
+        # Act
+        async with manager.read_session(primary, uuid4()) as session:
+            pass
+
+        # Assert
+        assert session is primary
+        await manager.close()
+
+    async def test_read_session_sticks_to_primary_after_write(self):
+        """Test a user's reads go to the primary right after they write"""
+        # Arrange
+        manager = DatabaseSessionManager(
+            settings.sqlalchemy_database_uri,
+            replica_hosts=[settings.sqlalchemy_database_uri],
+        )
+        primary = MagicMock()
+        writer, reader = uuid4(), uuid4()
+
+        # Act
+        await manager.pin_to_primary(writer)
+        async with manager.read_session(primary, writer) as writer_session:
+            pass
+        async with manager.read_session(primary, reader) as reader_session:
+            replica_bind = reader_session.bind
+
+        # Assert
+        assert writer_session is primary
+        assert reader_session is not primary
+        assert replica_bind is manager._replica_engines[0]
+        await manager.close()
@@ -0,0 +1,73 @@
+import grpc
+import pytest
+from unittest.mock import MagicMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from src.config.metrics import MetricsInterceptor, MetricsMiddleware
+
+
+def sample(name, labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.unit
+class TestMetricsMiddleware:
+    """Test suite for HTTP request metrics"""
+
+    def test_requests_are_labelled_by_route_template(self):
+        """Test path parameters do not create new label values"""
+        # Arrange
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: int):
+            return {"item_id": item_id}
+
+        labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+        before = sample("http_requests_total", labels)
+
+        # Act
+        client = TestClient(app)
+        client.get("/items/1")
+        client.get("/items/2")
+
+        # Assert
+        assert sample("http_requests_total", labels) == before + 2
+
+
+@pytest.mark.unit
+class TestMetricsInterceptor:
+    """Test suite for gRPC call metrics"""
+
+    @pytest.mark.asyncio
+    async def test_unary_call_is_counted_with_status(self):
+        """Test a unary call records its status code and latency"""
+        # Arrange
+        async def behavior(request, context):
+            return "response"
+
+        handler = grpc.unary_unary_rpc_method_handler(behavior)
+
+        async def continuation(details):
+            return handler
+
+        details = MagicMock(method="/user.UserPreferenceService/GetPreference")
+        context = MagicMock()
+        context.code.return_value = None
+        labels = {"method": "GetPreference", "code": "OK"}
+        before = sample("grpc_server_handled_total", labels)
+
+        # Act
+        wrapped = await MetricsInterceptor().intercept_service(continuation, details)
+        response = await wrapped.unary_unary("request", context)
+
+        # Assert
+        assert response == "response"
+        assert sample("grpc_server_handled_total", labels) == before + 1
+        assert sample(
+            "grpc_server_handling_seconds_count", {"method": "GetPreference"}
+        ) >= 1
@@ -0,0 +1,161 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.config.cache import RedisConnectionManager
+from src.config.rate_limiter import (
+    HybridRateLimiter,
+    RateLimit,
+    RateLimiter,
+    RateLimitResult,
+    ip_key,
+    route_key,
+)
+from src.utils.exceptions import RateLimitExceededException
+
+
+def make_request(path="/api/v1/auth/login", host="10.0.0.1"):
+    return Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "path": path,
+            "headers": [],
+            "query_string": b"",
+            "client": (host, 1234),
+            "route": MagicMock(path=path),
+        }
+    )
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    """Test suite for the Redis script backed rate limiter"""
+
+    @pytest.fixture
+    def script(self):
+        return AsyncMock(return_value=[1, 4, "0", "12.5"])
+
+    @pytest.fixture
+    def cache(self, script):
+        cache = RedisConnectionManager("redis://test")
+        cache._redis_client = MagicMock()
+        cache._redis_client.register_script.return_value = script
+        return cache
+
+    @pytest.mark.asyncio
+    async def test_check_is_a_single_script_call(self, cache, script):
+        """Test each check runs the registered script exactly once"""
+        # Arrange
+        limiter = RateLimiter(cache, limit=5, period=60)
+
+        # Act
+        first = await limiter.check("ip:10.0.0.1")
+        await limiter.check("ip:10.0.0.1")
+
+        # Assert
+        assert first == RateLimitResult(True, 5, 4, 12.5, 0.0)
+        cache._redis_client.register_script.assert_called_once()
+        assert script.await_count == 2
+        assert script.call_args.kwargs["keys"] == ["rate_limit:ip:10.0.0.1"]
+        assert script.call_args.kwargs["args"] == [5, 60, 1]
+
+    @pytest.mark.asyncio
+    async def test_fails_open_without_redis(self):
+        """Test requests are allowed when Redis is not connected"""
+        limiter = RateLimiter(RedisConnectionManager("redis://test"), limit=5)
+
+        result = await limiter.check("ip:10.0.0.1")
+
+        assert result.allowed is True
+
+    @pytest.mark.asyncio
+    async def test_dependency_sets_headers(self, cache):
+        """Test allowed requests carry RateLimit headers"""
+        # Arrange
+        dependency = RateLimit(limit=5, period=60, cache=cache)
+        response = Response()
+
+        # Act
+        await dependency(make_request(), response)
+
+        # Assert
+        assert response.headers["RateLimit-Limit"] == "5"
+        assert response.headers["RateLimit-Remaining"] == "4"
+        assert response.headers["RateLimit-Reset"] == "13"
+
+    @pytest.mark.asyncio
+    async def test_dependency_rejects_with_retry_after(self, cache, script):
+        """Test exhausted limits raise a 429 with Retry-After"""
+        # Arrange
+        script.return_value = [0, 0, "11.2", "59.9"]
+        dependency = RateLimit(limit=5, period=60, cache=cache)
+
+        # Act & Assert
+        with pytest.raises(RateLimitExceededException) as exc_info:
+            await dependency(make_request(), Response())
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers["Retry-After"] == "12"
+        assert exc_info.value.headers["RateLimit-Remaining"] == "0"
+
+    def test_route_key_scopes_by_route_and_ip(self):
+        """Test route keys differ per route but share the client IP"""
+        login = route_key(make_request("/api/v1/auth/login"))
+        register = route_key(make_request("/api/v1/auth/register"))
+
+        assert login != register
+        assert login.endswith(ip_key(make_request()))
+
+
+@pytest.mark.unit
+class TestHybridRateLimiter:
+    """Test suite for the in-process rate limiter synced through Redis"""
+
+    @pytest.fixture
+    def pipeline(self):
+        pipeline = MagicMock()
+        pipeline.execute = AsyncMock(return_value=[3, True])
+        return pipeline
+
+    @pytest.fixture
+    def cache(self, pipeline):
+        cache = RedisConnectionManager("redis://test")
+        cache._redis_client = MagicMock()
+        cache._redis_client.pipeline.return_value = pipeline
+        return cache
+
+    @pytest.mark.asyncio
+    async def test_admits_locally_without_redis_round_trip(self, cache, pipeline):
+        """Test checks under the unsynced cap do not wait on Redis"""
+        # Arrange
+        limiter = HybridRateLimiter(
+            cache, limit=5, period=60, sync_interval=60, max_unsynced=10
+        )
+
+        # Act
+        results = [await limiter.check("ip:10.0.0.1") for _ in range(6)]
+
+        # Assert
+        assert [result.allowed for result in results] == [True] * 5 + [False]
+        assert results[4].remaining == 0
+        pipeline.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reaching_unsynced_cap_flushes_counts(self, cache, pipeline):
+        """Test the cluster-wide count is fetched once the cap is reached"""
+        # Arrange
+        limiter = HybridRateLimiter(
+            cache, limit=5, period=60, sync_interval=60, max_unsynced=2
+        )
+        pipeline.execute.return_value = [5, True]  # others used 3 already
+
+        # Act
+        results = [await limiter.check("ip:10.0.0.1") for _ in range(3)]
+
+        # Assert
+        assert [result.allowed for result in results] == [True, True, False]
+        pipeline.incrby.assert_called_once()
+        assert pipeline.incrby.call_args.args[1] == 2
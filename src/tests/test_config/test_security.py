@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import pytest
+from datetime import timedelta
+from unittest.mock import patch
+
+from src.config.security import (
+    PasswordHasher,
+    SecurityManager,
+    TokenVerificationCache,
+)
+from src.utils.exceptions import InvalidTokenException, ServiceUnavailableException
+
+
+@pytest.mark.unit
+class TestPasswordHasher:
+    """Test suite for the password hashing worker pool"""
+
+    @pytest.fixture
+    def hasher(self):
+        hasher = PasswordHasher("thread", max_workers=1, max_pending=1)
+        yield hasher
+        hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop(self, hasher):
+        """Test hashing runs on a pool thread, not the event loop thread"""
+        with patch.object(
+            SecurityManager,
+            "hash_password",
+            side_effect=lambda password: threading.current_thread().name,
+        ):
+            thread_name = await hasher.hash("Password1!")
+
+        assert thread_name.startswith("password-hasher")
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_saturated(self, hasher):
+        """Test calls beyond the pending limit fail fast"""
+        release = threading.Event()
+
+        with patch.object(
+            SecurityManager, "verify_password", side_effect=lambda *_: release.wait()
+        ):
+            running = asyncio.ensure_future(hasher.verify("Password1!", "hash"))
+            await asyncio.sleep(0)
+
+            with pytest.raises(ServiceUnavailableException):
+                await hasher.verify("Password1!", "hash")
+
+            release.set()
+            assert await running is True
+
+
+@pytest.mark.unit
+class TestTokenVerificationCache:
+    """Test suite for the per-process JWT verification cache"""
+
+    @pytest.fixture
+    def token_cache(self):
+        return TokenVerificationCache(maxsize=10)
+
+    @pytest.fixture
+    def access_token(self):
+        return SecurityManager.create_access_token({"user_id": "1"})
+
+    def test_repeated_token_is_verified_once(self, token_cache, access_token):
+        """Test a cached token is not decoded again"""
+        with patch.object(
+            SecurityManager, "decode_token", wraps=SecurityManager.decode_token
+        ) as decode:
+            first = token_cache.decode(access_token)
+            second = token_cache.decode(access_token)
+
+        assert first == second
+        assert first["user_id"] == "1"
+        decode.assert_called_once_with(access_token)
+        assert token_cache.hits == 1
+        assert token_cache.misses == 1
+
+    def test_invalid_token_is_not_cached(self, token_cache):
+        """Test failed verifications raise every time"""
+        for _ in range(2):
+            with pytest.raises(InvalidTokenException):
+                token_cache.decode("not-a-token")
+
+        assert token_cache.hits == 0
+
+    def test_entry_expires_with_token(self, token_cache):
+        """Test a cached payload is dropped once the token expires"""
+        token = SecurityManager.create_access_token(
+            {"user_id": "1"}, expires_delta=timedelta(seconds=60)
+        )
+        with patch("src.config.cache.time.monotonic", return_value=0.0):
+            token_cache.decode(token)
+
+        with patch("src.config.cache.time.monotonic", return_value=61.0), patch.object(
+            SecurityManager, "decode_token", return_value={"user_id": "1"}
+        ) as decode:
+            token_cache.decode(token)
+
+        decode.assert_called_once_with(token)
@@ -0,0 +1,154 @@
+import json
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.messaging.outbox_relay import OutboxRelay
+from src.messaging.producer import RabbitMQProducer
+from src.models import OutboxEvent
+from src.repositories.outbox_repo import OutboxRepository
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestOutboxRelay:
+    """Test suite for OutboxRelay"""
+
+    @pytest.fixture
+    def session(self):
+        """Create a mocked AsyncSession"""
+        return AsyncMock()
+
+    @pytest.fixture
+    def mock_outbox_repo(self):
+        """Create a mocked OutboxRepository"""
+        return AsyncMock(spec=OutboxRepository)
+
+    @pytest.fixture
+    def mock_producer(self):
+        """Create a mocked RabbitMQProducer"""
+        return AsyncMock(spec=RabbitMQProducer)
+
+    @pytest.fixture
+    def relay(self, session, mock_producer):
+        """Create an OutboxRelay using the mocked session and producer"""
+
+        @asynccontextmanager
+        async def session_factory():
+            yield session
+
+        return OutboxRelay(
+            mock_producer, session_factory, batch_size=10, max_attempts=5
+        )
+
+    async def test_relay_once_publishes_then_deletes(
+        self, relay, session, mock_outbox_repo, mock_producer
+    ):
+        """Test claimed events are published and removed in one transaction"""
+        # Arrange
+        user_id = uuid4()
+        event = OutboxEvent(
+            id=uuid4(),
+            aggregate_id=user_id,
+            event_type="user.registered",
+            queue="user.registered",
+            payload={"user_id": str(user_id)},
+            created_at=datetime(2026, 1, 1),
+            attempts=0,
+        )
+        mock_outbox_repo.claim_batch.return_value = [event]
+
+        # Act
+        with patch(
+            "src.messaging.outbox_relay.OutboxRepository",
+            MagicMock(return_value=mock_outbox_repo),
+        ):
+            sent = await relay.relay_once()
+
+        # Assert
+        assert sent == 1
+        queue, body = mock_producer.publish.call_args.args
+        assert queue == "user.registered"
+        assert json.loads(body)["event_id"] == str(event.id)
+        assert mock_producer.publish.call_args.kwargs["message_id"] == str(event.id)
+        mock_outbox_repo.delete_events.assert_called_once_with([event.id])
+        session.commit.assert_called_once()
+
+    async def test_relay_once_keeps_events_when_publish_fails(
+        self, relay, session, mock_outbox_repo, mock_producer
+    ):
+        """Test events stay in the outbox if the broker does not confirm"""
+        # Arrange
+        mock_outbox_repo.claim_batch.return_value = [
+            OutboxEvent(
+                id=uuid4(),
+                aggregate_id=uuid4(),
+                event_type="user.verified",
+                queue="user.verified",
+                payload={},
+                created_at=datetime(2026, 1, 1),
+            )
+        ]
+        mock_producer.publish.side_effect = ConnectionError("broker down")
+
+        # Act
+        with patch(
+            "src.messaging.outbox_relay.OutboxRepository",
+            MagicMock(return_value=mock_outbox_repo),
+        ):
+            with pytest.raises(ConnectionError):
+                await relay.relay_once()
+
+        # Assert
+        mock_outbox_repo.delete_events.assert_not_called()
+        session.commit.assert_not_called()
+
+    async def test_relay_once_keeps_only_the_failed_event(
+        self, relay, session, mock_outbox_repo, mock_producer
+    ):
+        """Test one failed publish does not hold back the rest of the batch"""
+        # Arrange
+        events = [
+            OutboxEvent(
+                id=uuid4(),
+                aggregate_id=uuid4(),
+                event_type="user.registered",
+                queue=queue,
+                payload={},
+                created_at=datetime(2026, 1, 1),
+                attempts=attempts,
+            )
+            for queue, attempts in [
+                ("user.registered", 0),
+                ("bad", 4),
+                ("user.registered", 0),
+            ]
+        ]
+        mock_outbox_repo.claim_batch.return_value = events
+
+        async def publish(queue, body, message_id):
+            if queue == "bad":
+                raise ValueError("queue not found")
+
+        mock_producer.publish.side_effect = publish
+
+        # Act
+        with patch(
+            "src.messaging.outbox_relay.OutboxRepository",
+            MagicMock(return_value=mock_outbox_repo),
+        ), patch("src.messaging.outbox_relay.logger") as logger:
+            sent = await relay.relay_once()
+
+        # Assert
+        assert sent == 2
+        mock_outbox_repo.delete_events.assert_called_once_with(
+            [events[0].id, events[2].id]
+        )
+        mock_outbox_repo.record_failures.assert_called_once_with(
+            {events[1].id: "ValueError: queue not found"}
+        )
+        logger.error.assert_called_once()
+        session.commit.assert_called_once()
+        session.rollback.assert_not_called()
@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.messaging.producer import RabbitMQProducer
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRabbitMQProducer:
+    """Test suite for the batching RabbitMQ publisher"""
+
+    @pytest.fixture
+    def channel(self):
+        """Create a mocked confirm-mode channel"""
+        channel = MagicMock()
+        channel.is_closed = False
+        channel.declare_queue = AsyncMock()
+        channel.default_exchange.publish = AsyncMock()
+        return channel
+
+    @pytest.fixture
+    async def producer(self, monkeypatch, channel):
+        """Create a producer connected to a mocked broker"""
+        monkeypatch.setattr(RabbitMQProducer, "_instance", None)
+        connection = MagicMock()
+        connection.channel = AsyncMock(return_value=channel)
+        connection.close = AsyncMock()
+
+        producer = RabbitMQProducer(pool_size=2, batch_size=10, buffer_size=50)
+        with patch(
+            "src.messaging.producer.connect_robust",
+            AsyncMock(return_value=connection),
+        ):
+            await producer.connect()
+        yield producer
+        await producer.close()
+
+    async def test_queue_is_declared_once(self, producer, channel):
+        """Test declarations are cached across messages and channels"""
+        # Act
+        await asyncio.gather(
+            *(producer.publish("user.registered", f'{{"n": {i}}}') for i in range(200))
+        )
+
+        # Assert
+        channel.declare_queue.assert_called_once_with("user.registered")
+        assert channel.default_exchange.publish.call_count == 200
+
+    async def test_publish_raises_when_not_confirmed(self, producer, channel):
+        """Test a broker failure reaches the caller waiting on the confirm"""
+        # Arrange
+        channel.default_exchange.publish.side_effect = ConnectionError("nack")
+
+        # Act & Assert
+        with pytest.raises(ConnectionError):
+            await producer.publish("user.verified", "{}")
@@ -0,0 +1,73 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from sqlalchemy import select
+
+from src.models import OutboxEvent
+from src.repositories.outbox_repo import OutboxRepository
+
+
+@pytest.fixture
+def repo(db_session):
+    return OutboxRepository(db_session)
+
+
+async def add_events(db_session, count: int, attempts: int = 0):
+    """Store count events, oldest first"""
+    start = datetime(2026, 1, 1)
+    events = [
+        OutboxEvent(
+            aggregate_id=uuid4(),
+            event_type="user.registered",
+            queue="user.registered",
+            payload={},
+            created_at=start + timedelta(seconds=i),
+            attempts=attempts,
+        )
+        for i in range(count)
+    ]
+    db_session.add_all(events)
+    await db_session.commit()
+    return events
+
+
+@pytest.mark.integration
+class TestOutboxRepositoryFailures:
+    """Test suite for retry accounting on outbox events"""
+
+    @pytest.mark.asyncio
+    async def test_record_failures_counts_attempts(self, repo, db_session):
+        """Test each recorded failure bumps attempts and keeps the error"""
+        # Arrange
+        event, other = await add_events(db_session, 2)
+
+        # Act
+        await repo.record_failures({event.id: "ValueError: bad payload"})
+        await repo.record_failures({event.id: "ValueError: still bad"})
+        await db_session.commit()
+
+        # Assert
+        rows = {
+            row.id: row
+            for row in await db_session.scalars(
+                select(OutboxEvent).execution_options(populate_existing=True)
+            )
+        }
+        assert rows[event.id].attempts == 2
+        assert rows[event.id].last_error == "ValueError: still bad"
+        assert rows[other.id].attempts == 0
+        assert rows[other.id].last_error is None
+
+    @pytest.mark.asyncio
+    async def test_claim_batch_skips_exhausted_events(self, repo, db_session):
+        """Test events at the attempt limit no longer block the batch"""
+        # Arrange
+        exhausted = await add_events(db_session, 1, attempts=5)
+        pending = await add_events(db_session, 2, attempts=4)
+
+        # Act
+        claimed = await repo.claim_batch(limit=10, max_attempts=5)
+
+        # Assert
+        assert [event.id for event in claimed] == [event.id for event in pending]
+        assert exhausted[0].id not in {event.id for event in claimed}
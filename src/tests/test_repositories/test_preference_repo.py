@@ -0,0 +1,183 @@
+import pytest
+from uuid import uuid4
+from sqlalchemy import select
+
+from src.models import OutboxEvent, User, UserPreference
+from src.repositories.preference_repo import PreferenceRepository
+from src.schemas.user_preference import (
+    NotificationSettingUpdate,
+    PrivacySettingUpdate,
+    UserPreferenceUpdate,
+)
+
+
+async def create_user(db_session) -> User:
+    user = User(
+        id=uuid4(),
+        email=f"{uuid4().hex}@example.com",
+        password_hash="not-a-real-hash",
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest.fixture
+async def user(db_session):
+    """A stored user for settings rows to reference"""
+    return await create_user(db_session)
+
+
+@pytest.fixture
+def repo(db_session):
+    return PreferenceRepository(db_session)
+
+
+@pytest.mark.integration
+class TestPreferenceRepositoryUpsert:
+    """Test suite for the INSERT ... ON CONFLICT settings upsert"""
+
+    @pytest.mark.asyncio
+    async def test_first_write_inserts_with_defaults(self, repo, user):
+        """Test the first write creates the row with column defaults"""
+        # Act
+        preference = await repo.update_user_preference(
+            user.id, UserPreferenceUpdate(theme="dark")
+        )
+
+        # Assert
+        assert preference.user_id == user.id
+        assert preference.theme == "dark"
+        assert preference.language == "en"
+        assert preference.currency == "NGN"
+        assert preference.version == 1
+
+    @pytest.mark.asyncio
+    async def test_partial_update_keeps_other_columns(
+        self, repo, user, db_session
+    ):
+        """Test an update changes only the sent fields and bumps the version"""
+        # Arrange
+        await repo.update_user_preference(
+            user.id, UserPreferenceUpdate(theme="dark", language="fr")
+        )
+
+        # Act
+        preference = await repo.update_user_preference(
+            user.id, UserPreferenceUpdate(currency="EUR")
+        )
+
+        # Assert
+        assert preference.currency == "EUR"
+        assert preference.theme == "dark"
+        assert preference.language == "fr"
+        assert preference.version == 2
+        events = (
+            await db_session.scalars(
+                select(OutboxEvent)
+                .where(OutboxEvent.aggregate_id == user.id)
+                .order_by(OutboxEvent.created_at)
+            )
+        ).all()
+        assert [event.payload["changes"] for event in events] == [
+            {"theme": "dark", "language": "fr"},
+            {"currency": "EUR"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_update_returns_existing_row(self, repo, user, db_session):
+        """Test creating defaults for an existing row leaves it unchanged"""
+        # Arrange
+        existing = await repo.update_user_preference(
+            user.id, UserPreferenceUpdate(theme="dark")
+        )
+        updated_at = existing.updated_at
+
+        # Act
+        preference = await repo.create_user_preference(user.id)
+
+        # Assert
+        assert preference.id == existing.id
+        assert preference.theme == "dark"
+        assert preference.updated_at == updated_at
+        assert preference.version == 1
+        rows = (
+            await db_session.scalars(
+                select(UserPreference).where(UserPreference.user_id == user.id)
+            )
+        ).all()
+        assert len(rows) == 1
+
+
+@pytest.mark.integration
+class TestPreferenceRepositoryStreamAudience:
+    """Test suite for the chunked audience export query"""
+
+    @pytest.fixture
+    async def audience(self, repo, db_session):
+        """Users with and without privacy settings, by name"""
+        users = {
+            name: await create_user(db_session)
+            for name in ("with_privacy", "without_privacy", "opted_out")
+        }
+        await repo.update_notification_setting(
+            users["with_privacy"].id, NotificationSettingUpdate(email_enabled=True)
+        )
+        await repo.update_privacy_setting(
+            users["with_privacy"].id, PrivacySettingUpdate(show_email=True)
+        )
+        await repo.update_notification_setting(
+            users["without_privacy"].id,
+            NotificationSettingUpdate(email_enabled=True),
+        )
+        await repo.update_notification_setting(
+            users["opted_out"].id, NotificationSettingUpdate(email_enabled=False)
+        )
+        return users
+
+    @pytest.mark.asyncio
+    async def test_notification_filter_keeps_users_without_privacy(
+        self, repo, audience
+    ):
+        """Test matches without privacy settings come back with None"""
+        # Act
+        chunks = [
+            chunk
+            async for chunk in repo.stream_audience({"email_enabled": True}, {}, 10)
+        ]
+
+        # Assert
+        rows = {notification.user_id: privacy for notification, privacy in chunks[0]}
+        assert set(rows) == {
+            audience["with_privacy"].id,
+            audience["without_privacy"].id,
+        }
+        assert rows[audience["with_privacy"].id].show_email is True
+        assert rows[audience["without_privacy"].id] is None
+
+    @pytest.mark.asyncio
+    async def test_privacy_filter_excludes_users_without_privacy(
+        self, repo, audience
+    ):
+        """Test a privacy filter only matches users with privacy settings"""
+        # Act
+        chunks = [
+            chunk
+            async for chunk in repo.stream_audience(
+                {"email_enabled": True}, {"show_email": True}, 10
+            )
+        ]
+
+        # Assert
+        assert [
+            [notification.user_id for notification, _ in chunk] for chunk in chunks
+        ] == [[audience["with_privacy"].id]]
+
+    @pytest.mark.asyncio
+    async def test_rows_are_streamed_in_chunks(self, repo, audience):
+        """Test every matching row is yielded, chunk_size rows at a time"""
+        # Act
+        chunks = [chunk async for chunk in repo.stream_audience({}, {}, 2)]
+
+        # Assert
+        assert [len(chunk) for chunk in chunks] == [2, 1]
@@ -0,0 +1,124 @@
+import pytest
+from datetime import datetime
+from uuid import UUID, uuid4
+from unittest.mock import AsyncMock, MagicMock
+
+from src.config.deps import get_current_user
+from src.main import app
+from src.routes.v1.user_preference_settings import (
+    _etag_matches,
+    get_preference_service,
+)
+from src.schemas.user_preference import UserPreferenceResponse
+from src.services.preference_service import settings_etag
+
+
+@pytest.mark.unit
+class TestEtagMatches:
+    """Test suite for If-None-Match parsing"""
+
+    def test_missing_header_never_matches(self):
+        """Test no If-None-Match means the body is always sent"""
+        assert not _etag_matches(None, '"abc-1"')
+        assert not _etag_matches("", '"abc-1"')
+
+    def test_matches_any_listed_tag(self):
+        """Test a tag anywhere in the list matches"""
+        assert _etag_matches('"abc-1"', '"abc-1"')
+        assert _etag_matches('"abc-0", "abc-1"', '"abc-1"')
+        assert not _etag_matches('"abc-0", "abc-2"', '"abc-1"')
+
+    def test_weak_tags_are_compared_weakly(self):
+        """Test W/ tags match their strong counterpart"""
+        assert _etag_matches('W/"abc-1"', '"abc-1"')
+
+    def test_wildcard_matches_anything(self):
+        """Test * matches any current tag"""
+        assert _etag_matches("*", '"abc-1"')
+
+
+@pytest.mark.unit
+class TestConditionalPreferences:
+    """Test suite for conditional GETs on the settings routes"""
+
+    @pytest.fixture
+    def user_id(self):
+        return UUID("c4e9c473-f1f4-4a8b-9f12-2332e36aea03")
+
+    @pytest.fixture
+    def service(self, user_id):
+        service = MagicMock()
+        service.get_cached_etag = AsyncMock(return_value=None)
+        service.get_preferences = AsyncMock(
+            return_value=UserPreferenceResponse(
+                id=uuid4(),
+                user_id=user_id,
+                language="en",
+                created_at=datetime(2025, 1, 1),
+                updated_at=datetime(2025, 1, 1),
+                version=3,
+            )
+        )
+        return service
+
+    @pytest.fixture
+    async def api(self, client, service, mock_current_user):
+        app.dependency_overrides[get_current_user] = mock_current_user
+        app.dependency_overrides[get_preference_service] = lambda: service
+        return client
+
+    @pytest.mark.asyncio
+    async def test_get_sends_user_scoped_etag_and_vary(self, api, user_id):
+        """Test a 200 carries the ETag, Cache-Control and Vary headers"""
+        # Act
+        response = await api.get("/api/v1/settings/preferences")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["ETag"] == settings_etag(user_id, 3)
+        assert response.headers["Cache-Control"] == "private, no-cache"
+        assert "Authorization" in response.headers["Vary"]
+
+    @pytest.mark.asyncio
+    async def test_matching_version_mirror_answers_304(self, api, service, user_id):
+        """Test a cached ETag match returns 304 without loading the settings"""
+        # Arrange
+        etag = settings_etag(user_id, 3)
+        service.get_cached_etag.return_value = etag
+
+        # Act
+        response = await api.get(
+            "/api/v1/settings/preferences", headers={"If-None-Match": f"W/{etag}"}
+        )
+
+        # Assert
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert "Authorization" in response.headers["Vary"]
+        service.get_preferences.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_wildcard_answers_304_after_loading(self, api, service, user_id):
+        """Test * matches once the settings are loaded, without the mirror"""
+        # Act
+        response = await api.get(
+            "/api/v1/settings/preferences", headers={"If-None-Match": "*"}
+        )
+
+        # Assert
+        assert response.status_code == 304
+        assert response.headers["ETag"] == settings_etag(user_id, 3)
+        service.get_preferences.assert_called_once_with(user_id)
+
+    @pytest.mark.asyncio
+    async def test_other_users_etag_gets_the_body(self, api, user_id):
+        """Test an ETag issued to another account does not produce a 304"""
+        # Act
+        response = await api.get(
+            "/api/v1/settings/preferences",
+            headers={"If-None-Match": settings_etag(uuid4(), 3)},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["data"]["version"] == 3
@@ -0,0 +1,133 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiosmtplib
+
+from src.services.email_service import EmailService
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestEmailService:
+    """Test suite for pooled and queued email sending"""
+
+    @pytest.fixture
+    def templates_dir(self, tmp_path):
+        """Create a directory with a single test template"""
+        (tmp_path / "hello.html").write_text("<p>Hello {{ name }}</p>")
+        return tmp_path
+
+    @pytest.fixture
+    def smtp_clients(self):
+        """Patch aiosmtplib.SMTP and collect every client it creates"""
+        clients = []
+
+        def create_client(**kwargs):
+            client = MagicMock()
+            client.is_connected = True
+            client.connect = AsyncMock()
+            client.noop = AsyncMock()
+            client.quit = AsyncMock()
+            client.send_message = AsyncMock()
+            clients.append(client)
+            return client
+
+        with patch(
+            "src.services.email_service.aiosmtplib.SMTP", side_effect=create_client
+        ):
+            yield clients
+
+    @pytest.fixture
+    def email_service(self, templates_dir):
+        """Create an EmailService with complete SMTP settings"""
+        return EmailService(
+            templates_dir=templates_dir,
+            smtp_host="smtp.example.com",
+            smtp_port=587,
+            username="user",
+            password="secret",
+            workers=2,
+        )
+
+    async def test_connections_are_reused(self, email_service, smtp_clients):
+        """Test consecutive sends share one authenticated connection"""
+        # Act
+        for i in range(5):
+            sent = await email_service.send_email(
+                f"user{i}@example.com", "Hi", "hello.html", {"name": i}
+            )
+            assert sent is True
+
+        # Assert
+        assert len(smtp_clients) == 1
+        smtp_clients[0].connect.assert_called_once()
+        assert smtp_clients[0].send_message.call_count == 5
+
+    async def test_dropped_connection_is_replaced(self, email_service, smtp_clients):
+        """Test a send on a connection the server closed is retried"""
+        # Arrange
+        await email_service.send_email("a@example.com", "Hi", "hello.html")
+        smtp_clients[0].send_message.side_effect = (
+            aiosmtplib.SMTPServerDisconnected("gone")
+        )
+
+        # Act
+        sent = await email_service.send_email("b@example.com", "Hi", "hello.html")
+
+        # Assert
+        assert sent is True
+        assert len(smtp_clients) == 2
+        smtp_clients[1].send_message.assert_called_once()
+
+    async def test_enqueued_emails_are_sent_on_close(
+        self, email_service, smtp_clients
+    ):
+        """Test enqueue returns before sending and close drains the queue"""
+        # Act
+        for i in range(10):
+            assert await email_service.enqueue_email(
+                f"user{i}@example.com", "Hi", "hello.html", {"name": i}
+            )
+        await email_service.close()
+
+        # Assert
+        assert sum(c.send_message.call_count for c in smtp_clients) == 10
+        assert len(smtp_clients) <= 2
+
+    async def test_plaintext_is_rendered_from_compiled_template(
+        self, email_service, templates_dir
+    ):
+        """Test the plaintext part comes from a template derived once"""
+        # Arrange
+        (templates_dir / "receipt.html").write_text(
+            "<html><head><style>p { color: red; }</style></head>"
+            "<body><p>Hi {{ name }},</p>\n<p>You paid {{ amount | currency }}</p>"
+            "</body></html>"
+        )
+        email_service.precompile_templates()
+
+        # Act
+        html, text = await email_service._render(
+            "receipt.html", {"name": "Ada & Co", "amount": 12.5}
+        )
+
+        # Assert
+        assert email_service.get_template("receipt.html").text is not None
+        assert "Hi Ada &amp; Co," in html
+        assert text == "Hi Ada & Co, You paid $12.50"
+
+    async def test_plaintext_falls_back_to_rendered_html(
+        self, email_service, templates_dir
+    ):
+        """Test templates with comparisons are stripped after rendering"""
+        # Arrange
+        (templates_dir / "alert.html").write_text(
+            "<p>{% if balance < 10 %}Low balance{% else %}OK{% endif %}</p>"
+        )
+
+        # Act
+        _, text = await email_service._render("alert.html", {"balance": 5})
+
+        # Assert
+        assert email_service.get_template("alert.html").text is None
+        assert text == "Low balance"
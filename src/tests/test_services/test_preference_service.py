@@ -3,7 +3,13 @@ import pytest
 from uuid import uuid4
 from unittest.mock import AsyncMock, MagicMock
 
-from src.services.preference_service import PreferenceService
+from src.config.cache import RedisConnectionManager
+from src.services.preference_service import (
+    PreferenceService,
+    preference_cache_key,
+    preference_version_key,
+    settings_etag,
+)
 from src.repositories.preference_repo import PreferenceRepository
 from src.schemas.user_preference import (
     UserPreferenceUpdate,
@@ -33,6 +39,22 @@ class TestPreferenceService:
         """Create a PreferenceService instance with mocked repository"""
         return PreferenceService(mock_preference_repo)
 
+    @pytest.fixture
+    def mock_cache(self):
+        """Create a mocked RedisConnectionManager with an empty cache"""
+        cache = AsyncMock(spec=RedisConnectionManager)
+
+        async def get_or_load(key, loader, **kwargs):
+            return await loader()
+
+        cache.get_or_load.side_effect = get_or_load
+        return cache
+
+    @pytest.fixture
+    def cached_preference_service(self, mock_preference_repo, mock_cache):
+        """Create a PreferenceService instance backed by the mocked cache"""
+        return PreferenceService(mock_preference_repo, mock_cache)
+
     @pytest.fixture
     def sample_user_id(self):
         """Generate a sample user ID"""
@@ -61,6 +83,7 @@ class TestPreferenceService:
             timezone="America/New_York",
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
+            version=1,
         )
 
         mock_preference_repo.get_user_preference.return_value = existing_preference
@@ -97,6 +120,7 @@ class TestPreferenceService:
             timezone="America/New_York",
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
+            version=1,
         )
 
         mock_preference_repo.get_user_preference.return_value = None
@@ -135,6 +159,7 @@ class TestPreferenceService:
             timezone="Europe/Paris",
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
+            version=1,
         )
 
         mock_preference_repo.update_user_preference.return_value = updated_response
@@ -171,6 +196,7 @@ class TestPreferenceService:
             timezone="America/New_York",  # Unchanged
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
+            version=1,
         )
 
         mock_preference_repo.update_user_preference.return_value = updated_preference
@@ -215,6 +241,7 @@ class TestPreferenceService:
             push_security_alerts=True,
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
+            version=1,
         )
 
         mock_preference_repo.get_notification_setting.return_value = existing_setting
@@ -253,6 +280,7 @@ class TestPreferenceService:
             push_enabled=True,
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
+            version=1,
         )
 
         mock_preference_repo.get_notification_setting.return_value = None
@@ -290,6 +318,7 @@ class TestPreferenceService:
             push_enabled=False,
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
+            version=1,
         )
 
         mock_preference_repo.update_notification_setting.return_value = updated_setting
@@ -331,6 +360,7 @@ class TestPreferenceService:
             allow_third_party_sharing=False,
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
+            version=1,
         )
 
         mock_preference_repo.get_privacy_setting.return_value = existing_setting
@@ -369,6 +399,7 @@ class TestPreferenceService:
             allow_third_party_sharing=False,
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
+            version=1,
         )
 
         mock_preference_repo.get_privacy_setting.return_value = None
@@ -419,6 +450,7 @@ class TestPreferenceService:
             allow_third_party_sharing=False,
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
+            version=1,
         )
 
         mock_preference_repo.update_privacy_setting.return_value = updated_setting
@@ -628,3 +660,330 @@ class TestPreferenceService:
         # Act & Assert
         with pytest.raises(Exception):
             await preference_service.get_notification_settings(sample_user_id)
+
+    # =========================================================================
+    # CACHE TESTS
+    # =========================================================================
+
+    @pytest.mark.asyncio
+    async def test_get_preferences_cache_hit_skips_repository(
+        self,
+        cached_preference_service,
+        mock_preference_repo,
+        mock_cache,
+        sample_user_id
+    ):
+        """Test a cached preference is returned without touching the database"""
+        # Arrange
+        cached = UserPreferenceResponse(
+            id=uuid4(),
+            user_id=sample_user_id,
+            language="fr",
+            currency="EUR",
+            theme="dark",
+            timezone="Europe/Paris",
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+            version=1,
+        )
+        mock_cache.get_or_load.side_effect = None
+        mock_cache.get_or_load.return_value = cached.model_dump(mode="json")
+
+        # Act
+        result = await cached_preference_service.get_preferences(sample_user_id)
+
+        # Assert
+        assert result == cached
+        assert mock_cache.get_or_load.call_args.args[0] == preference_cache_key(
+            "preferences", sample_user_id
+        )
+        mock_preference_repo.get_user_preference.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_privacy_settings_cache_miss_loads_from_repository(
+        self,
+        cached_preference_service,
+        mock_preference_repo,
+        mock_cache,
+        sample_user_id
+    ):
+        """Test a cache miss loads the settings through the repository"""
+        # Arrange
+        setting = UserPrivacySetting(
+            id=uuid4(),
+            user_id=sample_user_id,
+            profile_visible=True,
+            show_email=False,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+            version=1,
+        )
+        mock_preference_repo.get_privacy_setting.return_value = setting
+
+        # Act
+        result = await cached_preference_service.get_privacy_settings(sample_user_id)
+
+        # Assert
+        assert result.profile_visible is True
+        args, kwargs = mock_cache.get_or_load.call_args
+        assert args[0] == preference_cache_key("privacy", sample_user_id)
+        assert kwargs["distributed"] is True
+        mock_preference_repo.get_privacy_setting.assert_called_once_with(
+            sample_user_id
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_notification_settings_overwrites_cache(
+        self,
+        cached_preference_service,
+        mock_preference_repo,
+        mock_cache,
+        sample_user_id
+    ):
+        """Test updates write the new settings through to the cache"""
+        # Arrange
+        update_data = NotificationSettingUpdate(email_marketing=True)
+        updated_setting = UserNotificationSetting(
+            id=uuid4(),
+            user_id=sample_user_id,
+            email_marketing=True,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+            version=1,
+        )
+        mock_preference_repo.update_notification_setting.return_value = updated_setting
+
+        # Act
+        result = await cached_preference_service.update_notification_settings(
+            sample_user_id,
+            update_data
+        )
+
+        # Assert
+        key, value = mock_cache.set_if_newer.call_args.args[:2]
+        assert key == preference_cache_key("notifications", sample_user_id)
+        assert value["email_marketing"] is True
+        assert result.email_marketing is True
+
+    # =========================================================================
+    # BATCH TESTS
+    # =========================================================================
+
+    @pytest.mark.asyncio
+    async def test_get_many_notification_settings_reports_missing(
+        self,
+        cached_preference_service,
+        mock_preference_repo,
+        mock_cache,
+    ):
+        """Test cached ids skip the database and unknown ids are reported"""
+        # Arrange
+        cached_id, stored_id, missing_id = uuid4(), uuid4(), uuid4()
+        cached = NotificationSettingResponse(
+            id=uuid4(),
+            user_id=cached_id,
+            email_enabled=True,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+            version=1,
+        )
+        mock_cache.get_many.return_value = {
+            preference_cache_key("notifications", cached_id): cached.model_dump(
+                mode="json"
+            )
+        }
+        mock_preference_repo.get_notification_settings.return_value = [
+            UserNotificationSetting(
+                id=uuid4(),
+                user_id=stored_id,
+                email_enabled=False,
+                created_at=datetime.utcnow(),
+                updated_at=datetime.utcnow(),
+                version=1,
+            )
+        ]
+
+        # Act
+        found, missing = await cached_preference_service.get_many_notification_settings(
+            [cached_id, stored_id, missing_id, cached_id]
+        )
+
+        # Assert
+        assert [setting.user_id for setting in found] == [cached_id, stored_id]
+        assert missing == [missing_id]
+        mock_preference_repo.get_notification_settings.assert_called_once_with(
+            [stored_id, missing_id]
+        )
+        mock_cache.set.assert_not_called()
+
+    # =========================================================================
+    # SETTINGS BUNDLE TESTS
+    # =========================================================================
+
+    @pytest.mark.asyncio
+    async def test_get_all_settings_cache_hit_skips_repository(
+        self,
+        cached_preference_service,
+        mock_preference_repo,
+        mock_cache,
+        sample_user_id
+    ):
+        """Test a fully cached bundle is read with one MGET and no query"""
+        # Arrange
+        now = datetime.utcnow()
+        cached = {
+            "preferences": UserPreferenceResponse(
+                id=uuid4(), user_id=sample_user_id, created_at=now, updated_at=now,
+                version=1,
+            ),
+            "notifications": NotificationSettingResponse(
+                id=uuid4(), user_id=sample_user_id, created_at=now, updated_at=now,
+                version=1,
+            ),
+            "privacy": PrivacySettingResponse(
+                id=uuid4(), user_id=sample_user_id, created_at=now, updated_at=now,
+                version=1,
+            ),
+        }
+        mock_cache.get_many.return_value = {
+            preference_cache_key(kind, sample_user_id): value.model_dump(mode="json")
+            for kind, value in cached.items()
+        }
+
+        # Act
+        result = await cached_preference_service.get_all_settings(sample_user_id)
+
+        # Assert
+        assert result.preferences == cached["preferences"]
+        assert result.privacy == cached["privacy"]
+        mock_cache.get_many.assert_called_once()
+        mock_preference_repo.get_all_settings.assert_not_called()
+        mock_cache.set_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_all_settings_loads_misses_in_one_query(
+        self,
+        cached_preference_service,
+        mock_preference_repo,
+        mock_cache,
+        sample_user_id
+    ):
+        """Test misses share one joined query and absent rows get defaults"""
+        # Arrange
+        now = datetime.utcnow()
+        mock_cache.get_many.return_value = {}
+        mock_preference_repo.get_all_settings.return_value = (
+            UserPreference(
+                id=uuid4(),
+                user_id=sample_user_id,
+                theme="dark",
+                created_at=now,
+                updated_at=now,
+                version=1,
+            ),
+            UserNotificationSetting(
+                id=uuid4(), user_id=sample_user_id, created_at=now, updated_at=now,
+                version=1,
+            ),
+            None,
+        )
+        mock_preference_repo.create_privacy_setting.return_value = UserPrivacySetting(
+            id=uuid4(), user_id=sample_user_id, created_at=now, updated_at=now,
+                version=1,
+        )
+
+        # Act
+        result = await cached_preference_service.get_all_settings(sample_user_id)
+
+        # Assert
+        assert result.preferences.theme == "dark"
+        mock_preference_repo.get_all_settings.assert_called_once_with(sample_user_id)
+        mock_preference_repo.create_privacy_setting.assert_called_once_with(
+            sample_user_id
+        )
+        writes = list(mock_cache.set_many.call_args.args[0])
+        assert [write.key for write in writes] == [
+            key(kind, sample_user_id)
+            for kind in ("preferences", "notifications", "privacy")
+            for key in (preference_cache_key, preference_version_key)
+        ]
+        assert all(write.nx for write in writes)
+        assert all(write.local for write in writes[::2])
+        assert all(write.raw for write in writes[1::2])
+
+    def test_settings_etag_follows_versions(self, sample_user_id):
+        """Test the ETag changes whenever any of the versions does"""
+        # Act
+        etag = settings_etag(sample_user_id, 1, 2, 3)
+
+        # Assert
+        assert etag.startswith('"') and etag.endswith('-1.2.3"')
+        assert etag == settings_etag(sample_user_id, 1, 2, 3)
+        assert etag != settings_etag(sample_user_id, 1, 2, 4)
+
+    def test_settings_etag_is_scoped_to_the_user(self, sample_user_id):
+        """Test two users with the same versions get different ETags"""
+        # Act & Assert
+        assert settings_etag(sample_user_id, 1) != settings_etag(uuid4(), 1)
+
+    @pytest.mark.asyncio
+    async def test_get_cached_etag_reads_only_the_version_mirror(
+        self,
+        cached_preference_service,
+        mock_preference_repo,
+        mock_cache,
+        sample_user_id
+    ):
+        """Test the cached ETag needs every version and no repository call"""
+        # Arrange
+        keys = [
+            preference_version_key(kind, sample_user_id)
+            for kind in ("preferences", "privacy")
+        ]
+        mock_cache.get_many.return_value = {keys[0]: b"4", keys[1]: b"2"}
+
+        # Act
+        etag = await cached_preference_service.get_cached_etag(
+            sample_user_id, "preferences", "privacy"
+        )
+        mock_cache.get_many.return_value = {keys[0]: b"4"}
+        partial = await cached_preference_service.get_cached_etag(
+            sample_user_id, "preferences", "privacy"
+        )
+
+        # Assert
+        assert etag == settings_etag(sample_user_id, 4, 2)
+        assert partial is None
+        mock_cache.get_many.assert_called_with(keys, raw=True)
+        mock_preference_repo.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_writes_version_mirror_with_value(
+        self,
+        cached_preference_service,
+        mock_preference_repo,
+        mock_cache,
+        sample_user_id
+    ):
+        """Test an update writes the value and its version only if newer"""
+        # Arrange
+        now = datetime.utcnow()
+        mock_preference_repo.update_privacy_setting.return_value = UserPrivacySetting(
+            id=uuid4(),
+            user_id=sample_user_id,
+            show_email=True,
+            created_at=now,
+            updated_at=now,
+            version=5,
+        )
+
+        # Act
+        await cached_preference_service.update_privacy_settings(
+            sample_user_id, PrivacySettingUpdate(show_email=True)
+        )
+
+        # Assert
+        key, _, version_key, version = mock_cache.set_if_newer.call_args.args
+        assert key == preference_cache_key("privacy", sample_user_id)
+        assert version_key == preference_version_key("privacy", sample_user_id)
+        assert version == 5
@@ -0,0 +1,117 @@
+import asyncio
+import io
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from src.services.s3_service import MIN_PART_SIZE, S3Service
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestS3Service:
+    """Test suite for S3Service uploads"""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mocked S3 client"""
+        client = AsyncMock()
+        client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+        client.upload_part.side_effect = lambda **kwargs: {
+            "ETag": f"etag-{kwargs['PartNumber']}"
+        }
+        return client
+
+    @pytest.fixture
+    def s3_service(self, mock_client):
+        """Create an S3Service using the mocked shared client"""
+        service = S3Service(part_size=MIN_PART_SIZE, concurrency=2)
+        service._client = mock_client
+        return service
+
+    async def test_small_file_uses_single_put(self, s3_service, mock_client):
+        """Test files within one part are uploaded with put_object"""
+        # Act
+        url = await s3_service.upload_file(b"avatar", key="avatars/1.png")
+
+        # Assert
+        assert url.endswith("/avatars/1.png")
+        mock_client.put_object.assert_called_once()
+        assert mock_client.put_object.call_args.kwargs["Body"] == b"avatar"
+        mock_client.create_multipart_upload.assert_not_called()
+
+    async def test_large_file_is_streamed_in_parts(self, s3_service, mock_client):
+        """Test larger uploads are split into ordered multipart parts"""
+        # Arrange
+        data = b"x" * (2 * MIN_PART_SIZE + 10)
+        upload = UploadFile(
+            file=io.BytesIO(data),
+            filename="kyc.pdf",
+            headers=Headers({"content-type": "application/pdf"}),
+        )
+
+        # Act
+        url = await s3_service.upload_file(upload)
+
+        # Assert
+        assert url.endswith("-kyc.pdf")
+        mock_client.put_object.assert_not_called()
+        assert mock_client.create_multipart_upload.call_args.kwargs[
+            "ContentType"
+        ] == "application/pdf"
+        sizes = [
+            len(call.kwargs["Body"]) for call in mock_client.upload_part.call_args_list
+        ]
+        assert sizes == [MIN_PART_SIZE, MIN_PART_SIZE, 10]
+        parts = mock_client.complete_multipart_upload.call_args.kwargs[
+            "MultipartUpload"
+        ]["Parts"]
+        assert [part["PartNumber"] for part in parts] == [1, 2, 3]
+
+    async def test_failed_part_aborts_upload(self, s3_service, mock_client):
+        """Test a failed part aborts the multipart upload"""
+        # Arrange
+        mock_client.upload_part.side_effect = ConnectionError("reset")
+
+        # Act
+        with patch("src.services.s3_service.logger"):
+            url = await s3_service.upload_file(b"x" * (3 * MIN_PART_SIZE))
+
+        # Assert
+        assert url is None
+        mock_client.abort_multipart_upload.assert_called_once()
+        mock_client.complete_multipart_upload.assert_not_called()
+
+    async def test_buffered_parts_stay_within_concurrency(
+        self, s3_service, mock_client
+    ):
+        """Test parts are only read once an upload slot is free"""
+        # Arrange
+        state = {"read": 0, "uploaded": 0, "peak": 0}
+
+        class SlowSource:
+            remaining = 6 * MIN_PART_SIZE
+
+            async def read(self, size):
+                chunk = b"x" * min(size, self.remaining)
+                self.remaining -= len(chunk)
+                state["read"] += len(chunk)
+                state["peak"] = max(state["peak"], state["read"] - state["uploaded"])
+                return chunk
+
+        async def upload_part(**kwargs):
+            await asyncio.sleep(0.01)
+            state["uploaded"] += len(kwargs["Body"])
+            return {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+        mock_client.upload_part.side_effect = upload_part
+
+        # Act
+        url = await s3_service.upload_file(SlowSource(), key="kyc/1.pdf")
+
+        # Assert
+        assert url.endswith("/kyc/1.pdf")
+        assert mock_client.upload_part.call_count == 6
+        assert state["peak"] <= s3_service.part_size * s3_service.concurrency
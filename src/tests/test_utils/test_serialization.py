@@ -0,0 +1,46 @@
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+from src.utils.constant import ConsentType
+from src.utils.serialization import JSONResponse, dumps, loads
+
+
+@pytest.mark.unit
+class TestSerialization:
+    """Test suite for the shared JSON serializer"""
+
+    def test_native_types_round_trip(self):
+        """Test UUID, datetime, enum and Decimal values encode as JSON"""
+        # Arrange
+        user_id = uuid4()
+        created_at = datetime(2026, 1, 2, 3, 4, 5)
+
+        # Act
+        data = dumps(
+            {
+                "user_id": user_id,
+                "created_at": created_at,
+                "consent": ConsentType.MARKETING,
+                "balance": Decimal("10.50"),
+            }
+        )
+
+        # Assert
+        assert isinstance(data, bytes)
+        assert loads(data) == {
+            "user_id": str(user_id),
+            "created_at": created_at.isoformat(),
+            "consent": "marketing",
+            "balance": "10.50",
+        }
+
+    def test_response_renders_bytes(self):
+        """Test the default response class renders with the serializer"""
+        # Act
+        response = JSONResponse({"id": uuid4(), "ok": True})
+
+        # Assert
+        assert loads(response.body)["ok"] is True
+        assert response.media_type == "application/json"
@@ -0,0 +1,190 @@
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from src.config.settings import settings
+from src.grpc import user_pref_server
+from src.grpc.proto.server import user_pb2
+from src.models import UserNotificationSetting, UserPreference, UserPrivacySetting
+
+
+@pytest.mark.unit
+class TestExportAudience:
+    """Test suite for the ExportAudience RPC"""
+
+    @pytest.fixture
+    def repo(self):
+        """Repository stand-in recording the stream_audience arguments"""
+        repo = MagicMock()
+        repo.rows = []
+
+        async def stream_audience(notification_filters, privacy_filters, chunk_size):
+            repo.call = (notification_filters, privacy_filters, chunk_size)
+            for start in range(0, len(repo.rows), chunk_size):
+                yield repo.rows[start : start + chunk_size]
+
+        repo.stream_audience = stream_audience
+        return repo
+
+    @pytest.fixture(autouse=True)
+    def patch_repository(self, repo):
+        session_manager = MagicMock()
+
+        @asynccontextmanager
+        async def session():
+            yield None
+
+        session_manager.session = session
+        with (
+            patch.object(user_pref_server, "sessionmanager", session_manager),
+            patch.object(
+                user_pref_server, "PreferenceRepository", lambda session: repo
+            ),
+        ):
+            yield
+
+    async def export(self, request):
+        servicer = user_pref_server.UserPreferenceServiceServicer()
+        return [chunk async for chunk in servicer.ExportAudience(request, None)]
+
+    @pytest.mark.asyncio
+    async def test_only_set_filter_fields_are_applied(self, repo):
+        """Test filters map set proto fields, including False, to columns"""
+        # Arrange
+        request = user_pb2.ExportAudienceRequest(
+            notification_filter=user_pb2.NotificationFilter(
+                email_enabled=True, sms_marketing=False
+            ),
+            privacy_filter=user_pb2.PrivacyFilter(show_email=True),
+            chunk_size=50,
+        )
+
+        # Act
+        await self.export(request)
+
+        # Assert
+        assert repo.call == (
+            {"email_enabled": True, "sms_marketing": False},
+            {"show_email": True},
+            50,
+        )
+
+    @pytest.mark.asyncio
+    async def test_chunk_size_defaults_and_is_capped(self, repo):
+        """Test a missing chunk size uses the default and large ones are capped"""
+        # Act
+        await self.export(user_pb2.ExportAudienceRequest())
+        default = repo.call[2]
+        await self.export(
+            user_pb2.ExportAudienceRequest(
+                chunk_size=settings.GRPC_EXPORT_MAX_CHUNK_SIZE + 1
+            )
+        )
+
+        # Assert
+        assert default == settings.GRPC_EXPORT_CHUNK_SIZE
+        assert repo.call[2] == settings.GRPC_EXPORT_MAX_CHUNK_SIZE
+
+    @pytest.mark.asyncio
+    async def test_members_without_privacy_have_no_privacy(self, repo):
+        """Test chunks mirror the repository chunks and optional privacy"""
+        # Arrange
+        with_privacy, without_privacy = uuid4(), uuid4()
+        repo.rows = [
+            (
+                UserNotificationSetting(user_id=with_privacy, email_enabled=True),
+                UserPrivacySetting(user_id=with_privacy, show_email=False),
+            ),
+            (
+                UserNotificationSetting(user_id=without_privacy, email_enabled=True),
+                None,
+            ),
+        ]
+
+        # Act
+        chunks = await self.export(user_pb2.ExportAudienceRequest(chunk_size=1))
+
+        # Assert
+        members = [member for chunk in chunks for member in chunk.members]
+        assert [len(chunk.members) for chunk in chunks] == [1, 1]
+        assert members[0].user_id == str(with_privacy)
+        assert members[0].HasField("privacy")
+        assert members[0].privacy.show_email is False
+        assert members[1].user_id == str(without_privacy)
+        assert not members[1].HasField("privacy")
+
+
+@pytest.mark.unit
+class TestPartialUpdates:
+    """Test suite for the settings update RPCs"""
+
+    @pytest.fixture
+    def service(self):
+        service = MagicMock()
+        service.update_preferences = AsyncMock()
+        service.update_notification_settings = AsyncMock()
+        service.update_privacy_settings = AsyncMock()
+        return service
+
+    @pytest.fixture(autouse=True)
+    def patch_service(self, service):
+        session_manager = MagicMock()
+
+        @asynccontextmanager
+        async def session():
+            yield None
+
+        session_manager.session = session
+        with (
+            patch.object(user_pref_server, "sessionmanager", session_manager),
+            patch.object(user_pref_server, "PreferenceRepository", MagicMock()),
+            patch.object(
+                user_pref_server, "PreferenceService", lambda *args: service
+            ),
+        ):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_notification_update_sends_only_set_fields(self, service):
+        """Test unset flags are left out rather than written as NULL"""
+        # Arrange
+        user_id = uuid4()
+        service.update_notification_settings.return_value = UserNotificationSetting(
+            user_id=user_id, email_enabled=False
+        )
+        request = user_pb2.UpdateNotificationRequest(
+            user_id=str(user_id),
+            notification=user_pb2.NotificationSetting(email_enabled=False),
+        )
+
+        # Act
+        await user_pref_server.UserPreferenceServiceServicer().UpdateNotificationSetting(
+            request, None
+        )
+
+        # Assert
+        _, data = service.update_notification_settings.call_args.args
+        assert data.model_dump(exclude_unset=True) == {"email_enabled": False}
+
+    @pytest.mark.asyncio
+    async def test_preference_update_skips_empty_strings(self, service):
+        """Test empty preference strings are treated as not sent"""
+        # Arrange
+        user_id = uuid4()
+        service.update_preferences.return_value = UserPreference(
+            user_id=user_id, theme="dark"
+        )
+        request = user_pb2.UpdatePreferenceRequest(
+            user_id=str(user_id),
+            preference=user_pb2.Preference(user_id=str(user_id), theme="dark"),
+        )
+
+        # Act
+        await user_pref_server.UserPreferenceServiceServicer().UpdatePreference(
+            request, None
+        )
+
+        # Assert
+        _, data = service.update_preferences.call_args.args
+        assert data.model_dump(exclude_unset=True) == {"theme": "dark"}
@@ -11,12 +11,14 @@ class BaseAPIException(HTTPException):
         message: str,
         error_code: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
     ):
         self.error_code = error_code
         self.details = details or {}
         super().__init__(
             status_code=status_code,
             detail={"message": message, "error_code": error_code, "details": details},
+            headers=headers,
         )
 
 
@@ -220,6 +222,37 @@ class ServiceException(BaseAPIException):
         )
 
 
+class ServiceUnavailableException(BaseAPIException):
+    """Raised when the service is temporarily overloaded"""
+
+    def __init__(
+        self,
+        message: str = "Service temporarily unavailable, please retry",
+        error_code: str = "SERVICE_UNAVAILABLE",
+    ):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=message,
+            error_code=error_code,
+        )
+
+
+class RateLimitExceededException(BaseAPIException):
+    """Raised when a client has exhausted its rate limit"""
+
+    def __init__(
+        self,
+        message: str = "Rate limit exceeded. Please try again later.",
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            message=message,
+            error_code="RATE_LIMIT_EXCEEDED",
+            headers=headers,
+        )
+
+
 class ExternalServiceException(ServiceException):
     """Raised when external service call fails"""
 
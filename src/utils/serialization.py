@@ -0,0 +1,129 @@
+"""
+JSON serialization shared by HTTP responses, the Redis cache and RabbitMQ.
+
+Backed by orjson, which encodes straight to bytes and handles UUID,
+datetime, date and enum values natively. Cache values go through a
+versioned codec, JSON or msgpack for a more compact binary format.
+"""
+import enum
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Union
+from uuid import UUID
+
+import msgpack
+import orjson
+from fastapi.responses import JSONResponse as _JSONResponse
+from pydantic import BaseModel
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Types orjson does not encode on its own"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to JSON bytes"""
+    return orjson.dumps(obj, default=_default, option=_OPTIONS)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Deserialize JSON bytes or str; raises ValueError when invalid"""
+    return orjson.loads(data)
+
+
+class JSONResponse(_JSONResponse):
+    """Default response class, rendered with dumps instead of json.dumps"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class StaleEntryError(ValueError):
+    """Raised for data written with an older schema version or no header"""
+
+
+class ForeignEntryError(ValueError):
+    """Raised for data written with a newer schema version or another codec"""
+
+
+class JSONCodec:
+    codec_id = 1
+    name = "json"
+
+    def encode(self, value: Any) -> bytes:
+        return dumps(value)
+
+    def decode(self, data: bytes) -> Any:
+        return loads(data)
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Encode types msgpack lacks the way JSON does, so both decode alike"""
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    return _default(obj)
+
+
+class MsgpackCodec:
+    codec_id = 2
+    name = "msgpack"
+
+    def encode(self, value: Any) -> bytes:
+        return msgpack.packb(value, default=_msgpack_default)
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return msgpack.unpackb(data, strict_map_key=False)
+        except (msgpack.UnpackException, ValueError) as e:
+            raise ValueError(str(e)) from e
+
+
+class VersionedCodec:
+    """
+    Prefixes every payload with a schema version byte and a codec id byte.
+
+    decode() raises StaleEntryError for data from an older version, including
+    legacy entries without a header, and ForeignEntryError for data another
+    release or codec can still read.
+    """
+
+    def __init__(self, codec: Union[JSONCodec, MsgpackCodec], version: int):
+        self.codec = codec
+        self.version = version
+        self._header = bytes((version, codec.codec_id))
+
+    def encode(self, value: Any) -> bytes:
+        return self._header + self.codec.encode(value)
+
+    def decode(self, data: bytes) -> Any:
+        if isinstance(data, str):
+            data = data.encode()
+        if data[:2] != self._header:
+            if len(data) < 2 or data[1] not in _CODECS or data[0] < self.version:
+                raise StaleEntryError("cache entry has an older format")
+            raise ForeignEntryError("cache entry has a newer version or codec")
+        return self.codec.decode(memoryview(data)[2:])
+
+
+_CODECS = {codec.codec_id: codec for codec in (JSONCodec, MsgpackCodec)}
+
+
+def get_codec(name: str, version: int) -> VersionedCodec:
+    """Versioned codec by name; raises ValueError for an unknown codec"""
+    for codec in _CODECS.values():
+        if codec.name == name:
+            return VersionedCodec(codec(), version)
+    raise ValueError(f"Unknown cache codec: {name}")